@@ -0,0 +1,8 @@
+# janito.cli.batch_mode package
+from .handler import BatchRunner, RateLimitGate, handle_batch
+
+__all__ = [
+    "BatchRunner",
+    "RateLimitGate",
+    "handle_batch",
+]
@@ -0,0 +1,204 @@
+"""
+Batch mode: ``janito --batch prompts.jsonl --concurrency N``.
+
+Every non-blank input line is an independent conversation. A line is either a JSON
+object with a ``"prompt"`` (and an optional ``"id"``) or a plain JSON string. A pool
+of N headless sessions (see janito.server) works through the file, each prompt
+starting from a fresh history. One JSON line per prompt is appended to the output
+file as soon as it finishes, carrying the input line number, id, status, final text,
+usage and elapsed seconds.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from janito.driver_events import RateLimitRetry
+from janito.event_bus.bus import event_bus
+
+DEFAULT_CONCURRENCY = 4
+
+
+class RateLimitGate:
+    """
+    Holds back new prompts while the provider is rate limiting.
+    Each ``RateLimitRetry`` event keeps the gate closed until at least
+    ``now + retry_delay``; requests already in flight rely on the driver's own retry.
+    """
+
+    def __init__(self, bus=event_bus):
+        self._bus = bus
+        self._lock = threading.Lock()
+        self._open_at = 0.0
+
+    def __enter__(self):
+        self._bus.subscribe(RateLimitRetry, self.on_rate_limit)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._bus.unsubscribe(RateLimitRetry, self.on_rate_limit)
+
+    def on_rate_limit(self, event):
+        self.pause(getattr(event, "retry_delay", 0) or 0)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._open_at = max(self._open_at, time.monotonic() + seconds)
+
+    def wait(self):
+        while True:
+            with self._lock:
+                remaining = self._open_at - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+
+def parse_batch_line(line_number, line):
+    """Turn one input line into a batch item; invalid lines carry an ``error``."""
+    item = {"line": line_number, "id": None}
+    try:
+        payload = json.loads(line)
+    except json.JSONDecodeError as e:
+        item["error"] = f"Invalid JSON: {e}"
+        return item
+    if isinstance(payload, dict):
+        item["id"] = payload.get("id")
+        payload = payload.get("prompt")
+    if not isinstance(payload, str) or not payload.strip():
+        item["error"] = "'prompt' must be a non-empty string"
+        return item
+    item["prompt"] = payload
+    return item
+
+
+def read_batch_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [
+            parse_batch_line(number, line)
+            for number, line in enumerate(f, start=1)
+            if line.strip()
+        ]
+
+
+def default_output_path(path):
+    root, ext = os.path.splitext(path)
+    return f"{root}.out{ext or '.jsonl'}"
+
+
+class BatchRunner:
+    """
+    Runs batch items on up to *concurrency* sessions, one per worker thread.
+    *session_factory* is called lazily by each worker; sessions are reset before
+    every prompt so conversations never share history.
+    """
+
+    def __init__(self, session_factory, concurrency=DEFAULT_CONCURRENCY, gate=None):
+        self.session_factory = session_factory
+        self.concurrency = max(1, int(concurrency or 1))
+        self.gate = gate or RateLimitGate()
+        self.sessions = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.session_factory()
+            self._local.session = session
+            with self._lock:
+                self.sessions.append(session)
+        return session
+
+    def run_item(self, item):
+        record = {"line": item["line"], "id": item.get("id")}
+        if item.get("error"):
+            record.update(status="error", text=None, error=item["error"])
+            return record
+        self.gate.wait()
+        try:
+            session = self._session()
+            session.reset()
+            summary = session.send(item["prompt"])
+        except Exception as e:
+            summary = {
+                "status": "error",
+                "text": None,
+                "error": f"{type(e).__name__}: {e}",
+            }
+        summary.pop("session_id", None)
+        record.update(summary)
+        return record
+
+    def run(self, items, output):
+        """Write a JSON line per item to *output* as it completes; return status counts."""
+        counts = {}
+        with self.gate, ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = [pool.submit(self.run_item, item) for item in items]
+            try:
+                for future in as_completed(futures):
+                    record = future.result()
+                    output.write(json.dumps(record, default=str) + "\n")
+                    output.flush()
+                    counts[record["status"]] = counts.get(record["status"], 0) + 1
+            except KeyboardInterrupt:
+                for future in futures:
+                    future.cancel()
+                self.cancel()
+                raise
+        return counts
+
+    def cancel(self):
+        with self._lock:
+            sessions = list(self.sessions)
+        for session in sessions:
+            session.cancel()
+
+
+def handle_batch(args, provider, provider_instance, llm_driver_config, permissions):
+    from janito.server import SessionManager
+
+    input_path = args.batch
+    output_path = getattr(args, "batch_output", None) or default_output_path(
+        input_path
+    )
+    try:
+        items = read_batch_file(input_path)
+    except OSError as e:
+        print(f"Error: cannot read batch file {input_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    manager = SessionManager(
+        provider=provider,
+        model=getattr(args, "model", None),
+        workdir=getattr(args, "workdir", None),
+        max_permissions=permissions,
+        profile=getattr(args, "profile", None) or "developer",
+        unrestricted=getattr(args, "unrestricted", False),
+    )
+    manager.add_provider(
+        provider, getattr(args, "model", None), provider_instance, llm_driver_config
+    )
+    system_prompt = getattr(args, "system", None)
+    runner = BatchRunner(
+        lambda: manager.create_session(system_prompt=system_prompt),
+        concurrency=getattr(args, "concurrency", None) or DEFAULT_CONCURRENCY,
+    )
+    started = time.time()
+    try:
+        with open(output_path, "w", encoding="utf-8") as output:
+            counts = runner.run(items, output)
+    except KeyboardInterrupt:
+        print("\nBatch interrupted.", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        manager.shutdown()
+    details = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(
+        f"Batch finished: {len(items)} prompts ({details or 'none'}) in "
+        f"{time.time() - started:.1f}s -> {output_path}",
+        file=sys.stderr,
+    )
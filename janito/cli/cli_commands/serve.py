@@ -0,0 +1,152 @@
+"""
+CLI Command: janito serve
+
+Runs janito as a long-lived local service exposing the multi-session JSON API
+from janito.server (see janito/server/http_api.py for the routes).
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+DEFAULT_TOKEN_FILE = Path.home() / ".janito" / "serve.token"
+
+
+def build_serve_parser():
+    parser = argparse.ArgumentParser(
+        prog="janito serve",
+        description="Serve isolated janito sessions over a local HTTP or Unix-socket JSON API.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Bind address (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="TCP port (default: 8765)",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        default=None,
+        help="Listen on this Unix socket instead of TCP",
+    )
+    parser.add_argument(
+        "--token-file",
+        metavar="PATH",
+        default=str(DEFAULT_TOKEN_FILE),
+        help="Write the API bearer token to this file, readable only by you "
+        f"(default: {DEFAULT_TOKEN_FILE})",
+    )
+    parser.add_argument(
+        "-p",
+        "--provider",
+        metavar="PROVIDER",
+        help="Default provider for new sessions",
+    )
+    parser.add_argument(
+        "-m",
+        "--model",
+        metavar="MODEL",
+        help="Default model for new sessions",
+    )
+    parser.add_argument(
+        "-W",
+        "--workdir",
+        metavar="WORKDIR",
+        default=None,
+        help="Default working directory for new sessions",
+    )
+    parser.add_argument(
+        "--profile",
+        default="developer",
+        help="Default system prompt profile",
+    )
+    parser.add_argument(
+        "-r",
+        "--read",
+        action="store_true",
+        help="Allow sessions to use read tools",
+    )
+    parser.add_argument(
+        "-w",
+        "--write",
+        action="store_true",
+        help="Allow sessions to use write tools",
+    )
+    parser.add_argument(
+        "-x",
+        "--exec",
+        action="store_true",
+        help="Allow sessions to use execution tools",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Log every API request",
+    )
+    return parser
+
+
+def write_token_file(path, token):
+    """Write *token* to *path* with owner-only permissions."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token + "\n")
+    os.chmod(path, 0o600)
+
+
+def handle_serve(argv=None):
+    args = build_serve_parser().parse_args(argv)
+
+    import janito.tools  # Ensure all tools are registered
+    from janito.provider_config import get_config_provider
+    from janito.server import SessionManager, create_server
+    from janito.tools.disabled_tools import load_disabled_tools_from_config
+    from janito.tools.permissions import (
+        set_default_allowed_permissions,
+        set_global_allowed_permissions,
+    )
+    from janito.tools.tool_base import ToolPermissions
+
+    provider = args.provider or get_config_provider()
+    if provider is None:
+        print(
+            "Error: No provider selected and no provider found in config. Please set a provider using '-p PROVIDER' or '--set provider=name'."
+        )
+        sys.exit(1)
+    max_permissions = ToolPermissions(
+        read=args.read, write=args.write, execute=args.exec
+    )
+    set_global_allowed_permissions(max_permissions)
+    set_default_allowed_permissions(max_permissions)
+    load_disabled_tools_from_config()
+
+    manager = SessionManager(
+        provider=provider,
+        model=args.model,
+        workdir=args.workdir,
+        max_permissions=max_permissions,
+        profile=args.profile,
+    )
+    server = create_server(
+        manager, host=args.host, port=args.port, socket_path=args.socket
+    )
+    server.verbose = args.verbose
+    write_token_file(args.token_file, server.auth_token)
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"janito serve listening on {where} (provider: {provider})")
+    print(f"API bearer token written to {args.token_file}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        server.server_close()
+        manager.shutdown()
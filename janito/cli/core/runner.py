@@ -149,19 +149,11 @@ def handle_runner(
 
     load_disabled_tools_from_config()
 
-    unrestricted = getattr(args, "unrestricted", False)
     adapter = janito.tools.get_local_tools_adapter(
         workdir=getattr(args, "workdir", None)
     )
-    if unrestricted:
-        # Patch: disable path security enforcement for this adapter instance
-        setattr(adapter, "unrestricted_paths", True)
-
-        # Also disable URL whitelist restrictions in unrestricted mode
-        from janito.tools.url_whitelist import get_url_whitelist_manager
-
-        whitelist_manager = get_url_whitelist_manager()
-        whitelist_manager.set_unrestricted_mode(True)
+    if getattr(args, "unrestricted", False):
+        _apply_unrestricted_mode(adapter)
 
     # Print allowed permissions in verbose mode
     if getattr(args, "verbose", False):
@@ -181,17 +173,14 @@ def handle_runner(
         )
         print_verbose_info("Agent role", agent_role, style="green")
 
-    # Skip chat mode for list commands - handle them directly
-    from janito.cli.core.getters import GETTER_KEYS
-
-    skip_chat_mode = False
-    if args is not None:
-        for key in GETTER_KEYS:
-            if getattr(args, key, False):
-                skip_chat_mode = True
-                break
+    if getattr(args, "batch", None):
+        _run_batch(
+            args, provider, provider_instance, llm_driver_config, allowed_permissions
+        )
+        return
 
-    if skip_chat_mode:
+    # Skip chat mode for list commands - handle them directly
+    if _is_getter_command(args):
         # Handle list commands directly without prompt
         from janito.cli.core.getters import handle_getter
 
@@ -231,5 +220,28 @@ def handle_runner(
         session.run()
 
 
+def _apply_unrestricted_mode(adapter):
+    # Patch: disable path security enforcement for this adapter instance
+    setattr(adapter, "unrestricted_paths", True)
+
+    # Also disable URL whitelist restrictions in unrestricted mode
+    from janito.tools.url_whitelist import get_url_whitelist_manager
+
+    whitelist_manager = get_url_whitelist_manager()
+    whitelist_manager.set_unrestricted_mode(True)
+
+
+def _is_getter_command(args):
+    from janito.cli.core.getters import GETTER_KEYS
+
+    return args is not None and any(getattr(args, key, False) for key in GETTER_KEYS)
+
+
+def _run_batch(args, provider, provider_instance, llm_driver_config, permissions):
+    from janito.cli.batch_mode import handle_batch
+
+    handle_batch(args, provider, provider_instance, llm_driver_config, permissions)
+
+
 def get_prompt_mode(args):
     return "single_shot" if getattr(args, "user_prompt", None) else "chat_mode"
@@ -6,6 +6,12 @@ atexit.register(lambda: sys.stdout.flush())
 
 
 def main():
+    # "janito serve ..." has its own argument set; everything else is the regular CLI
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from janito.cli.cli_commands.serve import handle_serve
+
+        handle_serve(sys.argv[2:])
+        return
     cli = JanitoCLI()
     cli.run()
 
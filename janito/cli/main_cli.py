@@ -51,6 +51,31 @@ definition = [
             "help": "Start with the Market Analyst profile (equivalent to --profile 'Market Analyst')",
         },
     ),
+    (
+        ["--batch"],
+        {
+            "metavar": "FILE",
+            "help": "Run each line of a JSONL file (a prompt string or an object with 'prompt' and optional 'id') as an independent conversation",
+            "default": None,
+        },
+    ),
+    (
+        ["--concurrency"],
+        {
+            "metavar": "N",
+            "type": int,
+            "help": "Number of concurrent conversations in --batch mode (default: 4)",
+            "default": None,
+        },
+    ),
+    (
+        ["--batch-output"],
+        {
+            "metavar": "FILE",
+            "help": "Output JSONL for --batch results (default: <batch file>.out.jsonl)",
+            "default": None,
+        },
+    ),
     (
         ["-W", "--workdir"],
         {
@@ -198,6 +223,13 @@ definition = [
             "help": "Set the reasoning effort for models that support it (low, medium, high, none)",
         },
     ),
+    (
+        ["--stream"],
+        {
+            "action": "store_true",
+            "help": "Stream the model response as it is generated (for drivers that support it)",
+        },
+    ),
     (
         ["--emoji"],
         {
@@ -257,6 +289,7 @@ MODIFIER_KEYS = [
     "read",
     "write",
     "emoji",
+    "stream",
 ]
 SETTER_KEYS = ["set", "set_provider", "set_api_key", "unset"]
 GETTER_KEYS = [
@@ -340,7 +373,12 @@ class JanitoCLI:
                     self.args.user_prompt = [stdin_input]
         from janito.cli.rich_terminal_reporter import RichTerminalReporter
 
-        self.rich_reporter = RichTerminalReporter(raw_mode=self.args.raw)
+        # Batch mode reports through its output file; interleaved streams would be noise
+        self.rich_reporter = (
+            None
+            if self.args.batch
+            else RichTerminalReporter(raw_mode=self.args.raw)
+        )
 
     def _define_args(self):
         for argnames, argkwargs in definition:
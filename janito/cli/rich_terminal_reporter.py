@@ -20,6 +20,9 @@ class RichTerminalReporter(EventHandlerBase):
     - For ResponseReceived events, iterates over the 'parts' field and displays each part appropriately:
         - TextMessagePart: rendered as Markdown (uses 'content' field)
         - Other MessageParts: displayed using Pretty or a suitable Rich representation
+    - For ContentDelta events (streaming drivers), text is written as it arrives; the final
+      ResponseReceived then skips the text parts that were already shown. A StreamRestarted
+      event marks the partial text as abandoned before the retried response is streamed.
     - For RequestFinished events, output is printed only if raw mode is enabled (using Pretty formatting).
     - Report events (info, success, error, etc.) are always printed with appropriate styling.
     """
@@ -35,6 +38,7 @@ class RichTerminalReporter(EventHandlerBase):
 
         super().__init__(driver_events, report_events, tool_events)
         self._waiting_printed = False
+        self._streaming = False
 
     def on_RequestStarted(self, event):
         # Print waiting message with provider and model name
@@ -59,8 +63,32 @@ class RichTerminalReporter(EventHandlerBase):
             f"[bold cyan]Waiting for {provider} (model: {model})...[/bold cyan]", end=""
         )
 
+    def on_ContentDelta(self, event):
+        content = getattr(event, "content", None)
+        if not content:
+            return
+        if not self._streaming:
+            # Replace the "Waiting for ..." line with the streamed text
+            self.delete_current_line()
+            self._streaming = True
+        self.console.print(content, end="", markup=False, highlight=False)
+        self.console.file.flush()
+
+    def on_StreamRestarted(self, event):
+        if not self._streaming:
+            return
+        self.console.print()
+        self.console.print(
+            "[yellow]Response interrupted; retrying, the text above is discarded.[/yellow]"
+        )
+        self._streaming = False
+
     def on_ResponseReceived(self, event):
         parts = event.parts if hasattr(event, "parts") else None
+        metadata = getattr(event, "metadata", None) or {}
+        if metadata.get("streamed"):
+            # Text was already rendered incrementally by on_ContentDelta
+            return
         if not parts:
             self.console.print("[No response parts to display]")
             self.console.file.flush()
@@ -78,7 +106,12 @@ class RichTerminalReporter(EventHandlerBase):
         sys.stdout.flush()
 
     def on_RequestFinished(self, event):
-        self.delete_current_line()
+        if self._streaming:
+            # Terminate the streamed text instead of erasing its last line
+            self.console.print()
+            self._streaming = False
+        else:
+            self.delete_current_line()
         self._waiting_printed = False
         response = getattr(event, "response", None)
         error = getattr(event, "error", None)
@@ -1,30 +1,84 @@
 import json
-from typing import List, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class LLMConversationHistory:
     """
     Stores the conversation history between user and LLM (assistant/system).
     Each message is a dict with keys: 'role', 'content', and optional 'metadata'.
+    'tool_calls' and 'tool_results' messages carry a list of dicts as content.
+
+    Drivers convert the history to their API format through get_api_messages(),
+    which keeps the converted messages per format and, as long as the history is
+    only appended to, converts just the new messages on each call. Any other change
+    (insert, replace, clear, import) bumps ``version`` and drops those caches.
     """
 
     def __init__(self):
         self._history: List[Dict] = []
+        self._version = 0
+        # format key -> (version, number of history messages converted, api messages)
+        self._api_cache: Dict[str, tuple] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _invalidate(self):
+        self._version += 1
+        self._api_cache.clear()
 
-    def add_message(self, role: str, content: str, metadata: Optional[Dict] = None):
+    def add_message(self, role: str, content: Any, metadata: Optional[Dict] = None):
         message = {"role": role, "content": content}
         if metadata:
             message["metadata"] = metadata
         self._history.append(message)
 
+    def insert_message(
+        self, index: int, role: str, content: Any, metadata: Optional[Dict] = None
+    ):
+        message = {"role": role, "content": content}
+        if metadata:
+            message["metadata"] = metadata
+        self._history.insert(index, message)
+        self._invalidate()
+
     def get_history(self) -> List[Dict]:
         return list(self._history)
 
+    def __len__(self):
+        return len(self._history)
+
+    def get_api_messages(
+        self, format_key: str, convert_message: Callable[[Dict], List[Dict]]
+    ) -> List[Dict]:
+        """
+        Return the whole history converted with *convert_message* (one history
+        message -> a list of API messages), reusing earlier conversions for the same
+        *format_key*. Callers get a new list but must not mutate the messages in it.
+        """
+        version, converted, api_messages = self._api_cache.get(
+            format_key, (None, 0, None)
+        )
+        if version != self._version or converted > len(self._history):
+            converted, api_messages = 0, []
+        for message in self._history[converted:]:
+            api_messages.extend(convert_message(message))
+        self._api_cache[format_key] = (self._version, len(self._history), api_messages)
+        return list(api_messages)
+
     def clear(self):
         self._history.clear()
+        self._invalidate()
+
+    def replace_messages(self, messages: List[Dict]):
+        """Replace the whole history, e.g. with a compacted copy."""
+        self._history = list(messages)
+        self._invalidate()
 
     def export_json(self) -> str:
         return json.dumps(self._history, indent=2)
 
     def import_json(self, json_str: str):
         self._history = json.loads(json_str)
+        self._invalidate()
@@ -0,0 +1,103 @@
+"""
+In-memory snapshot of the directory tree, shared by the tools that walk it.
+
+Each directory is listed once with ``os.scandir`` and kept as a compact node: the
+entry names (interned, in scandir order) in a single tuple with the directories
+first, plus the directory's mtime. Adding, removing or renaming an entry changes
+the mtime of its directory, so a later walk only costs one ``stat`` per directory;
+directories whose mtime changed are listed again. A directory modified within the
+last ``RACY_NS`` is re-listed on every walk, since a change in the same timestamp
+tick would otherwise go unnoticed.
+
+``walk`` is a drop-in replacement for ``os.walk`` (top-down, no symlink following,
+unreadable directories skipped, ``dirs`` prunable in place).
+"""
+
+import os
+import sys
+import threading
+import time
+
+RACY_NS = 2 * 1_000_000_000
+MAX_DIRECTORIES = 200_000
+
+_NO_LINKS = frozenset()
+
+
+class DirectorySnapshot:
+    """Cached directory listings keyed by absolute path, refreshed by mtime."""
+
+    def __init__(self, max_directories=MAX_DIRECTORIES):
+        self.max_directories = max_directories
+        self._nodes = {}
+        self._lock = threading.Lock()
+
+    def _scan(self, abspath):
+        dirs, files, links = [], [], []
+        with os.scandir(abspath) as it:
+            for entry in it:
+                name = sys.intern(entry.name)
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(name)
+                    continue
+                dirs.append(name)
+                try:
+                    if entry.is_symlink():
+                        links.append(name)
+                except OSError:
+                    pass
+        return len(dirs), tuple(dirs + files), frozenset(links) or _NO_LINKS
+
+    def _node(self, abspath):
+        """Return (mtime_ns, n_dirs, names, links) for *abspath*; raises OSError."""
+        node = self._nodes.get(abspath)
+        st = os.stat(abspath)
+        if node is not None and node[0] == st.st_mtime_ns:
+            return node
+        n_dirs, names, links = self._scan(abspath)
+        # A change within the same timestamp tick would keep the mtime unchanged
+        racy = time.time_ns() - st.st_mtime_ns < RACY_NS
+        node = (None if racy else st.st_mtime_ns, n_dirs, names, links)
+        with self._lock:
+            if len(self._nodes) >= self.max_directories:
+                self._nodes.clear()
+            self._nodes[abspath] = node
+        return node
+
+    def list_dir(self, path):
+        """Return (dirs, files) for *path*; raises OSError like os.listdir."""
+        _, n_dirs, names, _ = self._node(os.path.abspath(path))
+        return list(names[:n_dirs]), list(names[n_dirs:])
+
+    def walk(self, top):
+        """Yield (dirpath, dirs, files) like os.walk(top)."""
+        stack = [(os.fspath(top), os.path.abspath(top))]
+        while stack:
+            dirpath, abspath = stack.pop()
+            try:
+                _, n_dirs, names, links = self._node(abspath)
+            except OSError:
+                continue
+            dirs = list(names[:n_dirs])
+            yield dirpath, dirs, list(names[n_dirs:])
+            for name in reversed(dirs):
+                if name not in links:
+                    stack.append(
+                        (os.path.join(dirpath, name), os.path.join(abspath, name))
+                    )
+
+    def clear(self):
+        with self._lock:
+            self._nodes.clear()
+
+
+_snapshot = DirectorySnapshot()
+
+
+def get_dir_snapshot():
+    """Return the process-wide DirectorySnapshot."""
+    return _snapshot
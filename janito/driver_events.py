@@ -68,6 +68,37 @@ class ContentPartFound(DriverEvent):
     content_part: Any = None
 
 
+@attr.s(auto_attribs=True, kw_only=True)
+class ContentDelta(DriverEvent):
+    """Emitted by a streaming driver for each incremental chunk of assistant text.
+    The complete response is still delivered afterwards as a ResponseReceived event.
+    """
+
+    content: str = ""
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class StreamRestarted(DriverEvent):
+    """Emitted by a streaming driver before it retries a request whose stream failed.
+    ContentDelta/ToolCallDelta events received so far belong to the failed attempt
+    and are superseded by the deltas that follow.
+    """
+
+    attempt: int = 0  # Number of the attempt about to start
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class ToolCallDelta(DriverEvent):
+    """Emitted by a streaming driver when a chunk of a tool call arrives.
+    ``arguments_delta`` holds the newly received fragment of the JSON arguments.
+    """
+
+    index: int = 0
+    tool_call_id: str = None
+    name: str = None
+    arguments_delta: str = ""
+
+
 @attr.s(auto_attribs=True, kw_only=True)
 class ToolCallStarted(DriverEvent):
     tool_call_id: str = None
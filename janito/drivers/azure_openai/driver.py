@@ -3,6 +3,7 @@ from janito.drivers.openai.driver import OpenAIModelDriver
 from openai import AzureOpenAI
 
 from janito.llm.driver_config import LLMDriverConfig
+from janito.llm.client_pool import client_pool, build_openai_http_client
 
 
 class AzureOpenAIModelDriver(OpenAIModelDriver):
@@ -57,11 +58,10 @@ class AzureOpenAIModelDriver(OpenAIModelDriver):
         if self.tools_adapter:
             try:
                 from janito.providers.openai.schema_generator import (
-                    generate_tool_schemas,
+                    get_tool_schemas,
                 )
 
-                tool_classes = self.tools_adapter.get_tool_classes()
-                tool_schemas = generate_tool_schemas(tool_classes)
+                tool_schemas = get_tool_schemas(self.tools_adapter)
                 api_kwargs["tools"] = tool_schemas
             except Exception as e:
                 api_kwargs["tools"] = []
@@ -90,7 +90,13 @@ class AzureOpenAIModelDriver(OpenAIModelDriver):
                 "api_version": config.extra.get("api_version", "2023-05-15"),
             }
             # Do NOT pass azure_deployment; deployment name is used as the 'model' param in API calls
-            client = AzureOpenAI(**client_kwargs)
+            client = client_pool.get_client(
+                "azure_openai",
+                lambda: self._create_azure_client(client_kwargs),
+                base_url=client_kwargs["azure_endpoint"],
+                api_key=config.api_key,
+                api_version=client_kwargs["api_version"],
+            )
             return client
         except Exception as e:
             print(
@@ -101,3 +107,17 @@ class AzureOpenAIModelDriver(OpenAIModelDriver):
 
             print(traceback.format_exc(), flush=True)
             raise
+
+    def _discard_client(self, config):
+        client_pool.discard(
+            "azure_openai",
+            base_url=getattr(config, "base_url", None),
+            api_key=config.api_key,
+            api_version=config.extra.get("api_version", "2023-05-15"),
+        )
+
+    def _create_azure_client(self, client_kwargs):
+        http_client = build_openai_http_client()
+        if http_client is not None:
+            client_kwargs = dict(client_kwargs, http_client=http_client)
+        return AzureOpenAI(**client_kwargs)
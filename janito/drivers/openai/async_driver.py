@@ -0,0 +1,103 @@
+import asyncio
+
+import openai
+
+from janito.llm.async_driver import AsyncLLMDriver
+from janito.llm.client_pool import client_pool, build_openai_http_client
+from janito.llm.driver_input import DriverInput
+from janito.drivers.openai.driver import OpenAIModelDriver
+
+
+class AsyncOpenAIModelDriver(AsyncLLMDriver, OpenAIModelDriver):
+    """
+    OpenAI driver built on ``openai.AsyncOpenAI``. Request preparation, streaming
+    accumulation, retry policy and event emission are shared with OpenAIModelDriver.
+    """
+
+    async def _acall_api(self, driver_input: DriverInput):
+        """Await the OpenAI-compatible chat completion endpoint with retry and error handling."""
+        cancel_event = getattr(driver_input, "cancel_event", None)
+        config = driver_input.config
+        conversation = self.convert_history_to_api_messages(
+            driver_input.conversation_history
+        )
+        request_id = self.get_request_id(driver_input)
+        self._print_api_call_start(config)
+        client = self._instantiate_async_openai_client(config)
+        api_kwargs = self._prepare_api_kwargs(config, conversation)
+        max_retries = getattr(config, "max_retries", 3)
+        attempt = 1
+        while True:
+            try:
+                self._print_api_attempt(config, attempt, max_retries, api_kwargs)
+                if self._check_cancel(cancel_event, request_id, before_call=True):
+                    return None
+                result = await client.chat.completions.create(**api_kwargs)
+                if api_kwargs.get("stream"):
+                    result = await self._aconsume_stream(
+                        result, request_id, cancel_event
+                    )
+                if self._check_cancel(cancel_event, request_id, before_call=False):
+                    return None
+                self._handle_api_success(config, result, request_id)
+                return result
+            except Exception as e:
+                retry_delay = self._prepare_rate_limit_retry(
+                    e, config, api_kwargs, attempt, max_retries, request_id
+                )
+                if not await self._await_retry(retry_delay, cancel_event, request_id):
+                    raise
+                attempt += 1
+                self._mark_stream_restarted(api_kwargs, request_id, attempt)
+
+    async def _await_retry(self, retry_delay, cancel_event, request_id):
+        """Sleep for *retry_delay* seconds without blocking the loop; False if cancelled meanwhile."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + retry_delay
+        while loop.time() < deadline:
+            if self._check_cancel(cancel_event, request_id, before_call=False):
+                return False
+            await asyncio.sleep(min(0.1, deadline - loop.time()))
+        return True
+
+    async def _aconsume_stream(self, stream, request_id, cancel_event=None):
+        """Async variant of _consume_stream: emits deltas as chunks arrive."""
+        state = self._new_stream_state()
+        async for chunk in stream:
+            if cancel_event is not None and cancel_event.is_set():
+                close = getattr(stream, "close", None)
+                if callable(close):
+                    await close()
+                break
+            self._consume_stream_chunk(state, chunk, request_id)
+        return self._build_streamed_result(
+            state["content"],
+            state["tool_calls"],
+            state["finish_reason"],
+            state["summary"],
+        )
+
+    def _instantiate_async_openai_client(self, config):
+        client_kwargs = self._build_client_kwargs(config)
+        # Async HTTP clients are bound to the loop they were first used on
+        return client_pool.get_loop_client(
+            "openai_async",
+            lambda: self._create_async_openai_client(client_kwargs),
+            asyncio.get_running_loop(),
+            base_url=client_kwargs.get("base_url"),
+            api_key=config.api_key,
+        )
+
+    def _discard_client(self, config):
+        client_pool.discard(
+            "openai_async",
+            base_url=getattr(config, "base_url", None) or None,
+            api_key=config.api_key,
+            loop=asyncio.get_running_loop(),
+        )
+
+    def _create_async_openai_client(self, client_kwargs):
+        http_client = build_openai_http_client(asynchronous=True)
+        if http_client is not None:
+            client_kwargs = dict(client_kwargs, http_client=http_client)
+        return openai.AsyncOpenAI(**client_kwargs)
@@ -6,11 +6,18 @@ import math
 import time
 import os
 import logging
+from types import SimpleNamespace
 from rich import pretty
 from janito.llm.driver import LLMDriver
 from janito.llm.driver_input import DriverInput
-from janito.driver_events import RequestFinished, RequestStatus, RateLimitRetry
+from janito.driver_events import (
+    RequestFinished,
+    RequestStatus,
+    RateLimitRetry,
+    StreamRestarted,
+)
 from janito.llm.message_parts import TextMessagePart, FunctionCallMessagePart
+from janito.llm.client_pool import client_pool, build_openai_http_client
 
 import openai
 
@@ -26,6 +33,8 @@ class OpenAIModelDriver(LLMDriver):
         available = False
         unavailable_reason = f"Missing dependency: {str(e)}"
 
+    supports_streaming = True
+
     def _get_message_from_result(self, result):
         """Extract the message object from the provider result (OpenAI-specific)."""
         if hasattr(result, "choices") and result.choices:
@@ -49,11 +58,10 @@ class OpenAIModelDriver(LLMDriver):
         if self.tools_adapter:
             try:
                 from janito.providers.openai.schema_generator import (
-                    generate_tool_schemas,
+                    get_tool_schemas,
                 )
 
-                tool_classes = self.tools_adapter.get_tool_classes()
-                tool_schemas = generate_tool_schemas(tool_classes)
+                tool_schemas = get_tool_schemas(self.tools_adapter)
                 if tool_schemas:  # Only add tools if we have actual schemas
                     api_kwargs["tools"] = tool_schemas
             except Exception as e:
@@ -90,11 +98,18 @@ class OpenAIModelDriver(LLMDriver):
             if v is not None:
                 api_kwargs[p] = v
         api_kwargs["messages"] = conversation
-        api_kwargs["stream"] = False
+        self._apply_stream_options(api_kwargs, config, is_mistral)
         # Always return the prepared kwargs, even if no tools are registered. The
         # OpenAI Python SDK expects a **mapping** – passing *None* will raise
         # ``TypeError: argument after ** must be a mapping, not NoneType``.
         return api_kwargs
+
+    def _apply_stream_options(self, api_kwargs, config, is_mistral):
+        api_kwargs["stream"] = self.is_streaming(config)
+        if api_kwargs["stream"] and not is_mistral:
+            # Ask for a final usage chunk so token accounting keeps working
+            api_kwargs["stream_options"] = {"include_usage": True}
+
     #执行大模型请求 openai 的实现类，不同的模型有不同的实现类
     def _call_api(self, driver_input: DriverInput):
         """Call the OpenAI-compatible chat completion endpoint with retry and error handling."""
@@ -103,7 +118,7 @@ class OpenAIModelDriver(LLMDriver):
         conversation = self.convert_history_to_api_messages( # 转换成 大模型调用的消息 
             driver_input.conversation_history
         )
-        request_id = getattr(config, "request_id", None)
+        request_id = self.get_request_id(driver_input)
         self._print_api_call_start(config)
         client = self._instantiate_openai_client(config) # 初始化调用端
         api_kwargs = self._prepare_api_kwargs(config, conversation)
@@ -115,6 +130,10 @@ class OpenAIModelDriver(LLMDriver):
                 if self._check_cancel(cancel_event, request_id, before_call=True):
                     return None
                 result = client.chat.completions.create(**api_kwargs) # 执行行大模型调用
+                if api_kwargs.get("stream"):
+                    result = self._consume_stream(
+                        result, config, request_id, cancel_event
+                    )
                 if self._check_cancel(cancel_event, request_id, before_call=False):
                     return None
                 self._handle_api_success(config, result, request_id) # 处理请求结果
@@ -124,9 +143,133 @@ class OpenAIModelDriver(LLMDriver):
                     e, config, api_kwargs, attempt, max_retries, request_id
                 ):
                     attempt += 1
+                    self._mark_stream_restarted(api_kwargs, request_id, attempt)
                     continue
                 raise
 
+    def _mark_stream_restarted(self, api_kwargs, request_id, attempt):
+        if api_kwargs.get("stream"):
+            # Deltas already emitted belong to the failed attempt
+            self._emit(
+                StreamRestarted(
+                    driver_name=self.__class__.__name__,
+                    request_id=request_id,
+                    attempt=attempt,
+                )
+            )
+
+    def _consume_stream(self, stream, config, request_id, cancel_event=None):
+        """Drain a streaming chat completion.
+
+        Emits a ContentDelta for every text fragment and a ToolCallDelta for every
+        tool-call fragment as soon as they arrive, while rebuilding the tool-call
+        arguments. Returns a completion-shaped object so the rest of the pipeline
+        (usage extraction, part conversion) is unchanged.
+        """
+        state = self._new_stream_state()
+        for chunk in stream:
+            if cancel_event is not None and cancel_event.is_set():
+                close = getattr(stream, "close", None)
+                if callable(close):
+                    close()
+                break
+            self._consume_stream_chunk(state, chunk, request_id)
+        return self._build_streamed_result(
+            state["content"],
+            state["tool_calls"],
+            state["finish_reason"],
+            state["summary"],
+        )
+
+    @staticmethod
+    def _new_stream_state():
+        return {
+            "content": [],
+            "tool_calls": {},  # index -> {"id", "name", "arguments" (list of fragments)}
+            "summary": {"id": None, "model": None, "created": None, "usage": None},
+            "finish_reason": None,
+        }
+
+    def _consume_stream_chunk(self, state, chunk, request_id):
+        """Fold one streamed chunk into *state*, emitting the matching delta events."""
+        for key in ("id", "model", "created", "usage"):
+            value = getattr(chunk, key, None)
+            if value is not None:
+                state["summary"][key] = value
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            return
+        choice = choices[0]
+        state["finish_reason"] = (
+            getattr(choice, "finish_reason", None) or state["finish_reason"]
+        )
+        delta = getattr(choice, "delta", None)
+        if delta is None:
+            return
+        text = getattr(delta, "content", None)
+        if text:
+            state["content"].append(text)
+            self.emit_content_delta(self.__class__.__name__, request_id, text)
+        for tool_call_delta in getattr(delta, "tool_calls", None) or []:
+            self._accumulate_tool_call_delta(
+                state["tool_calls"], tool_call_delta, request_id
+            )
+
+    def _accumulate_tool_call_delta(self, tool_calls, tool_call_delta, request_id):
+        index = getattr(tool_call_delta, "index", None)
+        if index is None:
+            index = len(tool_calls)
+        entry = tool_calls.setdefault(
+            index, {"id": None, "name": None, "arguments": []}
+        )
+        tool_call_id = getattr(tool_call_delta, "id", None)
+        if tool_call_id:
+            entry["id"] = tool_call_id
+        function = getattr(tool_call_delta, "function", None)
+        name = getattr(function, "name", None) if function is not None else None
+        if name:
+            entry["name"] = name
+        arguments = (
+            getattr(function, "arguments", None) if function is not None else None
+        )
+        if arguments:
+            entry["arguments"].append(arguments)
+        self.emit_tool_call_delta(
+            self.__class__.__name__,
+            request_id,
+            index,
+            entry["id"],
+            entry["name"],
+            arguments,
+        )
+
+    def _build_streamed_result(self, content_chunks, tool_calls, finish_reason, summary):
+        message = SimpleNamespace(
+            role="assistant",
+            content="".join(content_chunks) or None,
+            tool_calls=[
+                SimpleNamespace(
+                    id=entry["id"] or "",
+                    type="function",
+                    function=SimpleNamespace(
+                        name=entry["name"] or "",
+                        arguments="".join(entry["arguments"]),
+                    ),
+                )
+                for _, entry in sorted(tool_calls.items())
+            ]
+            or None,
+        )
+        return SimpleNamespace(
+            id=summary["id"],
+            model=summary["model"],
+            created=summary["created"],
+            usage=summary["usage"],
+            choices=[
+                SimpleNamespace(index=0, message=message, finish_reason=finish_reason)
+            ],
+        )
+
     def _print_api_call_start(self, config):
         if getattr(config, "verbose_api", False):
             tool_adapter_name = (
@@ -158,7 +301,7 @@ class OpenAIModelDriver(LLMDriver):
                 f"[OpenAI][DEBUG] Attaching usage info to RequestFinished: {usage_dict}",
                 flush=True,
             )
-        self.output_queue.put( # 相应结果放入队列中
+        self._emit( # 相应结果放入队列中
             RequestFinished(
                 driver_name=self.__class__.__name__,
                 request_id=request_id,
@@ -175,6 +318,22 @@ class OpenAIModelDriver(LLMDriver):
     def _handle_api_exception(
         self, e, config, api_kwargs, attempt, max_retries, request_id
     ):
+        retry_delay = self._prepare_rate_limit_retry(
+            e, config, api_kwargs, attempt, max_retries, request_id
+        )
+        start_wait = time.time()
+        while time.time() - start_wait < retry_delay:
+            if self._check_cancel(
+                getattr(config, "cancel_event", None), request_id, before_call=False
+            ):
+                return False
+            time.sleep(0.1)
+        return True
+
+    def _prepare_rate_limit_retry(
+        self, e, config, api_kwargs, attempt, max_retries, request_id
+    ):
+        """Re-raise *e* unless it is a retryable rate limit; otherwise emit RateLimitRetry and return the delay."""
         status_code = getattr(e, "status_code", None)
         err_str = str(e)
         lower_err = err_str.lower()
@@ -192,7 +351,7 @@ class OpenAIModelDriver(LLMDriver):
         retry_delay = self._extract_retry_delay_seconds(e)
         if retry_delay is None:
             retry_delay = min(2 ** (attempt - 1), 30)
-        self.output_queue.put(
+        self._emit(
             RateLimitRetry(
                 driver_name=self.__class__.__name__,
                 request_id=request_id,
@@ -207,14 +366,7 @@ class OpenAIModelDriver(LLMDriver):
                 f"[OpenAI][RateLimit] Attempt {attempt}/{max_retries} failed with rate-limit. Waiting {retry_delay}s before retry.",
                 flush=True,
             )
-        start_wait = time.time()
-        while time.time() - start_wait < retry_delay:
-            if self._check_cancel(
-                getattr(config, "cancel_event", None), request_id, before_call=False
-            ):
-                return False
-            time.sleep(0.1)
-        return True
+        return retry_delay
 
     def _extract_retry_delay_seconds(self, exception) -> float | None:
         """Extract the retry delay in seconds from the provider error response.
@@ -259,41 +411,28 @@ class OpenAIModelDriver(LLMDriver):
             )
             print("[ERROR] Full stack trace:", flush=True)
             print(traceback.format_exc(), flush=True)
+        if isinstance(e, (openai.AuthenticationError, openai.APIConnectionError)):
+            # Do not hand the rejected key or broken connections to the next request
+            self._discard_client(config)
         raise
 
+    def _discard_client(self, config):
+        client_pool.discard(
+            "openai",
+            base_url=getattr(config, "base_url", None) or None,
+            api_key=config.api_key,
+        )
+
     def _instantiate_openai_client(self, config):
         try:
-            if not config.api_key:
-                provider_name = getattr(self, "provider_name", "OpenAI-compatible")
-                from janito.llm.auth_utils import handle_missing_api_key
-
-                handle_missing_api_key(
-                    provider_name, f"{provider_name.upper()}_API_KEY"
-                )
-
-            api_key_display = str(config.api_key)
-            if api_key_display and len(api_key_display) > 8:
-                api_key_display = api_key_display[:4] + "..." + api_key_display[-4:]
-            client_kwargs = {"api_key": config.api_key}
-            if getattr(config, "base_url", None):
-                client_kwargs["base_url"] = config.base_url
-
-            # HTTP debug wrapper
-            if os.environ.get("OPENAI_DEBUG_HTTP", "0") == "1":
-                from http.client import HTTPConnection
-
-                HTTPConnection.debuglevel = 1
-                logging.basicConfig()
-                logging.getLogger().setLevel(logging.DEBUG)
-                requests_log = logging.getLogger("http.client")
-                requests_log.setLevel(logging.DEBUG)
-                requests_log.propagate = True
-                print(
-                    "[OpenAIModelDriver] HTTP debug enabled via OPENAI_DEBUG_HTTP=1",
-                    flush=True,
-                )
-
-            client = openai.OpenAI(**client_kwargs)
+            client_kwargs = self._build_client_kwargs(config)
+            # Reuse one client (and its keep-alive connection pool) per endpoint/key
+            client = client_pool.get_client(
+                "openai",
+                lambda: self._create_openai_client(client_kwargs),
+                base_url=client_kwargs.get("base_url"),
+                api_key=config.api_key,
+            )
             return client
         except Exception as e:
             print(
@@ -302,6 +441,45 @@ class OpenAIModelDriver(LLMDriver):
             print(traceback.format_exc(), flush=True)
             raise
 
+    def _build_client_kwargs(self, config):
+        """Return the OpenAI client constructor kwargs for *config* (api_key, base_url)."""
+        if not config.api_key:
+            provider_name = getattr(self, "provider_name", "OpenAI-compatible")
+            from janito.llm.auth_utils import handle_missing_api_key
+
+            handle_missing_api_key(
+                provider_name, f"{provider_name.upper()}_API_KEY"
+            )
+
+        api_key_display = str(config.api_key)
+        if api_key_display and len(api_key_display) > 8:
+            api_key_display = api_key_display[:4] + "..." + api_key_display[-4:]
+        client_kwargs = {"api_key": config.api_key}
+        if getattr(config, "base_url", None):
+            client_kwargs["base_url"] = config.base_url
+
+        # HTTP debug wrapper
+        if os.environ.get("OPENAI_DEBUG_HTTP", "0") == "1":
+            from http.client import HTTPConnection
+
+            HTTPConnection.debuglevel = 1
+            logging.basicConfig()
+            logging.getLogger().setLevel(logging.DEBUG)
+            requests_log = logging.getLogger("http.client")
+            requests_log.setLevel(logging.DEBUG)
+            requests_log.propagate = True
+            print(
+                "[OpenAIModelDriver] HTTP debug enabled via OPENAI_DEBUG_HTTP=1",
+                flush=True,
+            )
+        return client_kwargs
+
+    def _create_openai_client(self, client_kwargs):
+        http_client = build_openai_http_client()
+        if http_client is not None:
+            client_kwargs = dict(client_kwargs, http_client=http_client)
+        return openai.OpenAI(**client_kwargs)
+
     def _check_cancel(self, cancel_event, request_id, before_call=True):
         if cancel_event is not None and cancel_event.is_set():
             status = RequestStatus.CANCELLED
@@ -310,7 +488,7 @@ class OpenAIModelDriver(LLMDriver):
                 if before_call
                 else "Cancelled during API call"
             )
-            self.output_queue.put(
+            self._emit(
                 RequestFinished(
                     driver_name=self.__class__.__name__,
                     request_id=request_id,
@@ -389,10 +567,16 @@ class OpenAIModelDriver(LLMDriver):
         """
         Convert LLMConversationHistory to the list of dicts required by OpenAI's API.
         Handles 'tool_results' and 'tool_calls' roles for compliance.
+        Converted messages are cached by the history; only new messages are converted.
         """
+        return conversation_history.get_api_messages(
+            "openai", self._convert_history_message
+        )
+
+    def _convert_history_message(self, msg):
+        """Convert one history message to the API messages it stands for."""
         api_messages = []
-        for msg in conversation_history.get_history():
-            self._append_api_message(api_messages, msg)
+        self._append_api_message(api_messages, msg)
         self._replace_none_content(api_messages)
         return api_messages
 
@@ -448,7 +632,8 @@ class OpenAIModelDriver(LLMDriver):
                 name = metadata.get("name", "") if isinstance(metadata, dict) else ""
             api_messages.append({"role": "tool", "content": content, "name": name})
         else:
-            api_messages.append(msg)
+            # Copy without janito's metadata: cached API messages must not alias history
+            api_messages.append({k: v for k, v in msg.items() if k != "metadata"})
 
     def _replace_none_content(self, api_messages):
         for m in api_messages:
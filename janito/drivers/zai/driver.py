@@ -11,6 +11,7 @@ from janito.llm.driver import LLMDriver
 from janito.llm.driver_input import DriverInput
 from janito.driver_events import RequestFinished, RequestStatus, RateLimitRetry
 from janito.llm.message_parts import TextMessagePart, FunctionCallMessagePart
+from janito.llm.client_pool import client_pool
 
 import openai
 
@@ -49,11 +50,10 @@ class ZAIModelDriver(LLMDriver):
         if self.tools_adapter:
             try:
                 from janito.providers.zai.schema_generator import (
-                    generate_tool_schemas,
+                    get_tool_schemas,
                 )
 
-                tool_classes = self.tools_adapter.get_tool_classes()
-                tool_schemas = generate_tool_schemas(tool_classes)
+                tool_schemas = get_tool_schemas(self.tools_adapter)
                 api_kwargs["tools"] = tool_schemas
             except Exception as e:
                 api_kwargs["tools"] = []
@@ -96,7 +96,7 @@ class ZAIModelDriver(LLMDriver):
         conversation = self.convert_history_to_api_messages(
             driver_input.conversation_history
         )
-        request_id = getattr(config, "request_id", None)
+        request_id = self.get_request_id(driver_input)
         self._print_api_call_start(config)
         client = self._instantiate_zai_client(config)
         api_kwargs = self._prepare_api_kwargs(config, conversation)
@@ -286,8 +286,12 @@ class ZAIModelDriver(LLMDriver):
             # Use the official Z.ai SDK
             from zai import ZaiClient
 
-            client = ZaiClient(
-                api_key=config.api_key, base_url="https://api.z.ai/api/paas/v4/"
+            base_url = "https://api.z.ai/api/paas/v4/"
+            client = client_pool.get_client(
+                "zai",
+                lambda: ZaiClient(api_key=config.api_key, base_url=base_url),
+                base_url=base_url,
+                api_key=config.api_key,
             )
             return client
         except Exception as e:
@@ -384,10 +388,16 @@ class ZAIModelDriver(LLMDriver):
         """
         Convert LLMConversationHistory to the list of dicts required by Z.AI's API.
         Handles 'tool_results' and 'tool_calls' roles for compliance.
+        Converted messages are cached by the history; only new messages are converted.
         """
+        return conversation_history.get_api_messages(
+            "zai", self._convert_history_message
+        )
+
+    def _convert_history_message(self, msg):
+        """Convert one history message to the API messages it stands for."""
         api_messages = []
-        for msg in conversation_history.get_history():
-            self._append_api_message(api_messages, msg)
+        self._append_api_message(api_messages, msg)
         self._replace_none_content(api_messages)
         return api_messages
 
@@ -443,7 +453,8 @@ class ZAIModelDriver(LLMDriver):
                 name = metadata.get("name", "") if isinstance(metadata, dict) else ""
             api_messages.append({"role": "tool", "content": content, "name": name})
         else:
-            api_messages.append(msg)
+            # Copy without janito's metadata: cached API messages must not alias history
+            api_messages.append({k: v for k, v in msg.items() if k != "metadata"})
 
     def _replace_none_content(self, api_messages):
         for m in api_messages:
@@ -1,18 +1,230 @@
 import os
+import re
+import threading
+
 import pathspec
 
+IGNORE_FILE = ".gitignore"
+EXCLUDE_FILE = os.path.join(".git", "info", "exclude")
+
+
+def find_ignore_root(start_path):
+    """
+    Return the directory ignore rules are resolved against for start_path: the
+    enclosing git work tree, else the directory of the nearest .gitignore above it,
+    else the directory of start_path itself.
+    """
+    start_dir = os.path.abspath(start_path)
+    if not os.path.isdir(start_dir):
+        start_dir = os.path.dirname(start_dir)
+    current = start_dir
+    nearest = None
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        if nearest is None and os.path.isfile(os.path.join(current, IGNORE_FILE)):
+            nearest = current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return nearest or start_dir
+        current = parent
+
+
+class IgnoreSpec:
+    """
+    The compiled patterns of one ignore file.
+
+    All patterns are folded into a single regex, listed last-to-first so that the
+    alternative that matches is the one git would apply (the last matching pattern
+    wins). Each alternative is a named group; ``lastgroup`` tells which one it was.
+    """
+
+    def __init__(self, lines):
+        patterns = [
+            pattern
+            for pattern in pathspec.PathSpec.from_lines("gitwildmatch", lines).patterns
+            if pattern.include is not None
+        ]
+        self._include = {}
+        alternatives = []
+        for i, pattern in enumerate(reversed(patterns)):
+            name = f"p{i}"
+            self._include[name] = pattern.include
+            body = pattern.regex.pattern.replace("(?P<ps_d>", "(?:")
+            alternatives.append(f"(?P<{name}>{body})")
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def __bool__(self):
+        return self._regex is not None
+
+    def check(self, rel_path):
+        """True (ignored), False (re-included by a negation) or None (no match)."""
+        if self._regex is None:
+            return None
+        match = self._regex.match(rel_path)
+        return None if match is None else self._include[match.lastgroup]
+
+
+class GitignoreEngine:
+    """
+    Process-wide cache of compiled ignore files. Each file is compiled once and
+    recompiled only when its mtime or size changes, so repeated walks of the same
+    tree only pay for a stat per ignore file.
+    """
+
+    def __init__(self):
+        self._specs = {}
+        self._lock = threading.Lock()
+
+    def load(self, path):
+        """Return the IgnoreSpec of the ignore file at *path* (None if no rules)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._specs.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                spec = IgnoreSpec(f.read().splitlines()) or None
+        except (OSError, ValueError):
+            spec = None
+        with self._lock:
+            self._specs[path] = (stamp, spec)
+        return spec
+
+    def matcher(self, start_path):
+        """Return a GitignoreMatcher for the tree containing start_path."""
+        return GitignoreMatcher(find_ignore_root(start_path), self)
+
+    def clear(self):
+        with self._lock:
+            self._specs.clear()
+
+
+class GitignoreMatcher:
+    """
+    Applies the ignore files of one tree: ``.git/info/exclude``, the root
+    ``.gitignore`` and every nested ``.gitignore``, deeper files taking precedence.
+
+    For each directory the matcher keeps the chain of specs that apply to its
+    entries together with the directory's path relative to each spec, so matching
+    an entry is a string concatenation and one regex match per spec. Matchers are
+    cheap; create one per walk.
+    """
+
+    def __init__(self, root, engine):
+        self.root = root
+        self._engine = engine
+        self._chains = {}
+        self._ignored_dirs = {}
+
+    def _rel(self, path):
+        """Return the '/'-separated path of *path* below root ('' for root itself)."""
+        try:
+            rel = os.path.relpath(os.path.abspath(path), self.root)
+        except ValueError:  # different drive on Windows
+            return None
+        if rel == os.curdir:
+            return ""
+        if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+            return None
+        return rel.replace(os.sep, "/")
+
+    def _chain(self, rel_dir, has_ignore_file=None):
+        """(spec, prefix) pairs for the entries of rel_dir, deepest spec first."""
+        chain = self._chains.get(rel_dir)
+        if chain is not None:
+            return chain
+        if rel_dir == "":
+            exclude = self._engine.load(os.path.join(self.root, EXCLUDE_FILE))
+            inherited = [(exclude, "")] if exclude else []
+        else:
+            parent, _, name = rel_dir.rpartition("/")
+            inherited = [
+                (spec, prefix + name + "/") for spec, prefix in self._chain(parent)
+            ]
+        own = None
+        if has_ignore_file is not False:
+            own = self._engine.load(os.path.join(self.root, rel_dir, IGNORE_FILE))
+        chain = [(own, "")] + inherited if own else inherited
+        self._chains[rel_dir] = chain
+        return chain
+
+    @staticmethod
+    def _check(chain, name, is_dir):
+        if is_dir:
+            name += "/"
+        for spec, prefix in chain:
+            result = spec.check(prefix + name)
+            if result is not None:
+                return result
+        return False
+
+    def _dir_ignored(self, rel_dir):
+        if rel_dir == "":
+            return False
+        ignored = self._ignored_dirs.get(rel_dir)
+        if ignored is None:
+            parent, _, name = rel_dir.rpartition("/")
+            ignored = (
+                name == ".git"
+                or self._dir_ignored(parent)
+                or self._check(self._chain(parent), name, True)
+            )
+            self._ignored_dirs[rel_dir] = ignored
+        return ignored
+
+    def is_ignored(self, path, is_dir=None):
+        """Return True if *path* or one of its parent directories is ignored."""
+        rel = self._rel(path)
+        if not rel:
+            return False
+        if is_dir is None:
+            is_dir = os.path.isdir(path)
+        parent, _, name = rel.rpartition("/")
+        if self._dir_ignored(parent):
+            return True
+        return self._check(self._chain(parent), name, is_dir)
+
+    def filter(self, dirpath, dirs, files):
+        """
+        Drop the ignored entries of one walked directory (dirs is pruned in place,
+        as os.walk expects). The .git directory is always dropped.
+        """
+        rel_dir = self._rel(dirpath)
+        chain = [] if rel_dir is None else self._chain(rel_dir, IGNORE_FILE in files)
+        dirs[:] = [d for d in dirs if d != ".git" and not self._check(chain, d, True)]
+        if chain:
+            files = [f for f in files if not self._check(chain, f, False)]
+        return dirs, files
+
+
+_engine = GitignoreEngine()
+
+
+def get_gitignore_engine():
+    """Return the process-wide GitignoreEngine."""
+    return _engine
+
 
 class GitignoreFilter:
     """
     Utility class for loading, interpreting, and applying .gitignore patterns to file and directory paths.
 
+    Rules come from the enclosing git work tree (or the nearest .gitignore when there
+    is none): .git/info/exclude, the root .gitignore and nested .gitignore files.
+    Compiled files are shared process-wide through GitignoreEngine.
+
     Methods
     -------
     __init__(self, gitignore_path: str = ".gitignore")
-        Loads and parses .gitignore patterns from the specified path or finds the nearest .gitignore if a directory is given.
+        Resolves the tree for the given .gitignore path or directory.
 
     is_ignored(self, path: str) -> bool
-        Returns True if the given path matches any of the loaded .gitignore patterns.
+        Returns True if the given path (or one of its parent directories) is ignored.
 
     filter_ignored(self, root: str, dirs: list, files: list) -> tuple[list, list]
         Filters out ignored directories and files from the provided lists, returning only those not ignored.
@@ -38,55 +250,22 @@ class GitignoreFilter:
             current_dir = parent
 
     def __init__(self, gitignore_path: str = ".gitignore"):
-        # If a directory is passed, find the nearest .gitignore up the tree
         if os.path.isdir(gitignore_path):
             self.gitignore_path = self.find_nearest_gitignore(gitignore_path)
+            start_path = gitignore_path
         else:
             self.gitignore_path = os.path.abspath(gitignore_path)
-        self.base_dir = os.path.dirname(self.gitignore_path)
-        lines = []
-        if not os.path.exists(self.gitignore_path):
-            self._spec = pathspec.PathSpec.from_lines("gitwildmatch", [])
-        else:
-            with open(
-                self.gitignore_path, "r", encoding="utf-8", errors="replace"
-            ) as f:
-                lines = f.readlines()
-            self._spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
-        # Collect directory patterns (ending with /)
-        self.dir_patterns = [
-            line.strip() for line in lines if line.strip().endswith("/")
-        ]
+            start_path = os.path.dirname(self.gitignore_path)
+        self._matcher = get_gitignore_engine().matcher(start_path)
+        self.base_dir = self._matcher.root
 
     def is_ignored(self, path: str) -> bool:
-        """Return True if the given path is ignored by the loaded .gitignore patterns."""
-        abs_path = os.path.abspath(path)
-        rel_path = os.path.relpath(abs_path, self.base_dir).replace(os.sep, "/")
-        return self._spec.match_file(rel_path)
+        """Return True if the given path is ignored by the applicable ignore files."""
+        return self._matcher.is_ignored(path)
 
     def filter_ignored(self, root: str, dirs: list, files: list) -> tuple[list, list]:
         """
         Filter out ignored directories and files from the provided lists.
         Always ignores the .git directory (like git does).
         """
-
-        def dir_is_ignored(d):
-            abs_path = os.path.abspath(os.path.join(root, d))
-            rel_path = os.path.relpath(abs_path, self.base_dir).replace(os.sep, "/")
-            if rel_path == ".git" or rel_path.startswith(".git/"):
-                return True
-            # Remove directory if it matches a directory pattern
-            for pat in self.dir_patterns:
-                pat_clean = pat.rstrip("/")
-                if rel_path == pat_clean or rel_path.startswith(pat_clean + "/"):
-                    return True
-            return self._spec.match_file(rel_path)
-
-        def file_is_ignored(f):
-            abs_path = os.path.abspath(os.path.join(root, f))
-            rel_path = os.path.relpath(abs_path, self.base_dir).replace(os.sep, "/")
-            return self._spec.match_file(rel_path)
-
-        dirs[:] = [d for d in dirs if not dir_is_ignored(d)]
-        files = [f for f in files if not file_is_ignored(f)]
-        return dirs, files
+        return self._matcher.filter(root, dirs, files)
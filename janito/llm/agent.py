@@ -2,7 +2,7 @@ from janito.llm.driver_input import DriverInput
 from janito.llm.driver_config import LLMDriverConfig
 from janito.conversation_history import LLMConversationHistory
 from janito.tools.tools_adapter import ToolsAdapterBase
-from queue import Queue, Empty
+from queue import Queue
 from janito.driver_events import RequestStatus
 from typing import Any, Optional, List, Iterator, Union
 import threading
@@ -10,7 +10,10 @@ import logging
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pathlib import Path
 import time
+import uuid
 from janito.event_bus.bus import event_bus
+from janito.llm.history_compaction import compactor_for_model
+from janito.llm.request_waiter import CancelEvent, RequestWaiter
 
 
 class LLMAgent:
@@ -125,13 +128,9 @@ class LLMAgent:
                 )
     # 添加系统 promot
     def _ensure_system_prompt(self):
-        if self.system_prompt and (
-            not self.conversation_history._history
-            or self.conversation_history._history[0]["role"] != "system"
-        ):
-            self.conversation_history._history.insert(
-                0, {"role": "system", "content": self.system_prompt}
-            )
+        history = self.conversation_history.get_history()
+        if self.system_prompt and (not history or history[0]["role"] != "system"):
+            self.conversation_history.insert_message(0, "system", self.system_prompt)
     
     #添加历史聊天记录
     def _validate_and_update_history(
@@ -158,10 +157,10 @@ class LLMAgent:
                 pass  # Add detailed logging here if needed
 
     def _handle_event_type(self, event):
-        ''''
+        """
         如果是 ResponseReceived 大模型返回结果事件，处理结果检查是否有 tools 调用
         其他事件直接返回
-        ''''
+        """
         event_class = getattr(event, "__class__", None)
         if event_class is not None and event_class.__name__ == "ResponseReceived":
             added_tool_results = self._handle_response_received(event)
@@ -169,41 +168,55 @@ class LLMAgent:
         # For all other events (including RequestFinished with status='error', RequestStarted), do not exit loop
         return None, False
 
-    def _prepare_driver_input(self, config, cancel_event=None):
+    def _compact_history(self, config):
+        """Shrink the history in place if it nears the model's input limit."""
+        model_name = getattr(config, "model", None)
+        model_info = getattr(self.llm_provider, "MODEL_SPECS", {}).get(model_name)
+        changed = compactor_for_model(model_info).compact(self.conversation_history)
+        if changed and getattr(self, "verbose_agent", False):
+            print(f"[agent] [INFO] Compacted {changed} history messages.")
+
+    def _prepare_driver_input(self, config, cancel_event=None, request_id=None):
+        self._compact_history(config)
         return DriverInput(
             config=config,
             conversation_history=self.conversation_history,
             cancel_event=cancel_event,
+            request_id=request_id,
         )
 
     def _process_next_response(
-        self, poll_timeout: float = 1.0, max_wait_time: float = 600.0
+        self,
+        max_wait_time: float = 600.0,
+        request_id: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """
-        Wait for a single event from the output queue (with timeout), process it, and return the result.
+        Wait for the events of one request, process them, and return the result.
         This function is intended to be called from the main agent loop, which controls the overall flow.
+        max_wait_time is an inactivity timeout: it restarts whenever the driver emits an event.
         """
         if getattr(self, "verbose_agent", False):
             print("[agent] [DEBUG] Entered _process_next_response")
-        elapsed = 0.0
-        if getattr(self, "verbose_agent", False):
             print("[agent] [DEBUG] Waiting for event from output_queue...")
         # Let KeyboardInterrupt propagate to caller
         #处理请求的事件，如果是相应结果事件，就会处理结果事件
-        return self._poll_for_event(poll_timeout, max_wait_time)
+        waiter = RequestWaiter(
+            self.output_queue,
+            request_id=request_id,
+            cancel_event=cancel_event,
+            max_wait_time=max_wait_time,
+        )
+        return self._wait_for_event(waiter)
 
-    def _poll_for_event(self, poll_timeout, max_wait_time):
-        elapsed = 0.0
+    def _wait_for_event(self, waiter):
         while True:
-            event = self._get_event_from_output_queue(poll_timeout) # 获取请教结果返回队列
+            event = waiter.next_event() # 阻塞等待请求结果返回队列
             if event is None:
-                elapsed += poll_timeout
-                if elapsed >= max_wait_time:
-                    error_msg = f"[ERROR] No output from driver in agent.chat() after {max_wait_time} seconds (timeout exit)"
-                    print(error_msg)
-                    print("[DEBUG] Exiting _process_next_response due to timeout")
-                    return None, False
-                continue
+                error_msg = f"[ERROR] No output from driver in agent.chat() after {waiter.max_wait_time} seconds (timeout exit)"
+                print(error_msg)
+                print("[DEBUG] Exiting _process_next_response due to timeout")
+                return None, False
             if getattr(self, "verbose_agent", False):
                 print(f"[agent] [DEBUG] Received event from output_queue: {event}")
             event_bus.publish(event)
@@ -215,16 +228,11 @@ class LLMAgent:
                 return result
             elif event_name == "RequestFinished" and getattr(event, "status", None) in [
                 RequestStatus.ERROR,
+                RequestStatus.CANCELLED,
                 RequestStatus.EMPTY_RESPONSE,
                 RequestStatus.TIMEOUT,
             ]:
                 return (event, False)
-
-    def _get_event_from_output_queue(self, poll_timeout):
-        try:
-            return self.output_queue.get(timeout=poll_timeout) # 什么时候把请求放进去的？
-        except Empty:
-            return None
    
     def _handle_response_received(self, event) -> bool:
         """
@@ -234,16 +242,25 @@ class LLMAgent:
         """
         if getattr(self, "verbose_agent", False):
             print("[agent] [INFO] Handling ResponseReceived event.")
-        from janito.llm.message_parts import FunctionCallMessagePart
-
         # Skip tool processing if no tools adapter is available
         if self.tools_adapter is None:
             if getattr(self, "verbose_agent", False):
                 print("[agent] [DEBUG] No tools adapter available, skipping tool calls")
             return False
 
+        from janito.tools.concurrent_executor import ConcurrentToolExecutor
+
+        tool_calls = self._collect_tool_calls(event)
+        # Read-only calls run in parallel; errors come back as string results
+        # instead of propagating to the user. Results keep the call order.
+        tool_results = ConcurrentToolExecutor(self.tools_adapter).execute(tool_calls)
+        return self._add_tool_messages(tool_calls, tool_results)
+
+    def _collect_tool_calls(self, event):
+        """Return the FunctionCallMessageParts of a ResponseReceived event."""
+        from janito.llm.message_parts import FunctionCallMessagePart
+
         tool_calls = []
-        tool_results = []
         for part in event.parts:
             if isinstance(part, FunctionCallMessagePart):
                 if getattr(self, "verbose_agent", False):
@@ -251,13 +268,10 @@ class LLMAgent:
                         f"[agent] [DEBUG] Tool call detected: {getattr(part, 'name', repr(part))} with arguments: {getattr(part, 'arguments', None)}"
                     )
                 tool_calls.append(part)
-                try:
-                    result = self.tools_adapter.execute_function_call_message_part(part)
-                except Exception as e:
-                    # Catch any exception during tool execution and return as string
-                    # instead of letting it propagate to the user
-                    result = str(e)
-                tool_results.append(result)
+        return tool_calls
+
+    def _add_tool_messages(self, tool_calls, tool_results) -> bool:
+        """Append the tool_calls/tool_results messages; True if the loop should continue."""
         if tool_calls:
             # Prepare tool_calls message for assistant
             tool_calls_list = []
@@ -296,17 +310,12 @@ class LLMAgent:
                         "tool_call_id": tool_call_id,
                     }
                 )
-            # Add assistant tool_calls message
-            import json
+            # Add assistant tool_calls message (stored as structured data)
             #添加调用的工具信息
-            self.conversation_history.add_message(
-                "tool_calls", json.dumps(tool_calls_list)
-            )
+            self.conversation_history.add_message("tool_calls", tool_calls_list)
             # Add tool_results message
             #添加工具调用的结果信息
-            self.conversation_history.add_message(
-                "tool_results", json.dumps(tool_results_list)
-            )
+            self.conversation_history.add_message("tool_results", tool_results_list)
             return True  # Continue the loop
         else:
             return False  # No tool calls, return event
@@ -327,16 +336,21 @@ class LLMAgent:
         if config is None:
             config = self.llm_provider.driver_config
         loop_count = 1
-        import threading
-
-        cancel_event = threading.Event()
+        # Setting this event (see cancel()) wakes the waiting loop up immediately
+        cancel_event = CancelEvent(self.output_queue)
+        self._cancel_event = cancel_event
         while True: # 这个循环实现了一个“请求 → 响应 →（执行工具）→ 再请求”的交互式流程，直到获得最终结果或遇到退出条件为止
             self._print_verbose_chat_loop(loop_count)
             #如果有工具调用还是会循环
-            driver_input = self._prepare_driver_input(config, cancel_event=cancel_event) 
+            request_id = str(uuid.uuid4())
+            driver_input = self._prepare_driver_input(
+                config, cancel_event=cancel_event, request_id=request_id
+            )
             self.input_queue.put(driver_input) # 请求数据放入请求的队列中，处理请求的时候会消费这个队列西信息
             try: #处理相应结果
-                result, added_tool_results = self._process_next_response() # added_tool_results  boolean 是否添加了工具结果数据
+                result, added_tool_results = self._process_next_response(
+                    request_id=request_id, cancel_event=cancel_event
+                ) # added_tool_results  boolean 是否添加了工具结果数据
             except KeyboardInterrupt: #如果键盘 ctrl c 退出设置退出
                 cancel_event.set()
                 raise
@@ -348,9 +362,15 @@ class LLMAgent:
                 return result
             loop_count += 1
 
+    def cancel(self):
+        """Cancel the chat() currently in progress, if any (safe to call from another thread)."""
+        cancel_event = getattr(self, "_cancel_event", None)
+        if cancel_event is not None:
+            cancel_event.set()
+
     def _clear_driver_queues(self):
         if hasattr(self, "driver") and self.driver:
-            if hasattr(self.driver, "clear_output_queue 
+            if hasattr(self.driver, "clear_output_queue"):
                 self.driver.clear_output_queue()
             if hasattr(self.driver, "clear_input_queue"):
                 self.driver.clear_input_queue()
@@ -0,0 +1,101 @@
+"""
+asyncio counterpart of LLMAgent.
+
+``AsyncLLMAgent.chat`` is a coroutine: it awaits an AsyncLLMDriver instead of
+blocking a thread on the driver's output queue, and runs the tool calls of each
+response in a worker thread (``asyncio.to_thread``), so hundreds of conversations
+can be served from one event loop. Events are published to ``event_bus`` exactly
+as with the threaded agent.
+"""
+
+import asyncio
+import inspect
+import threading
+import uuid
+from typing import List, Optional
+
+from janito.event_bus.bus import event_bus
+from janito.driver_events import ResponseReceived
+from janito.llm.agent import LLMAgent
+from janito.llm.async_driver import create_async_driver
+
+
+class AsyncLLMAgent(LLMAgent):
+    """
+    LLMAgent whose chat() is awaitable. Conversation history, system prompt
+    templating and tool message bookkeeping are inherited from LLMAgent.
+    """
+
+    def __init__(self, llm_provider, tools_adapter, driver=None, **kwargs):
+        super().__init__(llm_provider, tools_adapter, **kwargs)
+        self.driver = driver
+
+    def _publish_event(self, event):
+        event_bus.publish(event)
+        self._log_event_verbose(event)
+
+    async def chat(
+        self,
+        prompt: str = None,
+        messages: Optional[List[dict]] = None,
+        role: str = "user",
+        config=None,
+    ):
+        self._validate_and_update_history(prompt, messages, role)
+        self._ensure_system_prompt()
+        if config is None:
+            config = self.llm_provider.driver_config
+        loop_count = 1
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
+        while True:
+            self._print_verbose_chat_loop(loop_count)
+            driver_input = self._prepare_driver_input(
+                config, cancel_event=cancel_event, request_id=str(uuid.uuid4())
+            )
+            try:
+                result = await self.driver.process_driver_input(
+                    driver_input, emit=self._publish_event
+                )
+                added_tool_results = False
+                if isinstance(result, ResponseReceived):
+                    added_tool_results = await self._ahandle_response_received(
+                        result
+                    )
+            except asyncio.CancelledError:
+                cancel_event.set()
+                raise
+            if self._should_exit_chat_loop(result, added_tool_results):
+                return result
+            loop_count += 1
+
+    async def _ahandle_response_received(self, event) -> bool:
+        """Async variant of _handle_response_received: tools run off the event loop."""
+        if self.tools_adapter is None:
+            return False
+        from janito.tools.concurrent_executor import ConcurrentToolExecutor
+
+        tool_calls = self._collect_tool_calls(event)
+        if not tool_calls:
+            return False
+        tool_results = await asyncio.to_thread(
+            ConcurrentToolExecutor(self.tools_adapter).execute, tool_calls
+        )
+        # Tools whose run() is a coroutine function are awaited natively
+        for index, result in enumerate(tool_results):
+            if inspect.isawaitable(result):
+                try:
+                    tool_results[index] = await result
+                except Exception as e:
+                    tool_results[index] = str(e)
+        return self._add_tool_messages(tool_calls, tool_results)
+
+
+def create_async_agent(provider_instance, tools_adapter=None, **kwargs):
+    """Create an AsyncLLMAgent with the async driver matching *provider_instance*."""
+    if tools_adapter is None:
+        from janito.tools import get_local_tools_adapter
+
+        tools_adapter = get_local_tools_adapter()
+    driver = create_async_driver(provider_instance, tools_adapter=tools_adapter)
+    return AsyncLLMAgent(provider_instance, tools_adapter, driver=driver, **kwargs)
@@ -0,0 +1,114 @@
+"""
+asyncio counterpart of the threaded, queue-based LLMDriver.
+
+An ``AsyncLLMDriver`` owns no thread and no queues: ``process_driver_input`` is a
+coroutine that emits the same DriverEvents (RequestStarted, ContentDelta, ...,
+RequestFinished, ResponseReceived) through a per-call ``emit`` callback, so many
+conversations can share one event loop and one driver instance. The callback is
+kept in a context variable, which makes concurrent calls on the same driver safe.
+"""
+
+import contextvars
+from abc import abstractmethod
+
+from janito.event_bus.bus import event_bus
+from janito.llm.driver import LLMDriver
+from janito.llm.driver_input import DriverInput
+from janito.driver_events import RequestFinished, ResponseReceived
+
+_event_sink = contextvars.ContextVar("janito_async_event_sink", default=None)
+
+# Sync driver class name -> dotted path of its async counterpart
+ASYNC_DRIVERS = {
+    "OpenAIModelDriver": "janito.drivers.openai.async_driver.AsyncOpenAIModelDriver",
+}
+
+
+class AsyncLLMDriver(LLMDriver):
+    """
+    Base class for asyncio drivers.
+    Subclasses implement ``_acall_api`` (the awaitable counterpart of ``_call_api``);
+    history conversion, part conversion and event construction are shared with the
+    threaded driver they derive from.
+    """
+
+    def start(self):
+        """Async drivers have no background thread; requests are awaited directly."""
+        raise RuntimeError(
+            f"{self.__class__.__name__} is asynchronous: await process_driver_input() instead of start()."
+        )
+
+    def _emit(self, event):
+        sink = _event_sink.get()
+        if sink is None:
+            return super()._emit(event)
+        sink(event)
+
+    async def process_driver_input(self, driver_input: DriverInput, emit=None):
+        """
+        Send one request and emit its events through *emit* (default: ``event_bus.publish``).
+        Returns the ResponseReceived event, or the last RequestFinished when the
+        request failed or was cancelled.
+        """
+        emit = emit or event_bus.publish
+        outcome = {"response": None, "finished": None}
+
+        def sink(event):
+            if isinstance(event, ResponseReceived):
+                outcome["response"] = event
+            elif isinstance(event, RequestFinished):
+                outcome["finished"] = event
+            emit(event)
+
+        token = _event_sink.set(sink)
+        try:
+            await self._process_driver_input(driver_input)
+        finally:
+            _event_sink.reset(token)
+        return outcome["response"] or outcome["finished"]
+
+    async def _process_driver_input(self, driver_input):
+        config = driver_input.config
+        request_id = self.get_request_id(driver_input)
+        if not self.available:
+            self.handle_driver_unavailable(request_id)
+            return
+        self._emit_request_started(config, request_id)
+        if self._is_cancelled(driver_input):
+            self._emit_cancelled(request_id, "Canceled before start")
+            return
+        try:
+            result = await self._acall_api(driver_input)
+            self._emit_result(driver_input, request_id, result)
+        except Exception as ex:
+            self._emit_request_error(request_id, ex)
+
+    @abstractmethod
+    async def _acall_api(self, driver_input: DriverInput):
+        """Subclasses implement: await the provider API for driver_input and return the result object."""
+        pass
+
+
+def create_async_driver(provider_instance, tools_adapter=None):
+    """
+    Build the async driver matching *provider_instance*'s regular driver, bound to
+    the provider's config. Raises NotImplementedError for drivers without an async
+    counterpart.
+    """
+    import importlib
+
+    sync_driver = provider_instance.create_driver()
+    driver_name = type(sync_driver).__name__
+    dotted = ASYNC_DRIVERS.get(driver_name)
+    if dotted is None:
+        raise NotImplementedError(f"No async driver available for {driver_name}")
+    module_name, class_name = dotted.rsplit(".", 1)
+    driver_class = getattr(importlib.import_module(module_name), class_name)
+    driver = driver_class(
+        tools_adapter=(
+            tools_adapter if tools_adapter is not None else sync_driver.tools_adapter
+        ),
+        provider_name=sync_driver.provider_name,
+    )
+    driver.config = getattr(sync_driver, "config", None)
+    return driver
@@ -0,0 +1,171 @@
+"""
+Process-wide cache of provider SDK clients.
+
+Building a new ``openai.OpenAI`` (or compatible) client per agent turn also builds
+a new HTTP connection pool, so every tool-loop iteration pays a fresh TCP+TLS
+handshake. Drivers fetch their client from the shared ``client_pool`` instead; it
+keeps one client per (kind, endpoint, credentials) alive for the lifetime of the
+process and closes them on ``shutdown()`` (registered with ``atexit``).
+
+Async clients are bound to the event loop they first ran on, so they are pooled per
+loop with ``get_loop_client``: entries are keyed by the loop object itself (weakly)
+and dropped once their loop is closed.
+
+Pool limits can be tuned with the config keys ``http_max_connections``,
+``http_max_keepalive_connections`` and ``http_keepalive_expiry`` (seconds).
+"""
+
+import atexit
+import hashlib
+import inspect
+import threading
+import weakref
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+
+class ClientPool:
+    """
+    Thread-safe registry of long-lived SDK clients.
+    Clients are created lazily by a caller-supplied factory and shared by every driver
+    that asks for the same (kind, base_url, api_key, extra) combination.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._loop_clients = weakref.WeakKeyDictionary()  # loop -> {key: client}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(kind, base_url=None, api_key=None, **extra):
+        # Only a digest of the credentials is kept in the key
+        key_digest = (
+            hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()
+            if api_key
+            else None
+        )
+        return (kind, str(base_url or ""), key_digest, tuple(sorted(extra.items())))
+
+    def get_client(self, kind, factory, base_url=None, api_key=None, **extra):
+        """Return the cached client for this endpoint, building it with *factory* on first use."""
+        key = self.make_key(kind, base_url, api_key, **extra)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+            return client
+
+    def get_loop_client(
+        self, kind, factory, loop, base_url=None, api_key=None, **extra
+    ):
+        """Like get_client, for an async client used on the event loop *loop*."""
+        key = self.make_key(kind, base_url, api_key, **extra)
+        with self._lock:
+            stale = self._pop_closed_loops()
+            clients = self._loop_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = clients[key] = factory()
+        for old in stale:
+            self._close(old)
+        return client
+
+    def _pop_closed_loops(self):
+        """Forget the clients of closed loops; returns them (call with the lock held)."""
+        stale = []
+        for loop in [loop for loop in self._loop_clients if loop.is_closed()]:
+            stale.extend(self._loop_clients.pop(loop).values())
+        return stale
+
+    def discard(self, kind, base_url=None, api_key=None, loop=None, **extra):
+        """
+        Close and forget one client (e.g. after its credentials were rejected or
+        its connection failed). Pass *loop* for a client from get_loop_client.
+        """
+        key = self.make_key(kind, base_url, api_key, **extra)
+        with self._lock:
+            if loop is None:
+                client = self._clients.pop(key, None)
+            else:
+                client = self._loop_clients.get(loop, {}).pop(key, None)
+        self._close(client)
+
+    def shutdown(self):
+        """Close every pooled client and release its connections."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            for loop_clients in list(self._loop_clients.values()):
+                clients.extend(loop_clients.values())
+            self._loop_clients.clear()
+        for client in clients:
+            self._close(client)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._clients)
+
+    @staticmethod
+    def _close(client):
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    # Async clients: their event loop may be gone, just drop the coroutine
+                    getattr(result, "close", lambda: None)()
+            except Exception:
+                pass
+
+
+def get_pool_limits():
+    """Return (max_connections, max_keepalive_connections, keepalive_expiry) from config."""
+    from janito.config import config
+
+    def _number(key, default, cast):
+        try:
+            value = config.get(key)
+            return cast(value) if value not in (None, "") else default
+        except (TypeError, ValueError):
+            return default
+
+    return (
+        _number("http_max_connections", DEFAULT_MAX_CONNECTIONS, int),
+        _number(
+            "http_max_keepalive_connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS, int
+        ),
+        _number("http_keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY, float),
+    )
+
+
+def build_openai_http_client(asynchronous=False):
+    """Create an httpx client with keep-alive and the configured pool limits.
+
+    With ``asynchronous=True`` an ``httpx.AsyncClient`` is built for ``openai.AsyncOpenAI``.
+    Returns ``None`` when httpx is not importable, in which case the OpenAI SDK
+    falls back to its own default pool (still reused through ``client_pool``).
+    """
+    try:
+        import httpx
+        import openai
+    except ImportError:
+        return None
+    max_connections, max_keepalive, keepalive_expiry = get_pool_limits()
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=keepalive_expiry,
+    )
+    if asynchronous:
+        http_client_class = getattr(openai, "DefaultAsyncHttpxClient", httpx.AsyncClient)
+    else:
+        http_client_class = getattr(openai, "DefaultHttpxClient", httpx.Client)
+    return http_client_class(limits=limits)
+
+
+# Singleton instance for global use
+client_pool = ClientPool()
+atexit.register(client_pool.shutdown)
@@ -7,6 +7,8 @@ from janito.driver_events import (
     RequestFinished,
     ResponseReceived,
     RequestStatus,
+    ContentDelta,
+    ToolCallDelta,
 )
 
 
@@ -37,6 +39,10 @@ class LLMDriver(ABC):
       - Accept DriverInput via input_queue.
       - Put DriverEvents on output_queue.
       - Use start() to launch worker loop in a thread.
+    Streaming:
+      - Drivers that set supports_streaming = True honour config.stream; they emit
+        ContentDelta/ToolCallDelta events while the completion arrives and still
+        finish with a single ResponseReceived carrying the assembled parts.
     The driver automatically creates its own input/output queues, accessible via .input_queue and .output_queue.
     
     LLM 驱动的抽象基类（基于线程和队列）。
@@ -61,6 +67,7 @@ class LLMDriver(ABC):
 
     available = True
     unavailable_reason = None
+    supports_streaming = False
 
     def __init__(self, tools_adapter=None, provider_name=None):
         self.input_queue = Queue()
@@ -83,9 +90,9 @@ class LLMDriver(ABC):
         self._thread.start()
 
     def _run(self):
-        ''''''
+        """
         用户的请求放入到队列中，后台线程不停的从队列中获取请求信息，把结果存储到结果的事件当中。
-        ''''''
+        """
         while True:
             driver_input = self.input_queue.get()
             if driver_input is None:
@@ -100,10 +107,10 @@ class LLMDriver(ABC):
             except Exception as e:
                 import traceback
 
-                self.output_queue.put(
+                self._emit(
                     RequestFinished(
                         driver_name=self.__class__.__name__,
-                        request_id=getattr(driver_input.config, "request_id", None),
+                        request_id=self.get_request_id(driver_input),
                         status=RequestStatus.ERROR,
                         error=str(e),
                         exception=e,
@@ -112,7 +119,7 @@ class LLMDriver(ABC):
                 )
 
     def handle_driver_unavailable(self, request_id):
-        self.output_queue.put(
+        self._emit(
             RequestFinished(
                 driver_name=self.__class__.__name__,
                 request_id=request_id,
@@ -126,7 +133,7 @@ class LLMDriver(ABC):
     def emit_response_received(
         self, driver_name, request_id, result, parts, timestamp=None, metadata=None
     ):
-        self.output_queue.put(
+        self._emit(
             ResponseReceived(
                 driver_name=driver_name,
                 request_id=request_id,
@@ -146,105 +153,123 @@ class LLMDriver(ABC):
                 flush=True,
             )
 
+    @staticmethod
+    def get_request_id(driver_input):
+        """Return the request id for *driver_input* (DriverInput.request_id, else config.request_id)."""
+        return getattr(driver_input, "request_id", None) or getattr(
+            driver_input.config, "request_id", None
+        )
+
+    def is_streaming(self, config) -> bool:
+        """Return True if this request should be streamed (driver support + config.stream)."""
+        return bool(self.supports_streaming and getattr(config, "stream", False))
+
+    def emit_content_delta(self, driver_name, request_id, content):
+        self._emit(
+            ContentDelta(driver_name=driver_name, request_id=request_id, content=content)
+        )
+
+    def emit_tool_call_delta(
+        self, driver_name, request_id, index, tool_call_id, name, arguments_delta
+    ):
+        self._emit(
+            ToolCallDelta(
+                driver_name=driver_name,
+                request_id=request_id,
+                index=index,
+                tool_call_id=tool_call_id,
+                name=name,
+                arguments_delta=arguments_delta or "",
+            )
+        )
+
     def process_driver_input(self, driver_input: DriverInput):
-        ''''
-         会发送大模型请求，并且把请求结果封装成事件，放入到结果队列中
-        ''''
+        """
+        会发送大模型请求，并且把请求结果封装成事件，放入到结果队列中
+        """
         config = driver_input.config
-        request_id = getattr(config, "request_id", None)
+        request_id = self.get_request_id(driver_input)
         if not self.available:
             self.handle_driver_unavailable(request_id)
             return
+        self._emit_request_started(config, request_id)
+        # Check for cancel_event before starting 如果取消事件，直接返回
+        if self._is_cancelled(driver_input):
+            self._emit_cancelled(request_id, "Canceled before start")
+            return
+        try:
+            result = self._call_api(driver_input) # 执行大模型调用
+            self._emit_result(driver_input, request_id, result)
+        except Exception as ex:
+            self._emit_request_error(request_id, ex)
+
+    def _emit(self, event):
+        """Deliver a DriverEvent to the consumer (the output queue for threaded drivers)."""
+        self.output_queue.put(event)
+
+    def _emit_request_started(self, config, request_id):
         # Prepare payload for RequestStarted event
         payload = {"provider_name": self.provider_name}
         if hasattr(config, "model") and getattr(config, "model", None):
             payload["model"] = getattr(config, "model")
         elif hasattr(config, "model_name") and getattr(config, "model_name", None):
             payload["model"] = getattr(config, "model_name")
-        self.output_queue.put(
+        self._emit(
             RequestStarted(
                 driver_name=self.__class__.__name__,
                 request_id=request_id,
                 payload=payload,
             )
         )
-        # Check for cancel_event before starting 如果取消事件，直接返回
-        if (
-            hasattr(driver_input, "cancel_event")
-            and driver_input.cancel_event is not None
-            and driver_input.cancel_event.is_set()
-        ):
-            self.output_queue.put(
-                RequestFinished(
-                    driver_name=self.__class__.__name__,
-                    request_id=request_id,
-                    status=RequestStatus.CANCELLED,
-                    reason="Canceled before start",
-                )
-            )
-            return
-        try:
-            result = self._call_api(driver_input) # 执行大模型调用
-            # If result is None and cancel_event is set, treat as cancelled
-            if (
-                hasattr(driver_input, "cancel_event")
-                and driver_input.cancel_event is not None
-                and driver_input.cancel_event.is_set()
-            ):
-                self.output_queue.put(
-                    RequestFinished(
-                        driver_name=self.__class__.__name__,
-                        request_id=request_id,
-                        status=RequestStatus.CANCELLED,
-                        reason="Cancelled during processing (post-API)", # 发送请求后处理被取消了
-                    )
-                )
-                return
-            if (
-                result is None
-                and hasattr(driver_input, "cancel_event")
-                and driver_input.cancel_event is not None
-                and driver_input.cancel_event.is_set()
-            ):
-                # Already handled by driver
-                return
-            # Check for cancel_event after API call (subclasses should also check during long calls)
-            if (
-                hasattr(driver_input, "cancel_event")
-                and driver_input.cancel_event is not None
-                and driver_input.cancel_event.is_set()
-            ):
-                self.output_queue.put(
-                    RequestFinished(
-                        driver_name=self.__class__.__name__,
-                        request_id=request_id,
-                        status=RequestStatus.CANCELLED,
-                        reason="Canceled during processing",
-                    )
-                )
-                return
-            message = self._get_message_from_result(result)
-            parts = (
-                self._convert_completion_message_to_parts(message) if message else []
+
+    @staticmethod
+    def _is_cancelled(driver_input):
+        cancel_event = getattr(driver_input, "cancel_event", None)
+        return cancel_event is not None and cancel_event.is_set()
+
+    def _emit_cancelled(self, request_id, reason):
+        self._emit(
+            RequestFinished(
+                driver_name=self.__class__.__name__,
+                request_id=request_id,
+                status=RequestStatus.CANCELLED,
+                reason=reason,
             )
-            timestamp = getattr(result, "created", None)
-            metadata = {"usage": getattr(result, "usage", None), "raw_response": result}
-            self.emit_response_received(# 触发收到请求结果事件
-                self.__class__.__name__, request_id, result, parts, timestamp, metadata
+        )
+
+    def _emit_result(self, driver_input, request_id, result):
+        """Turn the provider result of _call_api into a ResponseReceived event."""
+        # If result is None and cancel_event is set, treat as cancelled
+        # (subclasses should also check during long calls)
+        if self._is_cancelled(driver_input):
+            self._emit_cancelled(
+                request_id, "Cancelled during processing (post-API)" # 发送请求后处理被取消了
             )
-        except Exception as ex:
-            import traceback
-
-            self.output_queue.put(
-                RequestFinished(
-                    driver_name=self.__class__.__name__,
-                    request_id=request_id,
-                    status=RequestStatus.ERROR,
-                    error=str(ex),
-                    exception=ex,
-                    traceback=traceback.format_exc(),
-                )
+            return
+        message = self._get_message_from_result(result)
+        parts = self._convert_completion_message_to_parts(message) if message else []
+        timestamp = getattr(result, "created", None)
+        metadata = {"usage": getattr(result, "usage", None), "raw_response": result}
+        if self.is_streaming(driver_input.config):
+            # Text parts were already delivered as ContentDelta events
+            metadata["streamed"] = True
+        self.emit_response_received(# 触发收到请求结果事件
+            self.__class__.__name__, request_id, result, parts, timestamp, metadata
+        )
+
+    def _emit_request_error(self, request_id, ex):
+        import traceback
+
+        self._emit(
+            RequestFinished(
+                driver_name=self.__class__.__name__,
+                request_id=request_id,
+                status=RequestStatus.ERROR,
+                error=str(ex),
+                exception=ex,
+                traceback=traceback.format_exc(),
             )
+        )
 
     @abstractmethod
     def _prepare_api_kwargs(self, config, conversation):
@@ -24,6 +24,7 @@ class LLMDriverConfig:
     frequency_penalty: Optional[float] = None
     stop: Optional[Any] = None  # list or string, depending on backend
     reasoning_effort: Optional[str] = None
+    stream: Optional[bool] = None  # Stream completions incrementally if the driver supports it
     extra: dict = field(
         default_factory=dict
     )  # for provider-specific miscellaneous config fields
@@ -10,3 +10,4 @@ class DriverInput:
     config: LLMDriverConfig
     conversation_history: LLMConversationHistory
     cancel_event: Optional[threading.Event] = field(default=None)
+    request_id: Optional[str] = field(default=None)
@@ -0,0 +1,247 @@
+"""
+Context-window-aware compaction of LLMConversationHistory.
+
+Before each request the agent estimates the size of its history (about four
+characters per token). Once it passes ``history_compaction_threshold`` (a fraction of
+the model's input limit, default 0.8; 0 disables compaction) the history is reduced
+in place until it fits half of the limit:
+
+1. Old tool results, the bulk of most sessions, are cut down to a short head plus a
+   marker. The most recent tool results are left intact.
+2. If that is not enough, the oldest turns are dropped, except the system prompt
+   and the latest turns. The user prompts of dropped turns are kept in one note
+   message, so the model still knows what was asked earlier.
+
+The input limit comes from the model's LLMModelInfo: ``max_input`` if set, else
+``context`` minus ``max_response``.
+"""
+
+import json
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+DEFAULT_THRESHOLD = 0.8
+TARGET_RATIO = 0.5
+KEEP_RECENT_TURNS = 2
+KEEP_RECENT_TOOL_RESULTS = 4
+TRUNCATED_HEAD_CHARS = 300
+NOTE_PROMPT_CHARS = 200
+MAX_NOTE_PROMPTS = 50
+
+
+def _as_int(value):
+    try:
+        return int(value) if value not in (None, "N/A", "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def get_input_token_limit(model_info):
+    """Return the number of input tokens the model accepts, or None if unknown."""
+    if model_info is None:
+        return None
+    if isinstance(model_info, dict):
+        get = model_info.get
+    else:
+        get = lambda key: getattr(model_info, key, None)  # noqa: E731
+    max_input = _as_int(get("max_input"))
+    if max_input:
+        return max_input
+    context = _as_int(get("context"))
+    if not context:
+        return None
+    max_response = _as_int(get("max_response")) or 0
+    return context - max_response if context > max_response else context
+
+
+def get_compaction_threshold():
+    """Return the configured compaction threshold (0 means disabled)."""
+    from janito.config import config
+
+    value = config.get("history_compaction_threshold")
+    if value in (None, ""):
+        return DEFAULT_THRESHOLD
+    if str(value).lower() in ("off", "false", "no"):
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return DEFAULT_THRESHOLD
+
+
+def _content_chars(content):
+    # Structured tool payloads are measured without serialising them
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, dict):
+        return sum(len(str(k)) + _content_chars(v) for k, v in content.items())
+    if isinstance(content, (list, tuple)):
+        return sum(_content_chars(item) for item in content)
+    return len(str(content)) if content is not None else 0
+
+
+def estimate_tokens(text):
+    if not text:
+        return 0
+    return _content_chars(text) // CHARS_PER_TOKEN + 1
+
+
+def estimate_message_tokens(message):
+    return MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.get("content"))
+
+
+def estimate_history_tokens(messages):
+    return sum(estimate_message_tokens(m) for m in messages)
+
+
+def _truncate(text, head_chars):
+    if not isinstance(text, str) or len(text) <= head_chars * 2:
+        return text, False
+    removed = len(text) - head_chars
+    return (
+        f"{text[:head_chars]}\n[... {removed} characters of earlier tool output "
+        f"removed to fit the context window ...]",
+        True,
+    )
+
+
+def _truncate_tool_results(message, head_chars):
+    """Return a copy of a ``tool_results`` message with each result truncated."""
+    content = message.get("content")
+    try:
+        results = json.loads(content) if isinstance(content, str) else content
+    except ValueError:
+        results = None
+    changed = False
+    if isinstance(results, list):
+        compacted = []
+        for result in results:
+            if isinstance(result, dict):
+                text, cut = _truncate(result.get("content"), head_chars)
+                if cut:
+                    result = dict(result, content=text)
+                    changed = True
+            compacted.append(result)
+        new_content = json.dumps(compacted) if isinstance(content, str) else compacted
+    else:
+        new_content, changed = _truncate(content, head_chars)
+    if not changed:
+        return None
+    metadata = dict(message.get("metadata") or {}, compacted=True)
+    return dict(message, content=new_content, metadata=metadata)
+
+
+def _is_note(message):
+    return (message.get("metadata") or {}).get("compaction_note", False)
+
+
+class HistoryCompactor:
+    """Keeps a conversation history under *threshold* of *token_limit* input tokens."""
+
+    def __init__(
+        self,
+        token_limit,
+        threshold=DEFAULT_THRESHOLD,
+        target_ratio=TARGET_RATIO,
+        keep_recent_turns=KEEP_RECENT_TURNS,
+        keep_recent_tool_results=KEEP_RECENT_TOOL_RESULTS,
+    ):
+        self.token_limit = token_limit
+        self.threshold = threshold
+        self.target_ratio = min(target_ratio, threshold) if threshold else target_ratio
+        self.keep_recent_turns = keep_recent_turns
+        self.keep_recent_tool_results = keep_recent_tool_results
+
+    @property
+    def enabled(self):
+        return bool(self.token_limit and self.threshold)
+
+    def needs_compaction(self, messages):
+        if not self.enabled:
+            return False
+        return estimate_history_tokens(messages) > self.token_limit * self.threshold
+
+    def compact(self, conversation_history):
+        """Compact *conversation_history* in place; return how many messages changed."""
+        messages = conversation_history.get_history()
+        if not self.needs_compaction(messages):
+            return 0
+        target = self.token_limit * self.target_ratio
+        messages, changed = self._trim_tool_results(messages, target)
+        if estimate_history_tokens(messages) > target:
+            messages, dropped = self._drop_old_turns(messages, target)
+            changed += dropped
+        if changed:
+            conversation_history.replace_messages(messages)
+        return changed
+
+    def _trim_tool_results(self, messages, target):
+        positions = [
+            i for i, m in enumerate(messages) if m.get("role") == "tool_results"
+        ]
+        if self.keep_recent_tool_results:
+            positions = positions[: -self.keep_recent_tool_results]
+        total = estimate_history_tokens(messages)
+        changed = 0
+        for i in positions:
+            if total <= target:
+                break
+            compacted = _truncate_tool_results(messages[i], TRUNCATED_HEAD_CHARS)
+            if compacted is None:
+                continue
+            total += estimate_message_tokens(compacted) - estimate_message_tokens(
+                messages[i]
+            )
+            messages[i] = compacted
+            changed += 1
+        return messages, changed
+
+    def _drop_old_turns(self, messages, target):
+        head = [m for m in messages[:1] if m.get("role") == "system"]
+        body = messages[len(head) :]
+        notes = [m for m in body if _is_note(m)]
+        body = [m for m in body if not _is_note(m)]
+        turn_starts = [i for i, m in enumerate(body) if m.get("role") == "user"]
+        # Cutting before turn_starts[k] keeps that turn and everything after it;
+        # the latest keep_recent_turns turns (the current one included) always stay
+        keep = max(1, self.keep_recent_turns)
+        candidates = [i for i in turn_starts[: len(turn_starts) - keep + 1] if i > 0]
+        if not candidates:
+            return messages, 0
+        cut = candidates[-1]
+        for start in candidates:
+            if estimate_history_tokens(head + notes + body[start:]) <= target:
+                cut = start
+                break
+        dropped = body[:cut]
+        earlier_prompts = [
+            line for note in notes for line in note["content"].split("\n")[1:]
+        ]
+        earlier_prompts += [
+            "- " + _one_line(m.get("content"), NOTE_PROMPT_CHARS)
+            for m in dropped
+            if m.get("role") == "user"
+        ]
+        # The note is rebuilt on every compaction; keep only the latest prompts
+        earlier_prompts = earlier_prompts[-MAX_NOTE_PROMPTS:]
+        note = {
+            "role": "user",
+            "content": "[Earlier turns were removed to fit the context window. "
+            "Their requests were:]\n" + "\n".join(earlier_prompts),
+            "metadata": {"compaction_note": True},
+        }
+        return head + [note] + body[cut:], len(dropped)
+
+
+def _one_line(text, limit):
+    if not isinstance(text, str):
+        text = json.dumps(text, default=str)
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def compactor_for_model(model_info, threshold=None):
+    """Build a HistoryCompactor for *model_info* (an LLMModelInfo or its dict)."""
+    if threshold is None:
+        threshold = get_compaction_threshold()
+    return HistoryCompactor(get_input_token_limit(model_info), threshold=threshold)
@@ -0,0 +1,90 @@
+"""
+Event-driven waiting for driver output.
+
+The agent used to poll its output queue in 1 second steps, which added up to a
+second of latency to cancellation and to every request timeout check. Instead
+``RequestWaiter`` blocks on the queue until the next event arrives, the request
+is cancelled (``CancelEvent.set()`` pushes a wakeup sentinel onto the queue), or
+the request goes quiet for longer than ``max_wait_time`` seconds.
+"""
+
+import threading
+import time
+from queue import Empty
+
+from janito.driver_events import RequestFinished, RequestStatus
+
+# Placed on the output queue to wake up a blocked waiter; never published.
+WAKEUP = object()
+
+
+class CancelEvent(threading.Event):
+    """
+    A ``threading.Event`` that also wakes up the agent waiting on *wakeup_queue*
+    when set, so cancellation is noticed immediately rather than on the next poll.
+    """
+
+    def __init__(self, wakeup_queue=None):
+        super().__init__()
+        self._wakeup_queue = wakeup_queue
+
+    def set(self):
+        already_set = self.is_set()
+        super().set()
+        if not already_set and self._wakeup_queue is not None:
+            self._wakeup_queue.put(WAKEUP)
+
+
+class RequestWaiter:
+    """
+    Waits for the driver events belonging to one request.
+
+    ``max_wait_time`` is an inactivity timeout: it restarts whenever an event for
+    the request arrives, so long streamed responses are not cut off. Events tagged
+    with another request id (left over from an earlier, abandoned request) are
+    skipped.
+    """
+
+    def __init__(self, output_queue, request_id=None, cancel_event=None, max_wait_time=600.0):
+        self.output_queue = output_queue
+        self.request_id = request_id
+        self.cancel_event = cancel_event
+        self.max_wait_time = max_wait_time
+        self._deadline = time.monotonic() + max_wait_time
+
+    def _cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def _is_stale(self, event):
+        event_request_id = getattr(event, "request_id", None)
+        return (
+            self.request_id is not None
+            and event_request_id is not None
+            and event_request_id != self.request_id
+        )
+
+    def next_event(self):
+        """
+        Return the next event for this request.
+
+        Returns ``None`` on timeout and a synthesized ``RequestFinished`` with status
+        ``CANCELLED`` once the cancel event is set.
+        """
+        while True:
+            if self._cancelled():
+                return RequestFinished(
+                    request_id=self.request_id,
+                    status=RequestStatus.CANCELLED,
+                    reason="Cancelled by caller",
+                )
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                event = self.output_queue.get(timeout=remaining)
+            except Empty:
+                return None
+            if event is WAKEUP or self._is_stale(event):
+                continue
+            self._deadline = time.monotonic() + self.max_wait_time
+            return event
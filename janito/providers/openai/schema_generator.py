@@ -2,7 +2,7 @@ import inspect
 import typing
 from collections import OrderedDict
 from typing import List
-from janito.tools.tools_schema import ToolSchemaBase
+from janito.tools.tools_schema import ToolSchemaBase, ToolSchemaCache
 
 
 class OpenAISchemaGenerator(ToolSchemaBase):
@@ -55,9 +55,24 @@ class OpenAISchemaGenerator(ToolSchemaBase):
         }
 
 
+def _generate_function_schema(tool_class):
+    return {
+        "type": "function",
+        "function": OpenAISchemaGenerator().generate_schema(tool_class),
+    }
+
+
+_schema_cache = ToolSchemaCache(_generate_function_schema)
+
+
 def generate_tool_schemas(tool_classes: List[type]):
-    generator = OpenAISchemaGenerator()
-    return [
-        {"type": "function", "function": generator.generate_schema(tool_class)}
-        for tool_class in tool_classes
-    ]
+    return _schema_cache.schemas_for_classes(tool_classes)
+
+
+def get_tool_schemas(tools_adapter):
+    """Return the cached schema payload for the adapter's currently enabled tools."""
+    return _schema_cache.schemas_for_adapter(tools_adapter)
+
+
+def clear_tool_schema_cache():
+    _schema_cache.clear()
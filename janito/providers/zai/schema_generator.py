@@ -5,6 +5,7 @@ Generate OpenAI-compatible tool schemas for Z.AI API.
 import inspect
 from typing import get_type_hints, Dict, Any, Optional, List, Union
 from janito.tools.tool_base import ToolBase
+from janito.tools.tools_schema import ToolSchemaCache
 
 
 def generate_tool_schemas(tool_classes):
@@ -17,12 +18,22 @@ def generate_tool_schemas(tool_classes):
     Returns:
         List of OpenAI-compatible tool schemas
     """
-    schemas = []
-    for tool_class in tool_classes:
-        schema = generate_tool_schema(tool_class)
-        if schema:
-            schemas.append(schema)
-    return schemas
+    return _schema_cache.schemas_for_classes(tool_classes)
+
+
+def get_tool_schemas(tools_adapter):
+    """
+    Return the cached schema payload for the adapter's currently enabled tools.
+
+    The payload is rebuilt only when tools are registered/unregistered or the
+    allowed permissions or disabled tools change.
+    """
+    return _schema_cache.schemas_for_adapter(tools_adapter)
+
+
+def clear_tool_schema_cache():
+    """Drop all cached schemas (e.g. after tool classes were modified at runtime)."""
+    _schema_cache.clear()
 
 
 def generate_tool_schema(tool_class):
@@ -133,3 +144,6 @@ def python_type_to_json_schema(python_type):
 
     # Default fallback
     return {"type": "string"}
+
+
+_schema_cache = ToolSchemaCache(generate_tool_schema)
@@ -0,0 +1,21 @@
+"""
+Headless multi-session service used by ``janito serve``.
+"""
+
+from .sessions import (
+    Session,
+    SessionBusyError,
+    SessionManager,
+    SessionToolsAdapter,
+    workdir_lease,
+)
+from .http_api import create_server
+
+__all__ = [
+    "Session",
+    "SessionBusyError",
+    "SessionManager",
+    "SessionToolsAdapter",
+    "workdir_lease",
+    "create_server",
+]
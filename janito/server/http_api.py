@@ -0,0 +1,250 @@
+"""
+Local JSON API over HTTP (TCP or Unix socket) for ``janito serve``.
+
+Routes:
+  GET    /health                        -> {"status": "ok", "sessions": N}
+  GET    /sessions                      -> list of session infos
+  POST   /sessions                      -> create; body: provider, model, workdir,
+                                           permissions ("rwx" subset), profile, system_prompt
+  GET    /sessions/<id>                 -> session info
+  DELETE /sessions/<id>                 -> close the session
+  GET    /sessions/<id>/history         -> conversation history
+  POST   /sessions/<id>/messages        -> body: {"prompt": "..."}; runs to completion and
+                                           returns status, text, usage and elapsed seconds
+  POST   /sessions/<id>/cancel          -> cancel the prompt in progress
+
+Every request must carry ``Authorization: Bearer <token>`` with the server token.
+TCP requests must also name a loopback (or the bound) host in ``Host`` and, when
+sent by a browser, come from such an ``Origin``; this blocks cross-site requests
+and DNS rebinding from pages open in a local browser.
+"""
+
+import hmac
+import json
+import os
+import re
+import secrets
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from janito.server.sessions import SessionBusyError
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+_SESSION = r"^/sessions/(?P<session_id>[0-9a-f]+)"
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _host_name(value):
+    """Return the lower-cased host of a Host header or Origin URL, or None."""
+    try:
+        parts = urlsplit(value if "//" in value else f"//{value}")
+        return parts.hostname
+    except ValueError:
+        return None
+
+
+class JanitoAPIHandler(BaseHTTPRequestHandler):
+    server_version = "janito-serve"
+    protocol_version = "HTTP/1.1"
+
+    # (method, path pattern, handler name); path groups are passed as keywords
+    routes = [
+        ("GET", r"^/health/?$", "_health"),
+        ("GET", r"^/sessions/?$", "_list_sessions"),
+        ("POST", r"^/sessions/?$", "_create_session"),
+        ("GET", _SESSION + r"/?$", "_get_session"),
+        ("DELETE", _SESSION + r"/?$", "_close_session"),
+        ("GET", _SESSION + r"/history/?$", "_history"),
+        ("POST", _SESSION + r"/messages/?$", "_send_message"),
+        ("POST", _SESSION + r"/cancel/?$", "_cancel"),
+    ]
+    routes = [(method, re.compile(path), name) for method, path, name in routes]
+
+    @property
+    def manager(self):
+        return self.server.session_manager
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format, *args):
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 401:
+            self.send_header("WWW-Authenticate", "Bearer")
+        if status >= 400:
+            # The request body may not have been read
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, "Request body too large")
+        if not length:
+            return {}
+        try:
+            payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ApiError(400, f"Invalid JSON body: {e}")
+        if not isinstance(payload, dict):
+            raise ApiError(400, "JSON body must be an object")
+        return payload
+
+    def _session(self, session_id):
+        session = self.manager.get(session_id)
+        if session is None:
+            raise ApiError(404, f"Unknown session: {session_id}")
+        return session
+
+    def _check_request_origin(self):
+        """Reject foreign Host or Origin headers (TCP only; see module docstring)."""
+        allowed = self.server.allowed_hosts
+        if allowed is None:
+            return
+        if _host_name(self.headers.get("Host") or "") not in allowed:
+            raise ApiError(403, "Host not allowed")
+        origin = self.headers.get("Origin")
+        if origin is not None and _host_name(origin) not in allowed:
+            raise ApiError(403, "Origin not allowed")
+
+    def _check_token(self):
+        scheme, _, token = (self.headers.get("Authorization") or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            token.strip().encode("utf-8"), self.server.auth_token.encode("utf-8")
+        ):
+            raise ApiError(401, "Missing or invalid bearer token")
+
+    def _dispatch(self, method):
+        try:
+            self._check_request_origin()
+            self._check_token()
+            status, payload = self._route(method, self.path.split("?", 1)[0])
+        except ApiError as e:
+            status, payload = e.status, {"error": str(e)}
+        except ValueError as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+        self._send_json(status, payload)
+
+    def _route(self, method, path):
+        path_matched = False
+        for route_method, pattern, name in self.routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            if route_method == method:
+                return getattr(self, name)(**match.groupdict())
+            path_matched = True
+        if path_matched:
+            raise ApiError(405, f"Method {method} not allowed")
+        raise ApiError(404, f"No route for {path}")
+
+    def _health(self):
+        return 200, {"status": "ok", "sessions": len(self.manager.list_sessions())}
+
+    def _list_sessions(self):
+        return 200, [s.info() for s in self.manager.list_sessions()]
+
+    def _create_session(self):
+        body = self._read_json()
+        session = self.manager.create_session(
+            provider=body.get("provider"),
+            model=body.get("model"),
+            workdir=body.get("workdir"),
+            permissions=body.get("permissions"),
+            profile=body.get("profile"),
+            system_prompt=body.get("system_prompt"),
+        )
+        return 201, session.info()
+
+    def _get_session(self, session_id):
+        return 200, self._session(session_id).info()
+
+    def _close_session(self, session_id):
+        if not self.manager.close_session(session_id):
+            raise ApiError(404, f"Unknown session: {session_id}")
+        return 200, {"closed": session_id}
+
+    def _history(self, session_id):
+        session = self._session(session_id)
+        return 200, session.agent.conversation_history.get_history()
+
+    def _send_message(self, session_id):
+        session = self._session(session_id)
+        prompt = self._read_json().get("prompt")
+        if not isinstance(prompt, str) or not prompt.strip():
+            raise ApiError(400, "'prompt' must be a non-empty string")
+        try:
+            return 200, session.send(prompt, wait=False)
+        except SessionBusyError:
+            raise ApiError(409, "Session is busy with another prompt")
+
+    def _cancel(self, session_id):
+        self._session(session_id).cancel()
+        return 200, {"cancelled": session_id}
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        # BaseHTTPRequestHandler expects these attributes on the server
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def create_server(
+    session_manager, host="127.0.0.1", port=8765, socket_path=None, token=None
+):
+    """
+    Build (but do not start) the API server; a *socket_path* selects a Unix socket.
+    Clients authenticate with *token*; a random one is generated when not given
+    and is available as ``server.auth_token``.
+    """
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, JanitoAPIHandler)
+        os.chmod(socket_path, 0o600)
+        server.allowed_hosts = None
+    else:
+        server = ThreadingHTTPServer((host, port), JanitoAPIHandler)
+        server.daemon_threads = True
+        server.allowed_hosts = set(LOOPBACK_HOSTS)
+        if host not in ("", "0.0.0.0", "::"):
+            server.allowed_hosts.add(host.strip("[]").lower())
+    server.session_manager = session_manager
+    server.auth_token = token or secrets.token_urlsafe(32)
+    return server
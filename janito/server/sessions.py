@@ -0,0 +1,341 @@
+"""
+Isolated conversation sessions sharing one warm janito process.
+
+Provider instances (and, through ``client_pool``, their HTTP clients) are created
+once per (provider, model) and reused by every session. Each ``Session`` owns its
+agent, driver thread, conversation history, working directory and tool permission
+mask. Tools resolve relative paths against the process working directory, so tool
+execution holds ``workdir_lease`` for the session's directory: calls from the same
+workdir run concurrently, while sessions with different workdirs take turns (model
+requests, the slow part, always overlap).
+"""
+
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from janito.driver_events import RequestFinished, ResponseReceived
+from janito.llm.message_parts import TextMessagePart
+from janito.tools.adapters.local.adapter import LocalToolsAdapter
+from janito.tools.tool_base import ToolPermissions
+
+
+# Tools that need a terminal on the server side
+HEADLESS_EXCLUDED_TOOLS = {"ask_user"}
+
+
+class WorkdirLease:
+    """
+    Shared/exclusive hold on the process working directory.
+    Any number of holders may use the same directory at once; a different
+    directory is only switched to (``os.chdir``) once all current holders left.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._workdir = None
+        self._holders = 0
+
+    @contextmanager
+    def hold(self, workdir):
+        workdir = os.path.abspath(workdir)
+        with self._condition:
+            while self._holders and self._workdir != workdir:
+                self._condition.wait()
+            if self._workdir != workdir or os.getcwd() != workdir:
+                os.chdir(workdir)
+                self._workdir = workdir
+            self._holders += 1
+        try:
+            yield workdir
+        finally:
+            with self._condition:
+                self._holders -= 1
+                if not self._holders:
+                    self._condition.notify_all()
+
+
+# Singleton instance for global use
+workdir_lease = WorkdirLease()
+
+
+class SessionToolsAdapter(LocalToolsAdapter):
+    """LocalToolsAdapter bound to one session's workdir and permission mask."""
+
+    def __init__(self, tools=None, workdir=None, allowed_permissions=None):
+        workdir = os.path.abspath(workdir or os.getcwd())
+        with workdir_lease.hold(workdir):
+            super().__init__(tools=tools, workdir=workdir)
+        self.allowed_permissions = allowed_permissions
+
+    def execute_by_name(self, tool_name, *args, **kwargs):
+        with workdir_lease.hold(self.workdir):
+            return super().execute_by_name(tool_name, *args, **kwargs)
+
+
+def intersect_permissions(requested, limit):
+    """Return the permissions present in both *requested* and *limit*."""
+    return ToolPermissions(
+        read=requested.read and limit.read,
+        write=requested.write and limit.write,
+        execute=requested.execute and limit.execute,
+    )
+
+
+def permissions_to_string(permissions):
+    return "".join(flag for flag, enabled in zip("rwx", permissions) if enabled)
+
+
+def _usage_to_dict(usage):
+    if usage is None or isinstance(usage, dict):
+        return usage
+    for method in ("model_dump", "dict"):
+        if callable(getattr(usage, method, None)):
+            try:
+                return getattr(usage, method)()
+            except Exception:
+                pass
+    try:
+        return dict(vars(usage))
+    except TypeError:
+        return str(usage)
+
+
+def summarize_result(result):
+    """Reduce the final event returned by ``agent.chat()`` to a JSON-friendly dict."""
+    if isinstance(result, ResponseReceived):
+        text = "".join(
+            part.content or ""
+            for part in result.parts
+            if isinstance(part, TextMessagePart)
+        )
+        metadata = result.metadata or {}
+        return {
+            "status": "success",
+            "text": text,
+            "usage": _usage_to_dict(metadata.get("usage")),
+        }
+    if isinstance(result, RequestFinished):
+        status = getattr(result.status, "value", result.status)
+        return {
+            "status": status or "error",
+            "text": None,
+            "error": result.error or result.reason,
+            "usage": _usage_to_dict(result.usage),
+        }
+    return {"status": "timeout", "text": None, "error": "No response from the driver"}
+
+
+class SessionBusyError(RuntimeError):
+    """The session is already running a prompt."""
+
+
+class Session:
+    """One conversation: an agent, its driver thread, history, workdir and permissions."""
+
+    def __init__(self, session_id, agent, provider, model, workdir, permissions):
+        self.session_id = session_id
+        self.agent = agent
+        self.provider = provider
+        self.model = model
+        self.workdir = workdir
+        self.permissions = permissions
+        self.created = time.time()
+        self.last_used = self.created
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self):
+        return self._lock.locked()
+
+    def send(self, prompt, wait=True):
+        """
+        Run one prompt to completion (tool loops included) and return its summary.
+        With ``wait=False``, raise SessionBusyError instead of waiting for a prompt
+        already in progress.
+        """
+        if not self._lock.acquire(blocking=wait):
+            raise SessionBusyError(self.session_id)
+        try:
+            started = time.time()
+            result = self.agent.chat(prompt=prompt)
+            summary = summarize_result(result)
+            if summary.get("text"):
+                self.agent.conversation_history.add_message(
+                    "assistant", summary["text"]
+                )
+            summary["elapsed"] = round(time.time() - started, 3)
+            summary["session_id"] = self.session_id
+            self.last_used = time.time()
+            return summary
+        finally:
+            self._lock.release()
+
+    def reset(self):
+        """Start a fresh conversation; agent, driver and permissions are kept."""
+        with self._lock:
+            self.agent.reset_conversation_history()
+
+    def cancel(self):
+        self.agent.cancel()
+
+    def close(self):
+        # Stop the driver thread (see LLMDriver._run)
+        self.agent.cancel()
+        if self.agent.input_queue is not None:
+            self.agent.input_queue.put(None)
+
+    def info(self):
+        return {
+            "session_id": self.session_id,
+            "provider": self.provider,
+            "model": self.model,
+            "workdir": self.workdir,
+            "permissions": permissions_to_string(self.permissions),
+            "messages": len(self.agent.conversation_history.get_history()),
+            "busy": self.busy,
+            "created": self.created,
+            "last_used": self.last_used,
+        }
+
+
+class SessionManager:
+    """
+    Creates and tracks sessions for one long-lived process.
+    Session permissions are capped by *max_permissions*; provider instances are
+    cached per (provider, model) so only the first session pays for their setup.
+    With *unrestricted* the session tools skip path security (``-u``).
+    """
+
+    def __init__(
+        self,
+        provider=None,
+        model=None,
+        workdir=None,
+        max_permissions=None,
+        profile="developer",
+        unrestricted=False,
+    ):
+        self.default_provider = provider
+        self.default_model = model
+        self.default_workdir = os.path.abspath(workdir or os.getcwd())
+        self.max_permissions = max_permissions or ToolPermissions(read=True)
+        self.default_profile = profile
+        self.unrestricted = unrestricted
+        self._sessions = {}
+        self._providers = {}
+        self._lock = threading.Lock()
+
+    def _get_provider(self, provider, model):
+        from janito.cli.core.runner import prepare_llm_driver_config
+        from janito.provider_registry import ProviderRegistry
+
+        with self._lock:
+            key = (provider, model)
+            cached = self._providers.get(key)
+            if cached is None:
+                args = SimpleNamespace(provider=provider, model=model, verbose=False)
+                provider, llm_driver_config, _ = prepare_llm_driver_config(args, {})
+                if provider is None or llm_driver_config is None:
+                    raise ValueError(
+                        f"Cannot configure provider {provider!r} with model {model!r}"
+                    )
+                instance = ProviderRegistry().get_instance(provider, llm_driver_config)
+                if instance is None:
+                    raise ValueError(f"Unknown provider {provider!r}")
+                cached = (provider, instance, llm_driver_config)
+                self._providers[key] = cached
+            return cached
+
+    def add_provider(self, provider, model, provider_instance, llm_driver_config):
+        """Reuse an already configured provider instance for (provider, model)."""
+        with self._lock:
+            self._providers[(provider, model)] = (
+                provider,
+                provider_instance,
+                llm_driver_config,
+            )
+
+    def create_session(
+        self,
+        provider=None,
+        model=None,
+        workdir=None,
+        permissions=None,
+        profile=None,
+        system_prompt=None,
+    ):
+        from janito.agent.setup_agent import create_configured_agent
+        from janito.tools import local_tools_adapter
+
+        workdir = os.path.abspath(workdir or self.default_workdir)
+        if not os.path.isdir(workdir):
+            raise ValueError(f"Workdir does not exist: {workdir}")
+        if isinstance(permissions, str):
+            from janito.tools.permissions_parse import parse_permissions_string
+
+            permissions = parse_permissions_string(permissions)
+        permissions = intersect_permissions(
+            permissions or self.max_permissions, self.max_permissions
+        )
+        provider_name, provider_instance, llm_driver_config = self._get_provider(
+            provider or self.default_provider, model or self.default_model
+        )
+        tools_adapter = SessionToolsAdapter(
+            tools=[
+                entry["class"]
+                for name, entry in local_tools_adapter._tools.items()
+                if name not in HEADLESS_EXCLUDED_TOOLS
+            ],
+            workdir=workdir,
+            allowed_permissions=permissions,
+        )
+        if self.unrestricted:
+            tools_adapter.unrestricted_paths = True
+        agent = create_configured_agent(
+            provider_instance=provider_instance,
+            llm_driver_config=llm_driver_config,
+            role="developer",
+            allowed_permissions=permissions,
+            profile=None if system_prompt else (profile or self.default_profile),
+            profile_system_prompt=system_prompt,
+        )
+        agent.tools_adapter = tools_adapter
+        if agent.driver is not None:
+            agent.driver.tools_adapter = tools_adapter
+        session = Session(
+            uuid.uuid4().hex,
+            agent,
+            provider_name,
+            llm_driver_config.model,
+            workdir,
+            permissions,
+        )
+        with self._lock:
+            self._sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id):
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def list_sessions(self):
+        with self._lock:
+            return list(self._sessions.values())
+
+    def close_session(self, session_id):
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None:
+            session.close()
+        return session is not None
+
+    def shutdown(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
@@ -87,10 +87,12 @@ class LocalToolsAdapter(ToolsAdapter):
             "class": tool_class,
             "instance": instance,
         }
+        self._bump_registry_version()
 
     def unregister_tool(self, name: str):
         if name in self._tools:
             del self._tools[name]
+            self._bump_registry_version()
 
     def disable_tool(self, name: str):
         self.unregister_tool(name)
@@ -186,6 +188,7 @@ class LocalToolsAdapter(ToolsAdapter):
             "class": tool.__class__,
             "instance": tool,
         }
+        self._bump_registry_version()
 
 
 # -------------------------------------------------------------------------
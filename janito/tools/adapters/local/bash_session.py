@@ -0,0 +1,268 @@
+"""
+Persistent bash session used by run_bash_command when the ``bash_session`` config
+key is enabled.
+
+One ``bash`` process is kept for the whole agent session instead of starting one
+per command, so ``cd``, exported variables and shell functions carry over between
+calls. Each command is handed to the shell through a quoted here-document and run
+with ``eval`` (with stdin from /dev/null), so syntax errors in the command cannot
+break the session protocol. After the command the shell prints a per-command
+sentinel with the exit status on stdout and the same sentinel on stderr; the
+readers stop at the sentinels. Output that background jobs write between two
+commands is discarded before the next command starts; output they write while a
+command runs is reported with that command, as in an interactive shell.
+
+Output goes to a small ring of size-capped files in one session directory,
+reused in rotation, rather than to two new temporary files per command.
+A timed-out command kills the shell; the next command starts a fresh one.
+"""
+
+import atexit
+import codecs
+import os
+import select
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import uuid
+
+RING_SIZE = 8
+MAX_OUTPUT_FILE_BYTES = 4 * 1024 * 1024
+READ_CHUNK = 64 * 1024
+
+
+def bash_session_enabled():
+    from janito.config import config
+
+    value = config.get("bash_session")
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+class CappedOutput:
+    """A text output file that stores at most *max_bytes* characters."""
+
+    def __init__(self, path, max_bytes=MAX_OUTPUT_FILE_BYTES):
+        self.name = path
+        self.max_bytes = max_bytes
+        self.written = 0
+        self.lines = 0
+        self.truncated = False
+        self._last = ""
+        self._file = open(path, "w", encoding="utf-8", errors="replace")
+
+    def write(self, text):
+        if not text:
+            return
+        self.lines += text.count("\n")
+        self._last = text[-1]
+        room = self.max_bytes - self.written
+        if len(text) > room:
+            text = text[: max(room, 0)]
+            self.truncated = True
+        if text:
+            self._file.write(text)
+            self.written += len(text)
+
+    def close(self):
+        if self._last and self._last != "\n":
+            self.lines += 1
+            self._last = ""
+        self._file.close()
+
+    def read(self):
+        with open(self.name, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+
+class OutputRing:
+    """Rotating stdout/stderr file slots in one session directory."""
+
+    def __init__(self, size=RING_SIZE, max_bytes=MAX_OUTPUT_FILE_BYTES):
+        self.size = size
+        self.max_bytes = max_bytes
+        self.directory = tempfile.mkdtemp(prefix="janito_bash_")
+        self._next = 0
+
+    def open_pair(self):
+        slot = self._next % self.size
+        self._next += 1
+        return (
+            CappedOutput(
+                os.path.join(self.directory, f"stdout_{slot}.log"), self.max_bytes
+            ),
+            CappedOutput(
+                os.path.join(self.directory, f"stderr_{slot}.log"), self.max_bytes
+            ),
+        )
+
+    def cleanup(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class BashSession:
+    """A long-lived bash process that runs one command at a time."""
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        self.ring = None
+
+    def _start(self):
+        env = os.environ.copy()
+        env["PYTHONIOENCODING"] = "utf-8"
+        env["LC_ALL"] = "C.UTF-8"
+        env["LANG"] = "C.UTF-8"
+        self._process = subprocess.Popen(
+            ["bash", "--noprofile", "--norc"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            start_new_session=os.name != "nt",
+        )
+        if self.ring is None:
+            self.ring = OutputRing()
+
+    def _kill(self):
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            if os.name != "nt":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            pass
+        process.wait()
+
+    @staticmethod
+    def _pump(stream, marker, sink, report, result, status_line=False):
+        """
+        Copy *stream* to *sink* up to *marker* and append what follows it to
+        *result* (None if the stream ended first). With *status_line*, reading
+        continues until the line after the marker is complete.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        fd = stream.fileno()
+        pending = ""
+        found = False
+        while True:
+            data = os.read(fd, READ_CHUNK)
+            pending += decoder.decode(data, final=not data)
+            if not found:
+                index = pending.find(marker)
+                if index >= 0:
+                    found = True
+                    text, pending = pending[:index], pending[index + len(marker) :]
+                else:
+                    # Hold back a possible partial marker at the end
+                    cut = len(pending) if not data else len(pending) - len(marker) + 1
+                    text, pending = pending[: max(cut, 0)], pending[max(cut, 0) :]
+                if text:
+                    sink.write(text)
+                    if report:
+                        report(text)
+            if not data or (found and (not status_line or "\n" in pending)):
+                break
+        result.append(pending if found else None)
+
+    @staticmethod
+    def _discard_pending(process):
+        """Drop output written since the previous command ended (background jobs)."""
+        if os.name == "nt":
+            return
+        fds = [process.stdout.fileno(), process.stderr.fileno()]
+        while fds:
+            ready, _, _ = select.select(fds, [], [], 0)
+            if not ready:
+                return
+            for fd in ready:
+                if not os.read(fd, READ_CHUNK):
+                    fds.remove(fd)
+
+    def run(self, command, timeout, report_stdout=None, report_stderr=None):
+        """
+        Run *command*. Returns (return code or None on timeout, stdout CappedOutput,
+        stderr CappedOutput).
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+            process = self._process
+            self._discard_pending(process)
+            token = uuid.uuid4().hex
+            marker = f"__janito_done_{token}__"
+            script = (
+                f"IFS= read -r -d '' __janito_cmd <<'__JANITO_CMD_{token}'\n"
+                f"{command}\n"
+                f"__JANITO_CMD_{token}\n"
+                'eval "$__janito_cmd" </dev/null\n'
+                "__janito_rc=$?\n"
+                f"printf '%s%d\\n' '{marker}' \"$__janito_rc\"\n"
+                f"printf '%s' '{marker}' >&2\n"
+            )
+            stdout_file, stderr_file = self.ring.open_pair()
+            out_result, err_result = [], []
+            readers = [
+                threading.Thread(
+                    target=self._pump,
+                    args=(process.stdout, marker, stdout_file, report_stdout),
+                    kwargs={"result": out_result, "status_line": True},
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._pump,
+                    args=(process.stderr, marker, stderr_file, report_stderr),
+                    kwargs={"result": err_result},
+                    daemon=True,
+                ),
+            ]
+            for reader in readers:
+                reader.start()
+            try:
+                process.stdin.write(script.encode("utf-8"))
+                process.stdin.flush()
+            except OSError:
+                pass
+            readers[0].join(timeout)
+            if readers[0].is_alive():
+                self._kill()
+                return_code = None
+            else:
+                readers[1].join(timeout)
+                tail = out_result[-1]
+                if tail is None:
+                    # The command ended the shell (exit, exec, set -e...)
+                    return_code = process.wait()
+                    self._process = None
+                else:
+                    return_code = int(tail.split("\n", 1)[0] or 0)
+            for reader in readers:
+                reader.join(1)
+            stdout_file.close()
+            stderr_file.close()
+            return return_code, stdout_file, stderr_file
+
+    def close(self):
+        with self._lock:
+            self._kill()
+            if self.ring is not None:
+                self.ring.cleanup()
+                self.ring = None
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_bash_session():
+    """Return the process-wide BashSession."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = BashSession()
+            atexit.register(_session.close)
+        return _session
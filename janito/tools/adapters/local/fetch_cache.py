@@ -0,0 +1,347 @@
+"""
+On-disk HTTP response cache for fetch_url.
+
+The cache lives in ``~/.janito/cache/fetch_url/``. Response bodies and the text
+extracted from them are stored gzip-compressed under ``objects/``, named by the
+SHA-256 of the body text, so identical pages fetched from different URLs share
+one copy and the text of a page is extracted once. ``responses.sqlite3`` maps
+each cached URL to its body digest and HTTP validators (ETag, Last-Modified),
+and records when it expires and when it was last used. Cached HTTP errors are
+kept in the same database.
+
+Freshness follows Cache-Control (no-store, no-cache, max-age, s-maxage), then
+Expires, then a heuristic of 10% of the time since Last-Modified (at most one
+day). A fresh entry is served without a request. A stale one with validators is
+revalidated with a conditional request, and a 304 reply keeps the stored body.
+Responses with neither freshness nor validators are not stored.
+
+The total stored size is bounded by the ``fetch_url_cache_max_bytes`` config key
+(default 64 MiB); least recently used entries are evicted first. Concurrent
+janito processes are safe: objects are written to a temporary file and renamed
+into place, and the index relies on SQLite locking. An index row whose object is
+missing is treated as a miss.
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from email.utils import parsedate_to_datetime
+
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite: only the session cache is used
+    sqlite3 = None
+
+INDEX_FILE = "responses.sqlite3"
+INDEX_FORMAT = 1
+OBJECTS_DIR = "objects"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+MAX_HEURISTIC_LIFETIME = 24 * 3600
+
+CachedResponse = namedtuple(
+    "CachedResponse", "digest etag last_modified expires"
+)
+
+
+def body_digest(body):
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def parse_cache_control(value):
+    """Return the directives of a Cache-Control header as a dict."""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"')
+    return directives
+
+
+def _http_date(value):
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def freshness_lifetime(headers, now=None):
+    """
+    Return how many seconds a response with *headers* stays fresh, or None if it
+    must not be stored.
+    """
+    now = time.time() if now is None else now
+    cc = parse_cache_control(headers.get("Cache-Control"))
+    if "no-store" in cc:
+        return None
+    if "no-cache" in cc:
+        return 0
+    for directive in ("s-maxage", "max-age"):
+        if directive in cc:
+            try:
+                return max(0, int(cc[directive]))
+            except ValueError:
+                return 0
+    date = _http_date(headers.get("Date")) or now
+    expires = headers.get("Expires")
+    if expires is not None:
+        expires_at = _http_date(expires)
+        return max(0, expires_at - date) if expires_at else 0
+    last_modified = _http_date(headers.get("Last-Modified"))
+    if last_modified:
+        return min(MAX_HEURISTIC_LIFETIME, max(0, (date - last_modified) / 10))
+    return 0
+
+
+def get_cache_max_bytes():
+    from janito.config import config
+
+    try:
+        value = config.get("fetch_url_cache_max_bytes")
+        return max(0, int(value)) if value not in (None, "") else DEFAULT_MAX_BYTES
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_BYTES
+
+
+class FetchCache:
+    """
+    Response cache in *directory*, bounded to *max_bytes* of stored objects
+    (read from the config on first use when not given).
+    """
+
+    def __init__(self, directory, max_bytes=None):
+        self.directory = str(directory)
+        self._max_bytes = max_bytes
+        self.db_path = os.path.join(self.directory, INDEX_FILE)
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def max_bytes(self):
+        # Resolved lazily: tools are built while janito.config is still importing
+        if self._max_bytes is None:
+            self._max_bytes = get_cache_max_bytes()
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.join(self.directory, OBJECTS_DIR), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_FORMAT:
+                conn.execute("DROP TABLE IF EXISTS responses")
+                conn.execute("DROP TABLE IF EXISTS errors")
+                conn.execute(f"PRAGMA user_version = {INDEX_FORMAT}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "url TEXT, digest TEXT, etag TEXT, last_modified TEXT, "
+                "expires REAL, accessed REAL, size INTEGER)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS errors (url TEXT PRIMARY KEY, "
+                "status_code INTEGER, message TEXT, timestamp REAL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql, params=(), commit=False):
+        """Run one statement; returns its rows, or [] if the index is unusable."""
+        if sqlite3 is None:
+            return []
+        with self._lock:
+            try:
+                conn = self._connect()
+                rows = conn.execute(sql, params).fetchall()
+                if commit:
+                    conn.commit()
+                return rows
+            except (OSError, sqlite3.Error):
+                return []
+
+    def _object_path(self, digest, kind):
+        return os.path.join(
+            self.directory, OBJECTS_DIR, digest[:2], f"{digest}.{kind}.gz"
+        )
+
+    def _read_object(self, digest, kind):
+        try:
+            with open(self._object_path(digest, kind), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+
+    def _write_object(self, digest, kind, text):
+        """Store *text* unless already present; returns its compressed size."""
+        path = self._object_path(digest, kind)
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            pass
+        data = gzip.compress(text.encode("utf-8"), mtime=0)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return len(data)
+
+    def lookup(self, key):
+        """Return the CachedResponse for *key*, or None."""
+        rows = self._execute(
+            "SELECT digest, etag, last_modified, expires FROM responses "
+            "WHERE key = ?",
+            (key,),
+        )
+        return CachedResponse(*rows[0]) if rows else None
+
+    def read_body(self, key, entry):
+        """Return the stored body of *entry*, or None (dropping *key*) if missing."""
+        body = self._read_object(entry.digest, "body")
+        if body is None:
+            self._execute("DELETE FROM responses WHERE key = ?", (key,), commit=True)
+            return None
+        self._execute(
+            "UPDATE responses SET accessed = ? WHERE key = ?",
+            (time.time(), key),
+            commit=True,
+        )
+        return body
+
+    def store(self, key, url, body, headers):
+        """Store a 200 response; returns False if it is not cacheable."""
+        lifetime = freshness_lifetime(headers)
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if sqlite3 is None or lifetime is None:
+            return False
+        if not lifetime and not (etag or last_modified):
+            return False
+        digest = body_digest(body)
+        try:
+            size = self._write_object(digest, "body", body)
+        except OSError:
+            return False
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, digest, etag, last_modified, now + lifetime, now, size),
+            commit=True,
+        )
+        self.evict()
+        return True
+
+    def refresh(self, key, entry, headers):
+        """Record a 304 reply: new expiry and any updated validators."""
+        lifetime = freshness_lifetime(headers) or 0
+        now = time.time()
+        self._execute(
+            "UPDATE responses SET etag = ?, last_modified = ?, expires = ?, "
+            "accessed = ? WHERE key = ?",
+            (
+                headers.get("ETag") or entry.etag,
+                headers.get("Last-Modified") or entry.last_modified,
+                now + lifetime,
+                now,
+                key,
+            ),
+            commit=True,
+        )
+
+    def get_text(self, body, extract):
+        """Return extract(body), reusing the text stored for cached bodies."""
+        digest = body_digest(body)
+        if not self._execute(
+            "SELECT 1 FROM responses WHERE digest = ? LIMIT 1", (digest,)
+        ):
+            return extract(body)
+        text = self._read_object(digest, "text")
+        if text is not None:
+            return text
+        text = extract(body)
+        try:
+            size = self._write_object(digest, "text", text)
+        except OSError:
+            return text
+        self._execute(
+            "UPDATE responses SET size = size + ? WHERE digest = ?",
+            (size, digest),
+            commit=True,
+        )
+        return text
+
+    def evict(self):
+        """Drop least recently used entries until the total size fits."""
+        if not self.max_bytes:
+            return
+        rows = self._execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+        total = rows[0][0] if rows else 0
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, digest, size in self._execute(
+            "SELECT key, digest, size FROM responses ORDER BY accessed"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((key, digest))
+            total -= size
+        for key, digest in victims:
+            self._execute("DELETE FROM responses WHERE key = ?", (key,), commit=True)
+            if not self._execute(
+                "SELECT 1 FROM responses WHERE digest = ? LIMIT 1", (digest,)
+            ):
+                for kind in ("body", "text"):
+                    try:
+                        os.unlink(self._object_path(digest, kind))
+                    except OSError:
+                        pass
+
+    def get_error(self, url):
+        """Return (status_code, message, timestamp) of a cached error, or None."""
+        rows = self._execute(
+            "SELECT status_code, message, timestamp FROM errors WHERE url = ?",
+            (url,),
+        )
+        return rows[0] if rows else None
+
+    def set_error(self, url, status_code, message):
+        self._execute(
+            "INSERT OR REPLACE INTO errors VALUES (?, ?, ?, ?)",
+            (url, status_code, message, time.time()),
+            commit=True,
+        )
+
+    def delete_error(self, url):
+        self._execute("DELETE FROM errors WHERE url = ?", (url,), commit=True)
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_fetch_cache(directory):
+    """Return the shared FetchCache for *directory*."""
+    directory = os.path.abspath(str(directory))
+    with _caches_lock:
+        cache = _caches.get(directory)
+        if cache is None:
+            cache = _caches[directory] = FetchCache(directory)
+        return cache
@@ -6,6 +6,7 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 from typing import Dict, Any, Optional
 from janito.tools.adapters.local.adapter import register_local_tool
+from janito.tools.adapters.local.fetch_cache import get_fetch_cache
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.i18n import tr
@@ -18,19 +19,22 @@ class FetchUrlTool(ToolBase):
     """
     Fetch the content of a web page and extract its text.
 
-    This tool implements a **session-based caching mechanism** that provides
-    **in-memory caching** for the lifetime of the tool instance. URLs are cached
-    in RAM during the session, providing instant access to previously fetched
-    content without making additional HTTP requests.
+    Responses are cached at two levels:
 
     **Session Cache Behavior:**
     - **Lifetime**: Cache exists for the lifetime of the FetchUrlTool instance
-    - **Scope**: In-memory (RAM) cache, not persisted to disk
-    - **Storage**: Successful responses are cached as raw HTML content
-    - **Key**: Cache key is the exact URL string
-    - **Invalidation**: Cache is automatically cleared when the tool instance is destroyed
+    - **Scope**: In-memory (RAM) cache keyed by the exact URL string
     - **Performance**: Subsequent requests for the same URL return instantly
 
+    **Disk Cache Behavior:**
+    - **Location**: ``~/.janito/cache/fetch_url``, shared by all janito processes
+    - **Storage**: Compressed page bodies and extracted text, stored once per distinct content
+    - **Freshness**: Honours Cache-Control and Expires; stale pages are revalidated with
+      ETag/Last-Modified conditional requests, and an unchanged page is not downloaded again
+    - **Size**: Bounded by the ``fetch_url_cache_max_bytes`` config key; least
+      recently used pages are evicted first
+    - **Scope**: Requests with custom headers or cookies bypass the disk cache
+
     **Error Cache Behavior:**
     - HTTP 403 errors: Cached for 24 hours (more permanent)
     - HTTP 404 errors: Cached for 1 hour (temporary)
@@ -63,11 +67,10 @@ class FetchUrlTool(ToolBase):
         super().__init__()
         self.cache_dir = Path.home() / ".janito" / "cache" / "fetch_url"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "error_cache.json"
         self.session_cache = (
             {}
         )  # In-memory session cache - lifetime matches tool instance
-        self._load_cache()
+        self.http_cache = get_fetch_cache(self.cache_dir)
 
         # Browser-like session with cookies and headers
         self.session = requests.Session()
@@ -87,25 +90,6 @@ class FetchUrlTool(ToolBase):
         self.cookies_file = self.cache_dir / "cookies.json"
         self._load_cookies()
 
-    def _load_cache(self):
-        """Load error cache from disk."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.error_cache = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.error_cache = {}
-        else:
-            self.error_cache = {}
-
-    def _save_cache(self):
-        """Save error cache to disk."""
-        try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.error_cache, f, indent=2)
-        except IOError:
-            pass  # Silently fail if we can't write cache
-
     def _load_cookies(self):
         """Load cookies from disk into session."""
         if self.cookies_file.exists():
@@ -140,39 +124,34 @@ class FetchUrlTool(ToolBase):
         Check if we have a cached error for this URL.
         Returns (error_message, is_cached) tuple.
         """
-        if url not in self.error_cache:
+        entry = self.http_cache.get_error(url)
+        if entry is None:
             return None, False
 
-        entry = self.error_cache[url]
+        status_code, message, timestamp = entry
         current_time = time.time()
 
         # Different expiration times for different status codes
-        if entry["status_code"] == 403:
+        if status_code == 403:
             # Cache 403 errors for 24 hours (more permanent)
             expiration_time = 24 * 3600
-        elif entry["status_code"] == 404:
+        elif status_code == 404:
             # Cache 404 errors for 1 hour (more temporary)
             expiration_time = 3600
         else:
             # Cache other 4xx errors for 30 minutes
             expiration_time = 1800
 
-        if current_time - entry["timestamp"] > expiration_time:
+        if current_time - timestamp > expiration_time:
             # Cache expired, remove it
-            del self.error_cache[url]
-            self._save_cache()
+            self.http_cache.delete_error(url)
             return None, False
 
-        return entry["message"], True
+        return message, True
 
     def _cache_error(self, url: str, status_code: int, message: str):
         """Cache an HTTP error response."""
-        self.error_cache[url] = {
-            "status_code": status_code,
-            "message": message,
-            "timestamp": time.time(),
-        }
-        self._save_cache()
+        self.http_cache.set_error(url, status_code, message)
 
     def _fetch_url_content(
         self,
@@ -184,12 +163,60 @@ class FetchUrlTool(ToolBase):
     ) -> str:
         """Fetch URL content and handle HTTP errors.
 
-        Implements two-tier caching:
+        Implements three-tier caching:
         1. Session cache: In-memory cache for successful responses (lifetime = tool instance)
-        2. Error cache: Persistent disk cache for HTTP errors with different expiration times
+        2. Disk cache: Successful responses, served while fresh and revalidated when stale
+        3. Error cache: Persistent disk cache for HTTP errors with different expiration times
 
         Also implements URL whitelist checking and browser-like behavior.
         """
+        early_response = self._cached_or_blocked(url)
+        if early_response is not None:
+            return early_response
+
+        # Custom headers or cookies may change the response: bypass the disk cache
+        cache_key = None if headers or cookies else f"{follow_redirects}:{url}"
+        content, cached = self._disk_cache_entry(cache_key)
+        if content is not None:
+            self.session_cache[url] = content
+            return content
+
+        try:
+            # Merge custom headers with default ones
+            request_headers = self.session.headers.copy()
+            if headers:
+                request_headers.update(headers)
+
+            # Merge custom cookies
+            if cookies:
+                self.session.cookies.update(cookies)
+
+            content, response = self._get_response(
+                url, request_headers, timeout, follow_redirects, cache_key, cached
+            )
+            if response is not None:
+                response.raise_for_status()
+                content = response.text
+
+                # Save cookies after successful request
+                self._save_cookies()
+                if cache_key:
+                    self.http_cache.store(cache_key, url, content, response.headers)
+
+            # Cache successful responses in session cache
+            self.session_cache[url] = content
+            return content
+        except requests.exceptions.HTTPError as http_err:
+            return self._handle_http_error(url, http_err)
+        except Exception as err:
+            self.report_error(
+                tr("❗ Error"),
+                ReportAction.READ,
+            )
+            return tr("Error")
+
+    def _cached_or_blocked(self, url: str) -> Optional[str]:
+        """Return the result for *url* when no request is needed, else None."""
         # Check URL whitelist
         from janito.tools.url_whitelist import get_url_whitelist_manager
 
@@ -218,69 +245,87 @@ class FetchUrlTool(ToolBase):
                 ReportAction.READ,
             )
             return cached_error
+        return None
 
-        try:
-            # Merge custom headers with default ones
-            request_headers = self.session.headers.copy()
-            if headers:
-                request_headers.update(headers)
-
-            # Merge custom cookies
-            if cookies:
-                self.session.cookies.update(cookies)
-
+    def _disk_cache_entry(self, cache_key: Optional[str]):
+        """
+        Look up *cache_key* in the disk cache. Returns (content, None) for a fresh
+        copy, or (None, entry) where entry is the stale copy to revalidate or None.
+        """
+        cached = self.http_cache.lookup(cache_key) if cache_key else None
+        if cached and cached.expires > time.time():
+            content = self.http_cache.read_body(cache_key, cached)
+            if content is not None:
+                return content, None
+            cached = None
+        return None, cached
+
+    def _get_response(
+        self, url, request_headers, timeout, follow_redirects, cache_key, cached
+    ):
+        """
+        GET *url*, revalidating the stale disk cache entry *cached* if any.
+        Returns (content, None) when the server confirmed the cached copy, or
+        (None, response) with a full response.
+        """
+        if cached and cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+        response = self.session.get(
+            url,
+            timeout=timeout,
+            headers=request_headers,
+            allow_redirects=follow_redirects,
+        )
+        if response.status_code == 304 and cached:
+            content = self.http_cache.read_body(cache_key, cached)
+            if content is not None:
+                self.http_cache.refresh(cache_key, cached, response.headers)
+                return content, None
+            # Stored body vanished: fetch it again unconditionally
+            request_headers.pop("If-None-Match", None)
+            request_headers.pop("If-Modified-Since", None)
             response = self.session.get(
                 url,
                 timeout=timeout,
                 headers=request_headers,
                 allow_redirects=follow_redirects,
             )
-            response.raise_for_status()
-            content = response.text
-
-            # Save cookies after successful request
-            self._save_cookies()
+        return None, response
+
+    def _handle_http_error(self, url: str, http_err) -> str:
+        """Report an HTTP error response and return its error message."""
+        status_code = http_err.response.status_code if http_err.response else None
+        if status_code and 400 <= status_code < 500:
+            error_message = tr(
+                "HTTP {status_code}",
+                status_code=status_code,
+            )
+            # Cache 403 and 404 errors
+            if status_code in [403, 404]:
+                self._cache_error(url, status_code, error_message)
 
-            # Cache successful responses in session cache
-            self.session_cache[url] = content
-            return content
-        except requests.exceptions.HTTPError as http_err:
-            status_code = http_err.response.status_code if http_err.response else None
-            if status_code and 400 <= status_code < 500:
-                error_message = tr(
-                    "HTTP {status_code}",
+            self.report_error(
+                tr(
+                    "❗ HTTP {status_code}",
                     status_code=status_code,
-                )
-                # Cache 403 and 404 errors
-                if status_code in [403, 404]:
-                    self._cache_error(url, status_code, error_message)
-
-                self.report_error(
-                    tr(
-                        "❗ HTTP {status_code}",
-                        status_code=status_code,
-                    ),
-                    ReportAction.READ,
-                )
-                return error_message
-            else:
-                self.report_error(
-                    tr(
-                        "❗ HTTP {status_code}",
-                        status_code=status_code or "Error",
-                    ),
-                    ReportAction.READ,
-                )
-                return tr(
-                    "HTTP {status_code}",
-                    status_code=status_code or "Error",
-                )
-        except Exception as err:
+                ),
+                ReportAction.READ,
+            )
+            return error_message
+        else:
             self.report_error(
-                tr("❗ Error"),
+                tr(
+                    "❗ HTTP {status_code}",
+                    status_code=status_code or "Error",
+                ),
                 ReportAction.READ,
             )
-            return tr("Error")
+            return tr(
+                "HTTP {status_code}",
+                status_code=status_code or "Error",
+            )
 
     def _extract_and_clean_text(self, html_content: str) -> str:
         """Extract and clean text from HTML content."""
@@ -394,8 +439,8 @@ class FetchUrlTool(ToolBase):
         ):
             return html_content
 
-        # Extract and clean text
-        text = self._extract_and_clean_text(html_content)
+        # Extract and clean text (reused from the disk cache for known pages)
+        text = self.http_cache.get_text(html_content, self._extract_and_clean_text)
 
         # Filter by search strings if provided
         if search_strings:
@@ -0,0 +1,538 @@
+"""
+Outlines for brace-delimited languages (JS/TS, Go, Rust, Java and the C family)
+without a parser dependency.
+
+A single regex tokenizer per language drops comments, strings, character
+literals, JS regex literals and preprocessor lines and yields identifiers and
+punctuation with their line numbers. A structural pass then tracks ``{ }``
+nesting: at each ``{`` opened directly in a container scope (the file, a class, a
+namespace, an impl block...) the tokens of the statement before it are classified
+by a small per-language function. Declarations become outline items whose range ends at the matching
+``}``; function bodies are not looked into, which keeps the outline compact.
+
+Items use the same keys as the Python outline (type, name, start, end, parent,
+signature, docstring), so they share its table formatting and the symbol index.
+"""
+
+import re
+from collections import namedtuple
+from typing import Dict, List
+
+Token = namedtuple("Token", "value line kind")
+
+_COMMON_PATTERNS = [
+    ("nl", r"\n"),
+    ("ws", r"[ \t\r\f\v]+"),
+    ("lc", r"//[^\n]*"),
+    ("bc", r"/\*[\s\S]*?(?:\*/|\Z)"),
+    ("str", r'"(?:\\[\s\S]|[^"\\\n])*"'),
+]
+_IDENT_PATTERNS = [
+    ("id", r"[A-Za-z_$][\w$]*"),
+    ("num", r"\d[\w.]*"),
+    ("p", r"."),
+]
+_PREPROCESSOR = ("pp", r"(?m:^[ \t]*#(?:\\\n|[^\n])*)")
+_CHAR = ("chr", r"'(?:\\[\s\S]|[^'\\\n])*'")
+_RUST_CHAR = ("chr", r"'(?:\\[^']{1,10}|[^'\\\n])'")
+_RUST_RAW = ("raw", r'b?r(?P<hashes>#*)"[\s\S]*?"(?P=hashes)')
+_BACKTICK = ("raw", r"`(?:\\[\s\S]|[^`\\])*`")
+_JS_REGEX = re.compile(r"/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[A-Za-z]*")
+# After these keywords a "/" starts a regex literal rather than a division
+_EXPRESSION_KEYWORDS = {
+    "return",
+    "typeof",
+    "instanceof",
+    "in",
+    "of",
+    "new",
+    "delete",
+    "void",
+    "throw",
+    "case",
+    "do",
+    "else",
+    "yield",
+    "await",
+}
+
+
+def _compile(patterns):
+    return re.compile("|".join(f"(?P<{name}>{body})" for name, body in patterns))
+
+
+def tokenize(text, scanner, newline_ends_statement=False, regex_literals=False):
+    """
+    Return the identifier/punctuation/string Tokens of *text*. With
+    *regex_literals* (JS/TS), a ``/`` where an expression can start begins a
+    regex literal, which is dropped like a string.
+    """
+    tokens = []
+    line = 1
+    pos = 0
+    while pos < len(text):
+        match = scanner.match(text, pos)
+        pos = match.end()
+        kind, value = match.lastgroup, match.group()
+        if regex_literals and value == "/" and _starts_expression(tokens):
+            literal = _JS_REGEX.match(text, match.start())
+            if literal:
+                kind, value = "str", literal.group()
+                pos = literal.end()
+        line = _add_token(tokens, kind, value, line, newline_ends_statement)
+    return tokens
+
+
+def _add_token(tokens, kind, value, line, newline_ends_statement):
+    """Append the Token for one scanner match; returns the line after it."""
+    if kind == "nl":
+        if newline_ends_statement and tokens and _ends_go_statement(tokens[-1]):
+            tokens.append(Token(";", line, "p"))
+        return line + 1
+    if kind in ("ws", "lc", "pp", "bc"):
+        return line + value.count("\n")
+    if kind in ("str", "raw", "chr"):
+        tokens.append(Token('""', line, "str"))
+        return line + value.count("\n")
+    tokens.append(Token(value, line, kind))
+    return line
+
+
+def _starts_expression(tokens):
+    """True if a ``/`` after *tokens* cannot be a division operator."""
+    if not tokens:
+        return True
+    last = tokens[-1]
+    if last.kind == "id":
+        return last.value in _EXPRESSION_KEYWORDS
+    return last.kind == "p" and last.value not in (")", "]", "}")
+
+
+def _ends_go_statement(token):
+    # Go's automatic semicolon insertion, reduced to what the outline needs
+    return token.kind in ("id", "num", "str") or token.value in (")", "]", "}")
+
+
+def _drop_balanced(tokens, i, open_char, close_char):
+    """Return the index after the balanced group starting at tokens[i]."""
+    depth = 0
+    while i < len(tokens):
+        if tokens[i].value == open_char:
+            depth += 1
+        elif tokens[i].value == close_char:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _strip_annotations(tokens):
+    """Drop Java/TS ``@Annotation(...)`` and Rust ``#[attr]`` sequences."""
+    result = []
+    i = 0
+    while i < len(tokens):
+        value = tokens[i].value
+        if value == "@" and i + 1 < len(tokens) and tokens[i + 1].kind == "id":
+            i += 2
+            while (
+                i + 1 < len(tokens)
+                and tokens[i].value == "."
+                and tokens[i + 1].kind == "id"
+            ):
+                i += 2
+            if i < len(tokens) and tokens[i].value == "(":
+                i = _drop_balanced(tokens, i, "(", ")")
+            continue
+        if value == "#" and i + 1 < len(tokens):
+            j = i + 1 + (tokens[i + 1].value == "!")
+            if j < len(tokens) and tokens[j].value == "[":
+                i = _drop_balanced(tokens, j, "[", "]")
+                continue
+        result.append(tokens[i])
+        i += 1
+    return result
+
+
+def _first_paren(tokens):
+    for i, token in enumerate(tokens):
+        if token.value == "(":
+            return i
+    return -1
+
+
+def _name_before(tokens, i):
+    """Return (name token, qualifier) for the identifier ending just before tokens[i]."""
+    j = i - 1
+    if j >= 0 and tokens[j].value == ">":  # skip generic parameters: name<T>(
+        depth = 0
+        while j >= 0:
+            if tokens[j].value == ">":
+                depth += 1
+            elif tokens[j].value == "<":
+                depth -= 1
+                if depth == 0:
+                    break
+            j -= 1
+        j -= 1
+    if j < 0 or tokens[j].kind != "id":
+        return None, ""
+    qualifier = ""
+    if j >= 3 and tokens[j - 1].value == ":" and tokens[j - 2].value == ":":
+        if tokens[j - 3].kind == "id":
+            qualifier = tokens[j - 3].value
+    return tokens[j], qualifier
+
+
+def _next_identifier(tokens, i, skip=()):
+    for token in tokens[i:]:
+        if token.kind == "id" and token.value not in skip:
+            return token
+        if token.kind != "id" and token.value not in ("*", "&"):
+            return None
+    return None
+
+
+def _item(kind, name_token, parent, lines):
+    line = name_token.line
+    return {
+        "type": kind,
+        "name": name_token.value,
+        "start": line,
+        "end": line,
+        "parent": parent,
+        "signature": lines[line - 1].strip() if line <= len(lines) else "",
+        "docstring": "",
+    }
+
+
+# Declaration = (item kind, name token, parent, opens a container scope)
+
+_CONTROL_WORDS = {
+    "if",
+    "else",
+    "for",
+    "foreach",
+    "while",
+    "do",
+    "switch",
+    "case",
+    "catch",
+    "try",
+    "finally",
+    "return",
+    "sizeof",
+    "new",
+    "using",
+    "lock",
+    "synchronized",
+    "when",
+    "function",
+    "with",
+    "await",
+    "yield",
+}
+_CLASS_LIKE = {"class", "struct", "union", "enum", "interface", "record", "impl"}
+_C_TYPE_KEYWORDS = {
+    "class",
+    "struct",
+    "union",
+    "enum",
+    "interface",
+    "namespace",
+    "record",
+}
+
+
+def _method_or_function(tokens, scope):
+    """The ``name(...) {`` rule shared by the C family and JS/TS classes."""
+    paren = _first_paren(tokens)
+    if paren <= 0 or any(t.value == "=" for t in tokens[:paren]):
+        return None
+    name, qualifier = _name_before(tokens, paren)
+    if name is None or name.value in _CONTROL_WORDS:
+        return None
+    if tokens[0].value in _CONTROL_WORDS:
+        return None
+    if qualifier:
+        return "method", name, qualifier, False
+    kind = "method" if scope.kind in _CLASS_LIKE else "function"
+    return kind, name, scope.name if kind == "method" else "", False
+
+
+def classify_c(tokens, scope):
+    """C, C++, C#, Java: types, namespaces, functions and methods."""
+    while tokens and tokens[0].value == "[":  # C# attributes, C++ [[attributes]]
+        tokens = tokens[_drop_balanced(tokens, 0, "[", "]") :]
+    if tokens and tokens[0].value == "template":
+        tokens = tokens[_drop_balanced(tokens, 1, "<", ">") :]
+    if not tokens:
+        return None
+    paren = _first_paren(tokens)
+    for i, token in enumerate(tokens):
+        if token.value not in _C_TYPE_KEYWORDS:
+            continue
+        name = _next_identifier(tokens, i + 1, skip=("class", "struct"))
+        if name is None or any(t.value == "=" for t in tokens):
+            break
+        index = tokens.index(name)
+        if paren == -1 or (token.value in ("class", "record") and paren == index + 1):
+            kind = "class" if token.value == "record" else token.value
+            return kind, name, _parent(scope), True
+        break
+    return _method_or_function(tokens, scope)
+
+
+def _parent(scope):
+    return scope.name if scope.kind in _CLASS_LIKE or scope.kind == "namespace" else ""
+
+
+_JS_KEYWORDS = {
+    "class": "class",
+    "interface": "interface",
+    "enum": "enum",
+    "namespace": "namespace",
+    "module": "namespace",
+}
+_JS_MODIFIERS = {
+    "export",
+    "default",
+    "const",
+    "let",
+    "var",
+    "static",
+    "readonly",
+    "public",
+    "private",
+    "protected",
+    "async",
+    "declare",
+    "abstract",
+    "override",
+}
+
+
+def _js_function(tokens, values, i):
+    """``function name(`` or ``name = function (`` at values[i] == "function"."""
+    name = _next_identifier(tokens, i + 1)
+    if name is None and i >= 2 and values[i - 1] in ("=", ":"):
+        name = tokens[i - 2] if tokens[i - 2].kind == "id" else None
+    return ("function", name, "", False) if name is not None else None
+
+
+def _js_keyword_declaration(tokens, values, scope):
+    """
+    Classify a statement by its declaration keyword. Returns (matched,
+    declaration); matched is False when the statement has no such keyword.
+    """
+    for i, value in enumerate(values):
+        if value in _JS_KEYWORDS and (i == 0 or values[i - 1] != "."):
+            name = _next_identifier(tokens, i + 1)
+            if name is not None:
+                kind = _JS_KEYWORDS[value]
+                return True, (kind, name, _parent(scope), True)
+        if value == "function":
+            return True, _js_function(tokens, values, i)
+    return False, None
+
+
+def _js_arrow_function(tokens, values, scope):
+    """``[export const] name = (...) => {``"""
+    head = [t for t in tokens[: values.index("=")] if t.value not in _JS_MODIFIERS]
+    if head and head[0].kind == "id":
+        kind = "method" if scope.kind == "class" else "function"
+        return kind, head[0], scope.name if kind == "method" else "", False
+    return None
+
+
+def classify_js(tokens, scope):
+    """JavaScript/TypeScript: classes, interfaces, enums, namespaces, functions."""
+    values = [t.value for t in tokens]
+    matched, declaration = _js_keyword_declaration(tokens, values, scope)
+    if matched:
+        return declaration
+    if any(values[i] == "=" and values[i + 1] == ">" for i in range(len(values) - 1)):
+        return _js_arrow_function(tokens, values, scope)
+    if scope.kind != "class":
+        return None
+    tokens = [t for t in tokens if t.value not in _JS_MODIFIERS]
+    return _method_or_function(tokens, scope) if tokens else None
+
+
+def classify_go(tokens, scope):
+    """Go: functions, methods (parented to the receiver type), structs, interfaces."""
+    values = [t.value for t in tokens]
+    if "func" in values:
+        i = values.index("func")
+        if i + 1 < len(values) and values[i + 1] == "(":
+            end = _drop_balanced(tokens, i + 1, "(", ")")
+            receiver = tokens[i + 2 : end - 1]
+            if "[" in values[i + 2 : end - 1]:  # generic receiver: (l *List[T])
+                receiver = receiver[: values[i + 2 : end - 1].index("[")]
+            named = [t for t in receiver if t.kind == "id"]
+            name = _next_identifier(tokens, end)
+            if name is None:
+                return None
+            return "method", name, named[-1].value if named else "", False
+        name = _next_identifier(tokens, i + 1)
+        return ("function", name, "", False) if name is not None else None
+    if "type" in values:
+        i = values.index("type")
+        name = _next_identifier(tokens, i + 1)
+        if name is not None and i + 2 < len(values):
+            kind = values[-1] if values[-1] in ("struct", "interface") else None
+            if kind:
+                return kind, name, "", False
+    return None
+
+
+_RUST_KEYWORDS = {
+    "struct": "struct",
+    "enum": "enum",
+    "union": "union",
+    "trait": "trait",
+    "mod": "module",
+}
+
+
+def _rust_impl_type(tokens, i):
+    """Return the name token of the type the ``impl`` at tokens[i] is for."""
+    j = i + 1
+    if j < len(tokens) and tokens[j].value == "<":
+        j = _drop_balanced(tokens, j, "<", ">")
+    values = [t.value for t in tokens]
+    if "for" in values[j:]:
+        j = values.index("for", j) + 1
+    name = None
+    for token in tokens[j:]:
+        if token.value in ("<", "where"):
+            break
+        if token.kind == "id" and token.value not in ("dyn", "mut"):
+            name = token
+    return name
+
+
+def classify_rust(tokens, scope):
+    """Rust: functions, methods (in impl/trait blocks), types, traits, modules."""
+    values = [t.value for t in tokens]
+    for i, value in enumerate(values):
+        if value == "fn":
+            name = _next_identifier(tokens, i + 1)
+            if name is None:
+                return None
+            if scope.kind in ("impl", "trait"):
+                return "method", name, scope.name, False
+            return "function", name, "", False
+        if value in _RUST_KEYWORDS:
+            name = _next_identifier(tokens, i + 1)
+            if name is None:
+                return None
+            kind = _RUST_KEYWORDS[value]
+            return kind, name, "", kind in ("trait", "module")
+        if value == "impl":
+            name = _rust_impl_type(tokens, i)
+            return ("impl", name, "", True) if name is not None else None
+        if value == "macro_rules" and i + 2 < len(values) and values[i + 1] == "!":
+            name = _next_identifier(tokens, i + 2)
+            return ("macro", name, "", False) if name is not None else None
+    return None
+
+
+Scope = namedtuple("Scope", "kind name container item")
+
+
+def _open_scope(stack, statement, classify, lines, outline, top_level):
+    """Push the scope opened by a ``{`` that follows the *statement* tokens."""
+    scope = stack[-1]
+    declaration = None
+    anonymous_container = False
+    if top_level and scope.container:
+        cleaned = _strip_annotations(statement)
+        if cleaned:
+            declaration = classify(cleaned, scope)
+        values = {t.value for t in cleaned}
+        anonymous_container = not values & {"(", "=", ")"}
+    if declaration is None:
+        stack.append(Scope(scope.kind, scope.name, anonymous_container, None))
+        return
+    kind, name, parent, container = declaration
+    item = _item(kind, name, parent, lines)
+    outline.append(item)
+    stack.append(Scope(kind, name.value, container, item))
+
+
+def _close_scope(stack, token):
+    """Pop the scope closed by the ``}`` *token*, ending its outline item."""
+    if len(stack) > 1:
+        scope = stack.pop()
+        if scope.item is not None:
+            scope.item["end"] = token.line
+
+
+def outline_tokens(tokens, classify, lines):
+    """Run the structural pass over *tokens*; returns outline items in source order."""
+    outline = []
+    stack = [Scope("", "", True, None)]
+    statement = []
+    paren_depth = 0
+    for token in tokens:
+        value = token.value
+        if value in ("(", "["):
+            paren_depth += 1
+        elif value in (")", "]"):
+            paren_depth = max(0, paren_depth - 1)
+        if value in ("{", "}"):
+            if value == "{":
+                top_level = paren_depth == 0
+                _open_scope(stack, statement, classify, lines, outline, top_level)
+            else:
+                _close_scope(stack, token)
+            if paren_depth == 0:
+                statement = []
+        elif value == ";" and paren_depth == 0:
+            statement = []
+        else:
+            statement.append(token)
+    return outline
+
+
+_C_SCANNER = _compile(_COMMON_PATTERNS + [_PREPROCESSOR, _CHAR] + _IDENT_PATTERNS)
+_JAVA_SCANNER = _compile(_COMMON_PATTERNS + [_CHAR] + _IDENT_PATTERNS)
+# JS strings/template literals and Go runes/raw strings share the same shapes
+_JS_SCANNER = _GO_SCANNER = _compile(
+    _COMMON_PATTERNS + [_BACKTICK, _CHAR] + _IDENT_PATTERNS
+)
+_RUST_SCANNER = _compile(_COMMON_PATTERNS + [_RUST_RAW, _RUST_CHAR] + _IDENT_PATTERNS)
+
+
+def _parse(
+    lines, scanner, classify, newline_ends_statement=False, regex_literals=False
+):
+    text = "".join(lines)
+    tokens = tokenize(text, scanner, newline_ends_statement, regex_literals)
+    return outline_tokens(tokens, classify, text.splitlines())
+
+
+def parse_c_outline(lines: List[str]) -> List[Dict]:
+    """Outline C, C++ and C# source lines."""
+    return _parse(lines, _C_SCANNER, classify_c)
+
+
+def parse_java_source_outline(lines: List[str]) -> List[Dict]:
+    """Outline Java source lines (classes, interfaces, enums, records, methods)."""
+    return _parse(lines, _JAVA_SCANNER, classify_c)
+
+
+def parse_js_outline(lines: List[str]) -> List[Dict]:
+    """Outline JavaScript and TypeScript source lines."""
+    return _parse(lines, _JS_SCANNER, classify_js, regex_literals=True)
+
+
+def parse_go_outline(lines: List[str]) -> List[Dict]:
+    """Outline Go source lines."""
+    return _parse(lines, _GO_SCANNER, classify_go, newline_ends_statement=True)
+
+
+def parse_rust_outline(lines: List[str]) -> List[Dict]:
+    """Outline Rust source lines."""
+    return _parse(lines, _RUST_SCANNER, classify_rust)
@@ -1,8 +1,6 @@
 from janito.tools.adapters.local.adapter import register_local_tool
-from .python_outline import parse_python_outline
-from .markdown_outline import parse_markdown_outline
-from janito.formatting import OutlineFormatter
-from .java_outline import parse_java_outline
+from .outline_cache import get_outline_cache
+from .registry import get_outline_engine
 import os
 from janito.tools.path_utils import expand_path
 from janito.tools.tool_base import ToolBase, ToolPermissions
@@ -17,7 +15,7 @@ from janito.tools.loop_protection_decorator import protect_against_loops
 @register_tool
 class GetFileOutlineTool(ToolBase):
     """
-    Get an outline of a file's structure. Supports Python and Markdown files.
+    Get an outline of a file's structure. Supports Python, Markdown, Java, JavaScript/TypeScript, Go, Rust and C/C++/C# files; other files report their line count.
 
     Args:
         path (str): Path to the file to outline.
@@ -37,10 +35,13 @@ class GetFileOutlineTool(ToolBase):
                 ),
                 ReportAction.READ,
             )
-            ext = os.path.splitext(path)[1].lower()
+            engine = get_outline_engine(path)
+            if engine is not None:
+                outline_items = get_outline_cache().get(path, engine.parse)
+                return self._outline_result(engine, outline_items)
             with open(path, "r", encoding="utf-8", errors="replace") as f:
                 lines = f.readlines()
-            return self._outline_by_extension(ext, lines)
+            return self._default_outline_result(lines)
         except Exception as e:
             self.report_error(
                 tr("❌ Error reading file: {error}", error=e),
@@ -48,75 +49,33 @@ class GetFileOutlineTool(ToolBase):
             )
             return tr("Error reading file: {error}", error=e)
 
-    def _outline_by_extension(self, ext, lines):
-        if ext == ".py":
-            outline_items = parse_python_outline(lines)
-            outline_type = "python"
-            table = OutlineFormatter.format_outline_table(outline_items)
-            self.report_success(
-                tr(
-                    "✅ Outlined {count} {item_word}",
-                    count=len(outline_items),
-                    item_word=pluralize("item", len(outline_items)),
-                ),
-                ReportAction.READ,
-            )
-            return (
-                tr(
-                    "Outline: {count} items ({outline_type})\n",
-                    count=len(outline_items),
-                    outline_type=outline_type,
-                )
-                + table
-            )
-        elif ext == ".md":
-            outline_items = parse_markdown_outline(lines)
-            outline_type = "markdown"
-            table = OutlineFormatter.format_markdown_outline_table(outline_items)
-            self.report_success(
-                tr(
-                    "✅ Outlined {count} {item_word}",
-                    count=len(outline_items),
-                    item_word=pluralize("item", len(outline_items)),
-                ),
-                ReportAction.READ,
-            )
-            return (
-                tr(
-                    "Outline: {count} items ({outline_type})\n",
-                    count=len(outline_items),
-                    outline_type=outline_type,
-                )
-                + table
-            )
-        elif ext == ".java":
-            outline_items = parse_java_outline(lines)
-            outline_type = "java"
-            table = OutlineFormatter.format_outline_table(outline_items)
-            self.report_success(
-                tr(
-                    "✅ Outlined {count} {item_word}",
-                    count=len(outline_items),
-                    item_word=pluralize("item", len(outline_items)),
-                ),
-                ReportAction.READ,
-            )
-            return (
-                tr(
-                    "Outline: {count} items ({outline_type})\n",
-                    count=len(outline_items),
-                    outline_type=outline_type,
-                )
-                + table
-            )
-        else:
-            outline_type = "default"
-            self.report_success(
-                tr("✅ Outlined {count} items", count=len(lines)),
-                ReportAction.READ,
-            )
-            return tr(
-                "Outline: {count} lines ({outline_type})\nFile has {count} lines.",
-                count=len(lines),
-                outline_type=outline_type,
+    def _outline_result(self, engine, outline_items):
+        table = engine.format(outline_items)
+        self.report_success(
+            tr(
+                "✅ Outlined {count} {item_word}",
+                count=len(outline_items),
+                item_word=pluralize("item", len(outline_items)),
+            ),
+            ReportAction.READ,
+        )
+        return (
+            tr(
+                "Outline: {count} items ({outline_type})\n",
+                count=len(outline_items),
+                outline_type=engine.name,
             )
+            + table
+        )
+
+    def _default_outline_result(self, lines):
+        outline_type = "default"
+        self.report_success(
+            tr("✅ Outlined {count} items", count=len(lines)),
+            ReportAction.READ,
+        )
+        return tr(
+            "Outline: {count} lines ({outline_type})\nFile has {count} lines.",
+            count=len(lines),
+            outline_type=outline_type,
+        )
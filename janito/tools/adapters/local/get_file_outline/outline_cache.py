@@ -0,0 +1,55 @@
+"""
+Process-wide cache of file outlines, keyed by (path, mtime, size).
+
+Outlining a file means reading and parsing all of it; repeated get_file_outline and
+search_outline calls on unchanged files reuse the previous result instead. Cached
+outlines are shared: callers must not modify them.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+MAX_CACHED_OUTLINES = 256
+
+
+class OutlineCache:
+    """LRU cache of parser results for files, invalidated by mtime and size."""
+
+    def __init__(self, max_entries=MAX_CACHED_OUTLINES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path, parse_lines):
+        """Return parse_lines(lines of *path*), parsing only if the file changed."""
+        path = os.path.abspath(path)
+        key = (path, parse_lines)
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            st = os.fstat(f.fileno())
+            stamp = (st.st_mtime_ns, st.st_size)
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached is not None and cached[0] == stamp:
+                    self._entries.move_to_end(key)
+                    return cached[1]
+            lines = f.readlines()
+        outline = parse_lines(lines)
+        with self._lock:
+            self._entries[key] = (stamp, outline)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return outline
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = OutlineCache()
+
+
+def get_outline_cache():
+    """Return the process-wide OutlineCache."""
+    return _cache
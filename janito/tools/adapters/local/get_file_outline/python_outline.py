@@ -1,6 +1,10 @@
+import ast
 import re
 from typing import List
 
+# Statement fields that hold nested statement lists (if/try/with/for/while blocks)
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers")
+
 
 def handle_assignment(idx, assign_match, outline):
     var_name = assign_match.group(2)
@@ -195,7 +199,103 @@ def build_outline(obj_ranges, lines, outline):
     return outline
 
 
+def _is_main_guard(node):
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    test = node.test
+    values = [test.left] + list(test.comparators)
+    return (
+        len(values) == 2
+        and isinstance(test.ops[0], ast.Eq)
+        and any(isinstance(v, ast.Name) and v.id == "__name__" for v in values)
+        and any(getattr(v, "value", None) == "__main__" for v in values)
+    )
+
+
+def _source_line(lines, lineno):
+    return lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ""
+
+
+def _simple_entry(kind, name, node, lines):
+    return {
+        "type": kind,
+        "name": name,
+        "start": node.lineno,
+        "end": node.lineno,
+        "parent": "",
+        "signature": _source_line(lines, node.lineno),
+        "decorators": [],
+        "docstring": "",
+    }
+
+
+def _outline_body(body, parent, in_class, top_level, lines, outline):
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            is_class = isinstance(node, ast.ClassDef)
+            if is_class:
+                kind = "class"
+            else:
+                kind = "method" if in_class else "function"
+            outline.append(
+                {
+                    "type": kind,
+                    "name": node.name,
+                    "start": node.lineno,
+                    "end": getattr(node, "end_lineno", None) or node.lineno,
+                    "parent": parent,
+                    "signature": _source_line(lines, node.lineno),
+                    "decorators": [
+                        _source_line(lines, d.lineno) for d in node.decorator_list
+                    ],
+                    "docstring": ast.get_docstring(node) or "",
+                }
+            )
+            _outline_body(node.body, node.name, is_class, False, lines, outline)
+        elif top_level and isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    kind = "const" if target.id.isupper() else "var"
+                    outline.append(_simple_entry(kind, target.id, node, lines))
+        elif top_level and _is_main_guard(node):
+            outline.append(_simple_entry("main", "__main__", node, lines))
+        else:
+            # Definitions inside if/try/with/for blocks keep the enclosing scope
+            for field in _BLOCK_FIELDS:
+                block = getattr(node, field, None)
+                if isinstance(block, list):
+                    _outline_body(block, parent, in_class, False, lines, outline)
+
+
+def parse_python_source(source: str, lines: List[str] = None):
+    """
+    Outline Python *source* with the ast module, in source order. Classes, functions
+    and methods carry exact line ranges, decorators and docstrings; module-level
+    assignments and the ``__main__`` guard are listed too. Raises SyntaxError (or
+    ValueError) when the source does not parse.
+
+    *lines* are the source lines as numbered by ast. By default the source is split
+    on line breaks only: str.splitlines() would also split on form feeds and other
+    separators that ast does not count.
+    """
+    tree = ast.parse(source)
+    if lines is None:
+        lines = re.split(r"\r\n|\r|\n", source)
+    outline = []
+    _outline_body(tree.body, "", False, True, lines, outline)
+    return outline
+
+
 def parse_python_outline(lines: List[str]):
+    """Outline Python source lines; files that do not parse use the line scanner."""
+    try:
+        return parse_python_source("".join(lines), lines)
+    except (SyntaxError, ValueError):
+        return parse_python_outline_regex(lines)
+
+
+def parse_python_outline_regex(lines: List[str]):
     class_pat = re.compile(r"^(\s*)class\s+(\w+)")
     func_pat = re.compile(r"^(\s*)def\s+(\w+)")
     assign_pat = re.compile(r"^(\s*)([A-Za-z_][A-Za-z0-9_]*)\s*=.*")
@@ -0,0 +1,74 @@
+"""
+Registry of outline engines, looked up by file extension.
+
+An engine pairs a parser (lines -> outline items) with the formatter that renders
+its items. get_file_outline outlines any registered extension through the shared
+outline cache, and search_outline indexes the extensions of the engines that
+produce symbols. Other modules can add languages with ``register_outline_engine``.
+"""
+
+import os
+from collections import namedtuple
+
+from janito.formatting import OutlineFormatter
+from .brace_outline import (
+    parse_c_outline,
+    parse_go_outline,
+    parse_java_source_outline,
+    parse_js_outline,
+    parse_rust_outline,
+)
+from .markdown_outline import parse_markdown_outline
+from .python_outline import parse_python_outline
+
+OutlineEngine = namedtuple("OutlineEngine", "name extensions parse format symbols")
+
+_engines = {}
+
+
+def register_outline_engine(
+    name, extensions, parse, format=OutlineFormatter.format_outline_table, symbols=True
+):
+    """
+    Register *parse* for *extensions* (e.g. ``(".py",)``), replacing any engine
+    already registered for them. *symbols* marks engines whose items (type, name,
+    start, end, parent) feed the symbol index.
+    """
+    engine = OutlineEngine(
+        name, tuple(ext.lower() for ext in extensions), parse, format, symbols
+    )
+    for ext in engine.extensions:
+        _engines[ext] = engine
+    return engine
+
+
+def get_outline_engine(path):
+    """Return the OutlineEngine for *path*'s extension, or None."""
+    return _engines.get(os.path.splitext(path)[1].lower())
+
+
+def symbol_extensions():
+    """Return the extensions whose outlines provide symbols."""
+    return tuple(ext for ext, engine in _engines.items() if engine.symbols)
+
+
+register_outline_engine("python", (".py",), parse_python_outline)
+register_outline_engine(
+    "markdown",
+    (".md",),
+    parse_markdown_outline,
+    format=OutlineFormatter.format_markdown_outline_table,
+    symbols=False,
+)
+register_outline_engine("java", (".java",), parse_java_source_outline)
+register_outline_engine(
+    "javascript", (".js", ".jsx", ".mjs", ".cjs"), parse_js_outline
+)
+register_outline_engine("typescript", (".ts", ".tsx", ".mts", ".cts"), parse_js_outline)
+register_outline_engine("go", (".go",), parse_go_outline)
+register_outline_engine("rust", (".rs",), parse_rust_outline)
+register_outline_engine("c", (".c", ".h"), parse_c_outline)
+register_outline_engine(
+    "cpp", (".cpp", ".cc", ".cxx", ".hpp", ".hh", ".hxx"), parse_c_outline
+)
+register_outline_engine("csharp", (".cs",), parse_c_outline)
@@ -1,26 +1,105 @@
 from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.loop_protection_decorator import protect_against_loops
+import os
+
+from .outline_cache import get_outline_cache
+from .registry import get_outline_engine
+from .symbol_index import (
+    SYMBOL_KINDS,
+    get_symbol_index,
+    outline_symbols,
+    select_symbols,
+    split_query,
+)
 
 
 class SearchOutlineTool(ToolBase):
     """
-    Tool for searching outlines in files.
+    Search for symbol definitions (classes, functions, methods, module-level names, types) by name across the source files in a directory (Python, Java, JavaScript/TypeScript, Go, Rust, C/C++/C#), or in a single file. Respects .gitignore.
 
     Args:
-        path (str): Path to the file for which to generate an outline.
+        path (str): Directory (searched recursively) or file to search in.
+        query (str): Symbol name or part of it (case-insensitive). Use 'Parent.name' to match members of a class, and an optional 'kind:' prefix (e.g. 'method:run') to filter by kind.
+        kind (str, optional): Only return symbols of this kind: class, function, method, const, var, struct, interface, enum, union, trait, impl, module, namespace or macro. Defaults to all kinds.
+        exact (bool, optional): If True, match the whole name instead of a substring. Defaults to False.
+        max_results (int, optional): Maximum number of symbols to return. Defaults to 100. 0 means no limit.
     Returns:
-        str: Outline search result or status message.
+        str: One line per symbol, formatted as 'filepath:start-end: kind Parent.name', best matches first, or a status message.
     """
 
     permissions = ToolPermissions(read=True)
     tool_name = "search_outline"
 
+    def _file_symbols(self, path, query, kind, exact):
+        outline = get_outline_cache().get(path, get_outline_engine(path).parse)
+        symbols = outline_symbols(outline, os.path.basename(path))
+        parent, name = split_query(query)
+        return select_symbols(symbols, name, parent, kind or None, exact)
+
+    def _parse_query(self, query, kind):
+        """Return (query, kind, error message or None) after a 'kind:' prefix."""
+        from janito.i18n import tr
+
+        prefix, sep, rest = query.partition(":")
+        if sep and prefix in SYMBOL_KINDS:
+            kind, query = kind or prefix, rest
+        query = query.strip()
+        if not query:
+            self.report_warning(tr("ℹ️ Empty outline query provided."))
+            return query, kind, tr(
+                "Warning: Empty outline query provided. Operation skipped."
+            )
+        if kind and kind not in SYMBOL_KINDS:
+            return query, kind, tr(
+                "Error: Unknown symbol kind '{kind}'. Use one of: {kinds}.",
+                kind=kind,
+                kinds=", ".join(SYMBOL_KINDS),
+            )
+        return query, kind, None
+
+    def _search_file(self, path, query, kind, exact):
+        """Return (symbols, error message or None) for a single file."""
+        from janito.i18n import tr
+
+        engine = get_outline_engine(path)
+        if engine is None or not engine.symbols:
+            self.report_warning(tr("No files found with supported extensions."))
+            return None, tr("No files found with supported extensions.")
+        try:
+            return self._file_symbols(path, query, kind, exact), None
+        except Exception as e:
+            self.report_warning(tr("Error reading {path}: {error}", path=path, error=e))
+            return None, tr("Error reading {path}: {error}", path=path, error=e)
+
+    def _search(self, path, query, kind, exact):
+        """Return (symbols, base directory, error message or None)."""
+        from janito.i18n import tr
+
+        if os.path.isfile(path):
+            symbols, error = self._search_file(path, query, kind, exact)
+            return symbols, os.path.dirname(path), error
+        if os.path.isdir(path):
+            index = get_symbol_index(path)
+            index.refresh()
+            return index.find(query, kind=kind or None, exact=exact), path, None
+        self.report_warning(tr("❗ not found"))
+        return None, path, tr("Error: Path not found: {path}", path=path)
+
     @protect_against_loops(max_calls=5, time_window=10.0, key_field="path")
-    def run(self, path: str) -> str:
-        from janito.tools.tool_utils import display_path
+    def run(
+        self,
+        path: str,
+        query: str,
+        kind: str = "",
+        exact: bool = False,
+        max_results: int = 100,
+    ) -> str:
+        from janito.tools.tool_utils import display_path, pluralize
+        from janito.tools.path_utils import expand_path
         from janito.i18n import tr
 
+        path = expand_path(path)
         self.report_action(
             tr(
                 "🔍 Searching for outline in '{disp_path}'",
@@ -28,9 +107,29 @@ class SearchOutlineTool(ToolBase):
             ),
             ReportAction.READ,
         )
-        # ... rest of implementation ...
-        # Example warnings and successes:
-        # self.report_warning(tr("No files found with supported extensions."))
-        # self.report_warning(tr("Error reading {path}: {error}", path=path, error=e))
-        # self.report_success(tr("✅ {count} {match_word} found", count=len(output), match_word=pluralize('match', len(output))))
-        pass
+        query, kind, error = self._parse_query(query, kind)
+        if error:
+            return error
+        symbols, base, error = self._search(path, query, kind, exact)
+        if error:
+            return error
+        limit_reached = max_results > 0 and len(symbols) > max_results
+        if limit_reached:
+            symbols = symbols[:max_results]
+        self.report_success(
+            tr(
+                "✅ {count} {match_word} found",
+                count=len(symbols),
+                match_word=pluralize("match", len(symbols)),
+            )
+        )
+        if not symbols:
+            return tr("No symbols found matching '{query}'.", query=query)
+        output = []
+        for s in symbols:
+            name = f"{s.parent}.{s.name}" if s.parent else s.name
+            file_path = os.path.normpath(os.path.join(base, s.path))
+            output.append(f"{file_path}:{s.start}-{s.end}: {s.kind} {name}")
+        if limit_reached:
+            output.append(tr("[Max results reached. Output truncated.]"))
+        return "\n".join(output)
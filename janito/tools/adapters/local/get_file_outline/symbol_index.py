@@ -0,0 +1,175 @@
+"""
+Workspace-wide index of the symbols (classes, functions, methods, types,
+module-level names) defined in the source files of every outline engine that
+provides symbols, used by search_outline.
+
+The index keeps, per file, the mtime/size it was parsed from and the file's symbols,
+plus a map from lowercased symbol name to symbols. ``refresh`` walks the tree
+(through the shared directory snapshot and gitignore rules) and re-parses only new
+or changed files, dropping deleted ones, so after the first build a query costs a
+stat per file plus an in-memory lookup. At most MAX_SYMBOL_INDEXES roots are
+indexed at a time; the least recently used index is dropped beyond that.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+from janito.dir_walk_utils import walk_dir_with_gitignore
+from .registry import get_outline_engine, symbol_extensions
+
+SYMBOL_KINDS = (
+    "class",
+    "function",
+    "method",
+    "const",
+    "var",
+    "struct",
+    "interface",
+    "enum",
+    "union",
+    "trait",
+    "impl",
+    "module",
+    "namespace",
+    "macro",
+)
+
+Symbol = namedtuple("Symbol", "name kind parent start end path")
+
+
+def symbol_sort_key(symbol, query):
+    """Exact names first, then prefixes, then other matches; by path and line."""
+    name = symbol.name.lower()
+    rank = 0 if name == query else 1 if name.startswith(query) else 2
+    return rank, symbol.path, symbol.start
+
+
+def split_query(query):
+    """Return (parent or None, name), lowercased, for 'name' or 'Parent.name'."""
+    parent = None
+    if "." in query:
+        parent, _, query = query.rpartition(".")
+        parent = parent.lower()
+    return parent, query.lower()
+
+
+def select_symbols(symbols, name, parent=None, kind=None, exact=False):
+    """Filter *symbols* for a split query and sort them best match first."""
+    matches = [
+        s
+        for s in symbols
+        if (s.name.lower() == name if exact else name in s.name.lower())
+        and (not kind or s.kind == kind)
+        and (parent is None or s.parent.lower() == parent)
+    ]
+    return sorted(matches, key=lambda s: symbol_sort_key(s, name))
+
+
+def outline_symbols(outline, path):
+    """Return the Symbols of a parsed outline (entries without a name are skipped)."""
+    return tuple(
+        Symbol(
+            sys.intern(item["name"]),
+            item["type"],
+            item.get("parent", ""),
+            item["start"],
+            item["end"],
+            path,
+        )
+        for item in outline
+        if item.get("type") in SYMBOL_KINDS and item.get("name")
+    )
+
+
+class SymbolIndex:
+    """In-memory symbol index for the files under *root*."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._files = {}
+        self._by_name = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(symbols) for symbols in self._by_name.values())
+
+    def _parse(self, path, rel):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+        return outline_symbols(get_outline_engine(path).parse(lines), rel)
+
+    def _set_file(self, rel, entry):
+        old = self._files.pop(rel, None)
+        if old is not None:
+            for key in {symbol.name.lower() for symbol in old[2]}:
+                remaining = [s for s in self._by_name[key] if s.path != rel]
+                if remaining:
+                    self._by_name[key] = remaining
+                else:
+                    del self._by_name[key]
+        if entry is not None:
+            self._files[rel] = entry
+            for symbol in entry[2]:
+                self._by_name.setdefault(symbol.name.lower(), []).append(symbol)
+
+    def refresh(self):
+        """Re-index new and changed files, drop deleted ones; return files parsed."""
+        with self._lock:
+            seen = set()
+            parsed = 0
+            extensions = symbol_extensions()
+            for dirpath, _, files in walk_dir_with_gitignore(self.root):
+                for name in files:
+                    if not name.lower().endswith(extensions):
+                        continue
+                    path = os.path.join(dirpath, name)
+                    rel = os.path.relpath(path, self.root)
+                    seen.add(rel)
+                    try:
+                        st = os.stat(path)
+                        entry = self._files.get(rel)
+                        if entry and entry[:2] == (st.st_mtime_ns, st.st_size):
+                            continue
+                        symbols = self._parse(path, rel)
+                    except OSError:
+                        continue
+                    self._set_file(rel, (st.st_mtime_ns, st.st_size, symbols))
+                    parsed += 1
+            for rel in [rel for rel in self._files if rel not in seen]:
+                self._set_file(rel, None)
+            return parsed
+
+    def find(self, query, kind=None, exact=False):
+        """
+        Return the symbols whose name contains *query* (case-insensitive), or equals
+        it when *exact*. ``Parent.name`` restricts matches to members of Parent.
+        """
+        parent, name = split_query(query)
+        with self._lock:
+            if exact:
+                keys = [name] if name in self._by_name else []
+            else:
+                keys = [key for key in self._by_name if name in key]
+            symbols = [s for key in keys for s in self._by_name[key]]
+        return select_symbols(symbols, name, parent, kind, exact)
+
+
+MAX_SYMBOL_INDEXES = 8
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_symbol_index(root=None):
+    """Return the shared SymbolIndex for *root* (default: the working directory)."""
+    root = os.path.abspath(root or os.getcwd())
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = SymbolIndex(root)
+        _indexes.move_to_end(root)
+        while len(_indexes) > MAX_SYMBOL_INDEXES:
+            _indexes.popitem(last=False)
+    return index
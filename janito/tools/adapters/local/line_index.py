@@ -0,0 +1,125 @@
+"""
+Line-offset index for ranged reads of large text files.
+
+The index stores the byte offset of every ``LINE_STRIDE``-th line start (an
+``array('Q')``) and the total line count, with lines split the way text-mode reads
+split them (``\\n``, ``\\r\\n`` and a lone ``\\r``). It is built once per file in a
+single buffered pass and cached by (path, mtime, size). A ranged read seeks to the
+checkpoint before the first requested line, skips fewer than ``LINE_STRIDE`` lines
+and decodes only the requested ones, so time and memory follow the size of the
+range rather than the size of the file.
+"""
+
+import io
+import os
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import accumulate
+
+INDEX_THRESHOLD = 1024 * 1024
+LINE_STRIDE = 256
+CHUNK_SIZE = 1024 * 1024
+MAX_CACHED_INDEXES = 32
+
+_NEWLINE = re.compile(rb"\r\n?|\n")
+
+
+class LineIndex:
+    """Sparse line-start offsets and the total line count of one file."""
+
+    __slots__ = ("total_lines", "checkpoints", "stride")
+
+    def __init__(self, total_lines, checkpoints, stride=LINE_STRIDE):
+        self.total_lines = total_lines
+        self.checkpoints = checkpoints
+        self.stride = stride
+
+    @classmethod
+    def build(cls, f, stride=LINE_STRIDE):
+        """Build the index from *f*, a binary file positioned at its start."""
+        checkpoints = array("Q", [0])
+        terminators = 0
+        pos = 0
+        tail = b""
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            while chunk.endswith(b"\r"):
+                # Keep a "\r\n" pair inside one chunk, even after a run of "\r"
+                extra = f.read(1)
+                if not extra:
+                    break
+                chunk += extra
+            # Terminator j of this chunk starts line number terminators + j + 1
+            first = -(terminators + 1) % stride
+            if b"\r" in chunk:
+                ends = [m.end() for m in _NEWLINE.finditer(chunk)]
+                count = len(ends)
+                for j in range(first, count, stride):
+                    checkpoints.append(pos + ends[j])
+            else:
+                parts = chunk.split(b"\n")
+                parts.pop()
+                lengths = list(accumulate(map(len, parts)))
+                count = len(lengths)
+                for j in range(first, count, stride):
+                    checkpoints.append(pos + lengths[j] + j + 1)
+            terminators += count
+            pos += len(chunk)
+            tail = chunk[-1:]
+        partial = 1 if tail and tail not in (b"\n", b"\r") else 0
+        return cls(terminators + partial, checkpoints, stride)
+
+    def read_lines(self, path, start, stop=None):
+        """Return lines start..stop-1 (0-based, stop=None reads to the end)."""
+        if stop is not None and stop <= start:
+            return []
+        checkpoint = min(start // self.stride, len(self.checkpoints) - 1)
+        with open(path, "rb") as raw:
+            raw.seek(self.checkpoints[checkpoint])
+            f = io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+            for _ in range(start - checkpoint * self.stride):
+                if not f.readline():
+                    return []
+            if stop is None:
+                return f.readlines()
+            lines = []
+            for _ in range(stop - start):
+                line = f.readline()
+                if not line:
+                    break
+                lines.append(line)
+            return lines
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_line_index(path):
+    """Return the LineIndex of *path*, rebuilt only when its mtime or size changes."""
+    path = os.path.abspath(path)
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _cache_lock:
+            cached = _cache.get(path)
+            if cached is not None and cached[0] == stamp:
+                _cache.move_to_end(path)
+                return cached[1]
+        index = LineIndex.build(f)
+    with _cache_lock:
+        _cache[path] = (stamp, index)
+        _cache.move_to_end(path)
+        while len(_cache) > MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+    return index
+
+
+def read_line_range(path, start, stop=None):
+    """Return (lines start..stop-1, total line count) of *path* via its line index."""
+    index = get_line_index(path)
+    return index.read_lines(path, start, stop), index.total_lines
@@ -7,6 +7,11 @@ from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
 from janito.i18n import tr
+from janito.tools.adapters.local.python_pool import (
+    WarmPoolError,
+    python_pool_enabled,
+    run_warm,
+)
 
 
 @register_local_tool
@@ -53,20 +58,9 @@ class PythonCommandRunTool(ToolBase):
                     encoding="utf-8",
                 ) as stderr_file,
             ):
-                process = subprocess.Popen(
-                    [sys.executable, "-c", code],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    encoding="utf-8",
-                    env={**os.environ, "PYTHONIOENCODING": "utf-8"},
-                )
-                stdout_lines, stderr_lines = self._stream_process_output(
-                    process, stdout_file, stderr_file
+                return_code = self._run_process(
+                    code, stdout_file, stderr_file, timeout
                 )
-                return_code = self._wait_for_process(process, timeout)
                 if return_code is None:
                     return tr(
                         "Code timed out after {timeout} seconds.", timeout=timeout
@@ -85,6 +79,37 @@ class PythonCommandRunTool(ToolBase):
             self.report_error(tr("❌ Error: {error}", error=e), ReportAction.EXECUTE)
             return tr("Error running code: {error}", error=e)
 
+    def _run_process(self, code, stdout_file, stderr_file, timeout):
+        if python_pool_enabled():
+            try:
+                return_code = run_warm(
+                    "command",
+                    code,
+                    stdout_file,
+                    stderr_file,
+                    lambda line: self.report_stdout(line, ReportAction.EXECUTE),
+                    lambda line: self.report_stderr(line, ReportAction.EXECUTE),
+                    timeout,
+                )
+            except WarmPoolError:
+                pass  # fall back to a fresh interpreter
+            else:
+                if return_code is None:
+                    self._report_timeout(timeout)
+                return return_code
+        process = subprocess.Popen(
+            [sys.executable, "-c", code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            universal_newlines=True,
+            encoding="utf-8",
+            env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+        )
+        self._stream_process_output(process, stdout_file, stderr_file)
+        return self._wait_for_process(process, timeout)
+
     def _stream_process_output(self, process, stdout_file, stderr_file):
         stdout_lines = 0
         stderr_lines = 0
@@ -121,12 +146,15 @@ class PythonCommandRunTool(ToolBase):
             return process.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
             process.kill()
-            self.report_error(
-                tr("❌ Timed out after {timeout} seconds.", timeout=timeout),
-                ReportAction.EXECUTE,
-            )
+            self._report_timeout(timeout)
             return None
 
+    def _report_timeout(self, timeout):
+        self.report_error(
+            tr("❌ Timed out after {timeout} seconds.", timeout=timeout),
+            ReportAction.EXECUTE,
+        )
+
     def _format_result(self, stdout_file_name, stderr_file_name, return_code):
         with open(stdout_file_name, "r", encoding="utf-8", errors="replace") as out_f:
             stdout_content = out_f.read()
@@ -0,0 +1,152 @@
+"""
+Warm interpreter server for python_code_run, python_file_run and
+python_command_run (see python_pool.py).
+
+Started as a script by the interpreter pool with one end of a socketpair. It
+imports the configured modules once, then serves requests one at a time: each
+request carries the snippet (or script path), argv, cwd and environment plus the
+write ends of the stdout/stderr pipes, and is run in a child forked from this
+warm process. The server replies ``pid <n>`` when the child starts and
+``exit <code>`` when it ends.
+
+This file must not import janito: every module imported here is inherited by the
+snippets it runs.
+"""
+
+import sys
+
+# Running as a script put this directory first on sys.path; snippets must not see it
+if sys.path and sys.path[0]:
+    del sys.path[0]
+
+import importlib  # noqa: E402
+import io  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import socket  # noqa: E402
+import struct  # noqa: E402
+import traceback  # noqa: E402
+import types  # noqa: E402
+
+
+def _exit_code(exc):
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _print_exception(exc):
+    """Print *exc* like the interpreter would, without this server's frames."""
+    tb = exc.__traceback__
+    while tb is not None and (
+        tb.tb_frame.f_code.co_filename == __file__
+        or tb.tb_frame.f_globals.get("__name__") == "runpy"
+    ):
+        tb = tb.tb_next
+    traceback.print_exception(type(exc), exc, tb)
+
+
+def _text_stream(fd, mode, errors):
+    raw = io.FileIO(fd, mode, closefd=False)
+    if mode == "r":
+        return io.TextIOWrapper(raw, encoding="utf-8", errors=errors)
+    return io.TextIOWrapper(raw, encoding="utf-8", errors=errors, line_buffering=True)
+
+
+def _run_child(request, out_fd, err_fd):
+    os.setsid()
+    null_fd = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null_fd, 0)
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    for fd in (null_fd, out_fd, err_fd):
+        os.close(fd)
+    sys.stdin = sys.__stdin__ = _text_stream(0, "r", "strict")
+    sys.stdout = sys.__stdout__ = _text_stream(1, "w", "strict")
+    sys.stderr = sys.__stderr__ = _text_stream(2, "w", "backslashreplace")
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.argv = request["argv"]
+    sys.path.insert(0, request["path0"])
+    code = 0
+    try:
+        if request["kind"] == "file":
+            import runpy
+
+            runpy.run_path(request["path"], run_name="__main__")
+        else:
+            main = types.ModuleType("__main__")
+            sys.modules["__main__"] = main
+            exec(compile(request["source"], request["filename"], "exec"), vars(main))
+    except SystemExit as e:
+        code = _exit_code(e)
+    except BaseException as e:
+        _print_exception(e)
+        code = 1
+    try:
+        import threading
+
+        threading._shutdown()
+        import atexit
+
+        atexit._run_exitfuncs()
+    except BaseException:
+        traceback.print_exc()
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    os._exit(code & 0xFF)
+
+
+def _recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return data
+
+
+def serve(sock):
+    while True:
+        try:
+            header, fds, _, _ = socket.recv_fds(sock, 4, 2)
+            if not header:
+                return
+            header += _recv_exact(sock, 4 - len(header))
+            (length,) = struct.unpack("!I", header)
+            request = json.loads(_recv_exact(sock, length))
+        except (OSError, EOFError):
+            return
+        pid = os.fork()
+        if pid == 0:
+            sock.close()
+            _run_child(request, *fds)
+        for fd in fds:
+            os.close(fd)
+        sock.sendall(b"pid %d\n" % pid)
+        _, status = os.waitpid(pid, 0)
+        sock.sendall(b"exit %d\n" % os.waitstatus_to_exitcode(status))
+
+
+def main():
+    sock = socket.socket(fileno=int(sys.argv[1]))
+    for name in filter(None, sys.argv[2].split(",")):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+    sock.sendall(b"ready\n")
+    serve(sock)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Pool of warm Python interpreters for python_code_run, python_file_run and
+python_command_run, enabled with the ``python_warm_pool`` config key.
+
+Each pool member is a long-lived server process (python_forkserver.py) that has
+already paid the interpreter start-up and imported the modules listed in the
+``python_warm_pool_modules`` config key (a list or a comma-separated string, e.g.
+"numpy,pandas"). A run forks a clean child from a warm server, with the caller's
+cwd, environment and argv, and the stdout/stderr pipes passed over a Unix socket.
+Output, timeouts and return codes are handled as for a fresh ``sys.executable``.
+
+Servers are reused for later runs; concurrent runs start extra servers. The pool
+needs ``os.fork`` and is not used on Windows.
+"""
+
+import atexit
+import json
+import os
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+
+SERVER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "python_forkserver.py"
+)
+MAX_IDLE_SERVERS = 2
+STARTUP_TIMEOUT = 120
+
+
+class WarmPoolError(RuntimeError):
+    """The warm interpreter could not start the run; nothing was executed."""
+
+
+def _config_modules():
+    from janito.config import config
+
+    value = config.get("python_warm_pool_modules") or []
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(name.strip() for name in value if name and name.strip())
+
+
+def python_pool_enabled():
+    from janito.config import config
+
+    if not hasattr(os, "fork") or not hasattr(socket, "send_fds"):
+        return False
+    value = config.get("python_warm_pool")
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+class WarmInterpreter:
+    """One forkserver process and the client end of its control socket."""
+
+    def __init__(self, modules):
+        self.modules = modules
+        parent_sock, child_sock = socket.socketpair()
+        try:
+            self.process = subprocess.Popen(
+                [
+                    sys.executable,
+                    SERVER_PATH,
+                    str(child_sock.fileno()),
+                    ",".join(modules),
+                ],
+                pass_fds=(child_sock.fileno(),),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+            )
+        finally:
+            child_sock.close()
+        self.sock = parent_sock
+        self._buffer = b""
+        self._ready = False
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def _reply(self, timeout):
+        self.sock.settimeout(timeout)
+        while b"\n" not in self._buffer:
+            chunk = self.sock.recv(256)
+            if not chunk:
+                raise EOFError("python interpreter server exited")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line.decode("ascii").split()
+
+    def run(self, request, timeout, stream_output):
+        """
+        Run *request* in a forked child. *stream_output(stdout_fd, stderr_fd)*
+        starts reading the output pipes and returns a callable that waits for the
+        readers. Returns the exit code, or None when *timeout* expired.
+        """
+        try:
+            if not self._ready:
+                self._reply(STARTUP_TIMEOUT)
+                self._ready = True
+            payload = json.dumps(request).encode("utf-8")
+            out_r, out_w = os.pipe()
+            err_r, err_w = os.pipe()
+            try:
+                socket.send_fds(
+                    self.sock, [struct.pack("!I", len(payload))], [out_w, err_w]
+                )
+                self.sock.sendall(payload)
+                pid = int(self._reply(STARTUP_TIMEOUT)[1])
+            except BaseException:
+                for fd in (out_r, err_r):
+                    os.close(fd)
+                raise
+            finally:
+                os.close(out_w)
+                os.close(err_w)
+        except (OSError, EOFError, ValueError, IndexError) as e:
+            self.close()
+            raise WarmPoolError(str(e)) from e
+        wait_readers = stream_output(out_r, err_r)
+        try:
+            return_code = int(self._reply(timeout)[1])
+        except socket.timeout:
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+            return_code = None
+            try:
+                self._reply(STARTUP_TIMEOUT)
+            except (OSError, EOFError):
+                self.close()
+        except (OSError, EOFError, ValueError, IndexError):
+            self.close()
+            return_code = -signal.SIGKILL
+        wait_readers()
+        return return_code
+
+    def close(self):
+        try:
+            self.sock.close()
+        finally:
+            if self.process.poll() is None:
+                self.process.kill()
+                self.process.wait()
+
+
+class InterpreterPool:
+    """Idle warm interpreters, replaced when the configured modules change."""
+
+    def __init__(self):
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _acquire(self, modules):
+        with self._lock:
+            while self._idle:
+                server = self._idle.pop()
+                if server.alive() and server.modules == modules:
+                    return server
+                server.close()
+        return WarmInterpreter(modules)
+
+    def _release(self, server):
+        with self._lock:
+            if server.alive() and len(self._idle) < MAX_IDLE_SERVERS:
+                self._idle.append(server)
+                return
+        server.close()
+
+    def run(self, request, timeout, stream_output):
+        server = self._acquire(_config_modules())
+        try:
+            return server.run(request, timeout, stream_output)
+        finally:
+            self._release(server)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server in idle:
+            server.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_interpreter_pool():
+    """Return the process-wide InterpreterPool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = InterpreterPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def _stream_to(file_obj, report_func):
+    def stream_output(fd):
+        with open(fd, "r", encoding="utf-8", errors="replace") as stream:
+            for line in stream:
+                file_obj.write(line)
+                file_obj.flush()
+                report_func(line.rstrip("\r\n"))
+
+    return stream_output
+
+
+def run_warm(
+    kind, source, stdout_file, stderr_file, report_stdout, report_stderr, timeout
+):
+    """
+    Run Python *source* in a warm interpreter. *kind* is "stdin" (source is code
+    read as from standard input), "command" (as ``python -c``) or "file" (source is
+    a script path). Output is written to the files and reported line by line.
+    Returns the return code, or None when *timeout* expired. Raises WarmPoolError
+    if no warm interpreter could run it.
+    """
+    request = {
+        "kind": kind,
+        "cwd": os.getcwd(),
+        "env": {**os.environ, "PYTHONIOENCODING": "utf-8"},
+    }
+    if kind == "file":
+        path = os.path.abspath(source)
+        request.update(path=path, argv=[source], path0=os.path.dirname(path))
+    else:
+        request.update(
+            source=source,
+            filename="<stdin>" if kind == "stdin" else "<string>",
+            argv=[""] if kind == "stdin" else ["-c"],
+            path0="",
+        )
+
+    def stream_output(out_fd, err_fd):
+        readers = [
+            threading.Thread(target=_stream_to(file_obj, report_func), args=(fd,))
+            for fd, file_obj, report_func in (
+                (out_fd, stdout_file, report_stdout),
+                (err_fd, stderr_file, report_stderr),
+            )
+        ]
+        for reader in readers:
+            reader.start()
+
+        def wait_readers():
+            for reader in readers:
+                reader.join()
+
+        return wait_readers
+
+    return get_interpreter_pool().run(request, timeout, stream_output)
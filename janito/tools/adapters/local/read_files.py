@@ -4,6 +4,85 @@ from janito.tools.adapters.local.adapter import register_local_tool
 from janito.tools.tool_utils import pluralize
 from janito.i18n import tr
 from janito.tools.loop_protection_decorator import protect_against_loops
+import codecs
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_FILE_BYTES = 512 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 2 * 1024 * 1024
+READ_WINDOW = 16
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_budget(key, default):
+    from janito.config import config
+
+    try:
+        value = config.get(key)
+        return max(0, int(value)) if value not in (None, "") else default
+    except (TypeError, ValueError):
+        return default
+
+
+def get_read_budgets():
+    """
+    Return (max_file_bytes, max_total_bytes) from the ``read_files_max_file_bytes``
+    and ``read_files_max_total_bytes`` config keys; 0 means unlimited.
+    """
+    return (
+        _get_budget("read_files_max_file_bytes", DEFAULT_MAX_FILE_BYTES),
+        _get_budget("read_files_max_total_bytes", DEFAULT_MAX_TOTAL_BYTES),
+    )
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="janito-read",
+            )
+        return _executor
+
+
+def decode_text(data, complete):
+    """
+    Decode UTF-8 *data* (replacing invalid bytes) with text-mode newlines. When the
+    data was cut short (*complete* is False) a trailing partial character is dropped.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    text = decoder.decode(data, final=complete)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_file_head(path, max_bytes):
+    """
+    Read at most *max_bytes* of *path* (0 means all of it) in a worker thread.
+    Returns ("missing" | "binary" | "text" | "error", data_or_error, file_size).
+    """
+    from janito.tools.adapters.local.search_text.match_lines import (
+        BINARY_CHECK_BYTES,
+        is_binary_chunk,
+    )
+
+    if not os.path.isfile(path):
+        return "missing", None, 0
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            data = f.read(max_bytes) if max_bytes > 0 else f.read()
+    except Exception as e:
+        return "error", e, 0
+    if is_binary_chunk(data[:BINARY_CHECK_BYTES]):
+        return "binary", None, size
+    return "text", data, max(size, len(data))
 
 
 @register_local_tool
@@ -11,6 +90,12 @@ class ReadFilesTool(ToolBase):
     """
     Read all text content from multiple files.
 
+    Files are read concurrently. Each file is capped at the
+    ``read_files_max_file_bytes`` config value and the whole result at
+    ``read_files_max_total_bytes``; cut content ends with a truncation note (use
+    view_file with a line range for the rest).
+    Binary files are reported but not included.
+
     Args:
         paths (list[str]): List of file paths to read.
 
@@ -21,38 +106,97 @@ class ReadFilesTool(ToolBase):
     permissions = ToolPermissions(read=True)
     tool_name = "read_files"
 
+    def _format_file(self, disp_path, result, budget):
+        """Return (section, bytes used) for one read result."""
+        kind, data, size = result
+        if kind == "missing":
+            self.report_warning(tr("❗ not found: {disp_path}", disp_path=disp_path))
+            return f"--- File: {disp_path} (not found) ---\n", 0
+        if kind == "error":
+            self.report_error(
+                tr(
+                    " ❌ Error reading {disp_path}: {error}",
+                    disp_path=disp_path,
+                    error=data,
+                )
+            )
+            return (
+                f"--- File: {disp_path} (error) ---\nError reading file: {data}\n",
+                0,
+            )
+        if kind == "binary":
+            self.report_warning(
+                tr("⚠️ Skipped binary file: {disp_path}", disp_path=disp_path)
+            )
+            return f"--- File: {disp_path} (binary, {size} bytes, skipped) ---\n", 0
+        if budget is not None and len(data) > budget:
+            data = data[:budget]
+        content = decode_text(data, complete=len(data) >= size)
+        section = f"--- File: {disp_path} ---\n{content}\n"
+        if len(data) < size:
+            section += tr(
+                "[Truncated: showing {shown} of {size} bytes. "
+                "Use view_file with a line range to read more.]\n",
+                shown=len(data),
+                size=size,
+            )
+        self.report_success(tr("✅ Read {disp_path}", disp_path=disp_path))
+        return section, len(data)
+
     @protect_against_loops(max_calls=5, time_window=10.0, key_field="paths")
     def run(self, paths: list[str]) -> str:
         from janito.tools.tool_utils import display_path
-        import os
         from janito.tools.path_utils import expand_path
 
+        max_file_bytes, max_total_bytes = get_read_budgets()
+        executor = _get_executor()
+        paths = iter([expand_path(p) for p in paths])
+        pending = deque()
         results = []
-        for path in [expand_path(p) for p in paths]:
+        remaining = max_total_bytes if max_total_bytes > 0 else None
+        skipped = 0
+
+        def fill():
+            # Files are read at most READ_WINDOW ahead of the assembly, and the
+            # reads in flight never hold more than the remaining total budget
+            while len(pending) < READ_WINDOW and remaining != 0:
+                limit = max_file_bytes
+                if remaining is not None:
+                    limit = min(limit, remaining) if limit > 0 else remaining
+                    in_flight = sum(reserved for _, _, reserved in pending)
+                    if pending and in_flight + limit > remaining:
+                        return
+                path = next(paths, None)
+                if path is None:
+                    return
+                future = executor.submit(read_file_head, path, limit)
+                pending.append((path, future, limit))
+
+        fill()
+        while pending:
+            path, future, _ = pending.popleft()
             disp_path = display_path(path)
+            if remaining == 0:
+                future.cancel()
+                skipped += 1
+                continue
             self.report_action(
                 tr("📖 Read '{disp_path}'", disp_path=disp_path), ReportAction.READ
             )
-            if not os.path.isfile(path):
-                self.report_warning(
-                    tr("❗ not found: {disp_path}", disp_path=disp_path)
-                )
-                results.append(f"--- File: {disp_path} (not found) ---\n")
-                continue
-            try:
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read()
-                results.append(f"--- File: {disp_path} ---\n{content}\n")
-                self.report_success(tr("✅ Read {disp_path}", disp_path=disp_path))
-            except Exception as e:
-                self.report_error(
-                    tr(
-                        " ❌ Error reading {disp_path}: {error}",
-                        disp_path=disp_path,
-                        error=e,
-                    )
-                )
-                results.append(
-                    f"--- File: {disp_path} (error) ---\nError reading file: {e}\n"
+            section, used = self._format_file(disp_path, future.result(), remaining)
+            results.append(section)
+            if remaining is not None:
+                remaining -= used
+            fill()
+        skipped += sum(1 for _ in paths)
+        if skipped:
+            results.append(
+                tr(
+                    "[Total size limit of {limit} bytes reached: "
+                    "{count} more {file_word} not read.]\n",
+                    limit=max_total_bytes,
+                    count=skipped,
+                    file_word=pluralize("file", skipped),
                 )
+            )
         return "\n".join(results)
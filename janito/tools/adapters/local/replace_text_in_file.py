@@ -2,7 +2,9 @@ from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
 from janito.i18n import tr
+import os
 import shutil
+import tempfile
 import re
 from janito.tools.adapters.local.validate_file_syntax.core import validate_file_syntax
 
@@ -16,15 +18,21 @@ class ReplaceTextInFileTool(ToolBase):
         To avoid syntax errors, ensure your replacement text is pre-indented as needed, matching the indentation of the
         search text in its original location.
 
+    Several edits to the same file can be made in one call with ``edits``: they are
+    applied in order in memory, the file is written once (atomically) and validated
+    once. If any edit fails, none is applied.
+
     Args:
         path (str): Path to the file to modify.
-        search_text (str): The exact text to search for (including indentation).
-        replacement_text (str): The text to replace with (including indentation).
+        search_text (str): The exact text to search for (including indentation). Required unless edits is given.
+        replacement_text (str): The text to replace with (including indentation). Required unless edits is given.
         replace_all (bool): If True, replace all occurrences; otherwise, only the first occurrence.
         backup (bool, optional): Deprecated. No backups are created anymore and this flag is ignored. Defaults to False.
+        edits (list[dict], optional): Batch of edits to apply in order, each an object with "search_text", "replacement_text" and optional "replace_all" keys. When given, search_text, replacement_text and replace_all are ignored.
     Returns:
         str: Status message. Example:
             - "Text replaced in /path/to/file"
+            - "Text replaced in /path/to/file: 3 edits applied."
             - "No changes made. [Warning: Search text not found in file] Please review the original file."
             - "Error replacing text: <error message>"
     """
@@ -35,17 +43,29 @@ class ReplaceTextInFileTool(ToolBase):
     def run(
         self,
         path: str,
-        search_text: str,
-        replacement_text: str,
+        search_text: str = None,
+        replacement_text: str = None,
         replace_all: bool = False,
         backup: bool = False,
+        edits: list[dict] = None,
     ) -> str:
         from janito.tools.tool_utils import display_path
 
+        if edits:
+            return self._run_edits(path, edits)
+        if search_text is None or replacement_text is None:
+            return tr(
+                "Error replacing text: {error}",
+                error="search_text and replacement_text are required without edits",
+            )
         disp_path = display_path(path)
         action = "(all)" if replace_all else ""
         search_lines = len(search_text.splitlines())
         replace_lines = len(replacement_text.splitlines())
+        try:
+            content = self._read_file_content(path)
+        except Exception:
+            content = None  # reported below, once the action is announced
         info_msg = self._format_info_msg(
             disp_path,
             search_lines,
@@ -53,13 +73,14 @@ class ReplaceTextInFileTool(ToolBase):
             action,
             search_text,
             replacement_text,
-            path,
+            content,
         )
         self.report_action(info_msg, ReportAction.CREATE)
         try:
-            content = self._read_file_content(path)
+            if content is None:
+                content = self._read_file_content(path)
             match_lines = self._find_match_lines(content, search_text)
-            occurrences = content.count(search_text)
+            occurrences = len(match_lines)
             replaced_count, new_content = self._replace_content(
                 content, search_text, replacement_text, replace_all, occurrences
             )
@@ -93,25 +114,119 @@ class ReplaceTextInFileTool(ToolBase):
             self.report_error(tr(" ❌ Error"), ReportAction.UPDATE)
             return tr("Error replacing text: {error}", error=e)
 
+    def _run_edits(self, path, edits):
+        """Apply a batch of edits in memory, then write and validate the file once."""
+        from janito.tools.tool_utils import display_path
+
+        disp_path = display_path(path)
+        self.report_action(
+            tr(
+                "📝 Replace in {disp_path} ({count} edits)",
+                disp_path=disp_path,
+                count=len(edits),
+            ),
+            ReportAction.CREATE,
+        )
+        try:
+            content = self._read_file_content(path)
+            new_content = content
+            summaries = []
+            for number, edit in enumerate(edits, 1):
+                if not isinstance(edit, dict):
+                    edit = {}
+                search_text = edit.get("search_text")
+                if not isinstance(search_text, str) or not search_text:
+                    self.report_error(tr(" ❌ Error"), ReportAction.UPDATE)
+                    return tr(
+                        "No changes made. Edit {number} has no search_text.",
+                        number=number,
+                    )
+                replacement_text = edit.get("replacement_text")
+                if not isinstance(replacement_text, str):
+                    # Only an explicit "" deletes the search text
+                    self.report_error(tr(" ❌ Error"), ReportAction.UPDATE)
+                    return tr(
+                        "No changes made. Edit {number} has no replacement_text.",
+                        number=number,
+                    )
+                replace_all = bool(edit.get("replace_all", False))
+                match_lines = self._find_match_lines(new_content, search_text)
+                occurrences = len(match_lines)
+                if occurrences == 0 or (occurrences > 1 and not replace_all):
+                    reason = (
+                        tr("not found") if occurrences == 0 else tr("not unique")
+                    )
+                    self.report_warning(
+                        tr(
+                            " ℹ️  No changes made. (edit {number} {reason})",
+                            number=number,
+                            reason=reason,
+                        ),
+                        ReportAction.CREATE,
+                    )
+                    return tr(
+                        "No changes made. The search text of edit {number} is {reason}"
+                        " (after applying the edits before it). None of the edits were"
+                        " applied; expand the search context and retry.",
+                        number=number,
+                        reason=reason,
+                    )
+                replaced_count, new_content = self._replace_content(
+                    new_content, search_text, replacement_text, replace_all, occurrences
+                )
+                summaries.append(
+                    tr(
+                        "Edit {number}: replaced {count} occurrence(s) at line(s) {lines}.",
+                        number=number,
+                        count=replaced_count,
+                        lines=", ".join(str(line) for line in match_lines),
+                    )
+                )
+            if new_content == content:
+                self.report_warning(
+                    tr(" ℹ️  No changes made. (identical)"), ReportAction.CREATE
+                )
+                return tr("No changes made. The edits leave the file unchanged.")
+            self._write_file_content(path, new_content)
+            validation_result = validate_file_syntax(path)
+            line_delta_str = self._get_line_delta_str(content, new_content)
+            self.report_success(
+                tr(
+                    " ✅ {count} edits{delta}", count=len(edits), delta=line_delta_str
+                ),
+                ReportAction.CREATE,
+            )
+            message = tr(
+                "Text replaced in {path}: {count} edits applied.{line_delta_str}",
+                path=path,
+                count=len(edits),
+                line_delta_str=line_delta_str,
+            )
+            return "\n".join([message] + summaries) + (
+                f"\n{validation_result}" if validation_result else ""
+            )
+        except Exception as e:
+            self.report_error(tr(" ❌ Error"), ReportAction.UPDATE)
+            return tr("Error replacing text: {error}", error=e)
+
     def _read_file_content(self, path):
         """Read the entire content of the file."""
         with open(path, "r", encoding="utf-8", errors="replace") as f:
             return f.read()
 
     def _find_match_lines(self, content, search_text):
-        """Find all line numbers where search_text occurs in content."""
-        lines = content.splitlines(keepends=True)
-        joined = "".join(lines)
+        """Find all line numbers where search_text occurs in content (one pass)."""
         match_lines = []
-        idx = 0
-        while True:
-            idx = joined.find(search_text, idx)
-            if idx == -1:
-                break
-            upto = joined[:idx]
-            line_no = upto.count("\n") + 1
+        line_no = 1
+        counted = 0
+        step = len(search_text) or 1
+        idx = content.find(search_text)
+        while idx != -1:
+            # Only count the newlines between the previous match and this one
+            line_no += content.count("\n", counted, idx)
+            counted = idx
             match_lines.append(line_no)
-            idx += 1 if not search_text else len(search_text)
+            idx = content.find(search_text, idx + step)
         return match_lines
 
     def _replace_content(
@@ -132,10 +247,52 @@ class ReplaceTextInFileTool(ToolBase):
         """Create a backup of the file."""
         shutil.copy2(path, backup_path)
 
+    def _can_replace_file(self, path):
+        """
+        Return True if path can be swapped for a new file without losing hard
+        links, its owner or group, or extended attributes.
+        """
+        st = os.stat(path)
+        if st.st_nlink > 1:
+            return False
+        if hasattr(os, "geteuid") and (st.st_uid, st.st_gid) != (
+            os.geteuid(),
+            os.getegid(),
+        ):
+            return False
+        if hasattr(os, "listxattr"):
+            try:
+                if os.listxattr(path):
+                    return False
+            except OSError:
+                pass
+        return True
+
     def _write_file_content(self, path, content):
-        """Write content to the file."""
-        with open(path, "w", encoding="utf-8", errors="replace") as f:
-            f.write(content)
+        """
+        Write content to the file atomically (temporary file, then rename).
+        Symlinks are followed; files that cannot be replaced safely (see
+        _can_replace_file) are rewritten in place.
+        """
+        path = os.path.realpath(path)
+        if not self._can_replace_file(path):
+            with open(path, "w", encoding="utf-8", errors="replace") as f:
+                f.write(content)
+            return
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=".janito-", suffix=".tmp"
+        )
+        try:
+            with open(fd, "w", encoding="utf-8", errors="replace") as f:
+                f.write(content)
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
     def _handle_warnings(self, replaced_count, file_changed, occurrences):
         """Handle and return warnings and concise warnings if needed."""
@@ -196,7 +353,7 @@ class ReplaceTextInFileTool(ToolBase):
         action,
         search_text,
         replacement_text,
-        path,
+        content,
     ):
         """Format the info message for the operation."""
         if replace_lines == 0:
@@ -207,16 +364,15 @@ class ReplaceTextInFileTool(ToolBase):
                 action=action,
             )
         else:
-            try:
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    _content = f.read()
-                _new_content = _content.replace(
-                    search_text, replacement_text, -1 if action else 1
+            if content is not None:
+                # Net change without building the new content
+                occurrences = content.count(search_text)
+                if not action:
+                    occurrences = min(occurrences, 1)
+                _line_delta = occurrences * (
+                    replacement_text.count("\n") - search_text.count("\n")
                 )
-                _total_lines_before = _content.count("\n") + 1
-                _total_lines_after = _new_content.count("\n") + 1
-                _line_delta = _total_lines_after - _total_lines_before
-            except Exception:
+            else:
                 _line_delta = replace_lines - search_lines
             if _line_delta > 0:
                 delta_str = f"+{_line_delta} lines"
@@ -2,6 +2,10 @@ from janito.tools.tool_base import ToolBase, ToolPermissions
 from janito.report_events import ReportAction
 from janito.tools.adapters.local.adapter import register_local_tool
 from janito.i18n import tr
+from janito.tools.adapters.local.bash_session import (
+    bash_session_enabled,
+    get_bash_session,
+)
 import subprocess
 import tempfile
 import sys
@@ -22,6 +26,10 @@ class RunBashCommandTool(ToolBase):
         requires_user_input (bool): If True, warns that the command may require user input and might hang. Defaults to False. Non-interactive commands are preferred for automation and reliability.
         silent (bool): If True, suppresses progress and status messages. Defaults to False.
 
+    When the ``bash_session`` config key is enabled, commands run in one persistent
+    bash session: the working directory, environment variables and shell functions
+    carry over from one call to the next. A timed-out command restarts the session.
+
     Returns:
         str: File paths and line counts for stdout and stderr.
     """
@@ -65,6 +73,8 @@ class RunBashCommandTool(ToolBase):
                 ReportAction.EXECUTE,
             )
             sys.stdout.flush()
+        if bash_session_enabled():
+            return self._run_in_session(command, timeout, requires_user_input, silent)
         try:
             with (
                 tempfile.NamedTemporaryFile(
@@ -136,48 +146,99 @@ class RunBashCommandTool(ToolBase):
                         ),
                         ReportAction.EXECUTE,
                     )
-                max_lines = 100
                 # Read back the output for summary
                 stdout_file.seek(0)
                 stderr_file.seek(0)
-                stdout_content = stdout_file.read()
-                stderr_content = stderr_file.read()
-                stdout_lines = counter["stdout"]
-                stderr_lines = counter["stderr"]
-                warning_msg = ""
-                if requires_user_input:
-                    warning_msg = tr(
-                        "⚠️  Warning: This command might be interactive, require user input, and might hang.\n"
-                    )
-                if stdout_lines <= max_lines and stderr_lines <= max_lines:
-                    result = warning_msg + tr(
-                        "Return code: {return_code}\n--- STDOUT ---\n{stdout_content}",
-                        return_code=return_code,
-                        stdout_content=stdout_content,
-                    )
-                    if stderr_content.strip():
-                        result += tr(
-                            "\n--- STDERR ---\n{stderr_content}",
-                            stderr_content=stderr_content,
-                        )
-                    return result
-                else:
-                    result = warning_msg + tr(
-                        "[LARGE OUTPUT]\nstdout_file: {stdout_file} (lines: {stdout_lines})\n",
-                        stdout_file=stdout_file.name,
-                        stdout_lines=stdout_lines,
-                    )
-                    if stderr_lines > 0:
-                        result += tr(
-                            "stderr_file: {stderr_file} (lines: {stderr_lines})\n",
-                            stderr_file=stderr_file.name,
-                            stderr_lines=stderr_lines,
-                        )
-                    result += tr(
-                        "returncode: {return_code}\nUse the view_file tool to inspect the contents of these files when needed.",
-                        return_code=return_code,
-                    )
-                    return result
+                return self._format_result(
+                    return_code,
+                    (stdout_file.name, stdout_file.read(), counter["stdout"]),
+                    (stderr_file.name, stderr_file.read(), counter["stderr"]),
+                    requires_user_input,
+                )
+        except Exception as e:
+            self.report_error(tr(" ❌ Error: {error}", error=e), ReportAction.EXECUTE)
+            return tr("Error running command: {error}", error=e)
+
+    def _format_result(self, return_code, stdout, stderr, requires_user_input):
+        """Summarize a finished command; stdout/stderr are (file, content, lines)."""
+        max_lines = 100
+        stdout_name, stdout_content, stdout_lines = stdout
+        stderr_name, stderr_content, stderr_lines = stderr
+        warning_msg = ""
+        if requires_user_input:
+            warning_msg = tr(
+                "⚠️  Warning: This command might be interactive, require user input, and might hang.\n"
+            )
+        if stdout_lines <= max_lines and stderr_lines <= max_lines:
+            result = warning_msg + tr(
+                "Return code: {return_code}\n--- STDOUT ---\n{stdout_content}",
+                return_code=return_code,
+                stdout_content=stdout_content,
+            )
+            if stderr_content.strip():
+                result += tr(
+                    "\n--- STDERR ---\n{stderr_content}",
+                    stderr_content=stderr_content,
+                )
+            return result
+        result = warning_msg + tr(
+            "[LARGE OUTPUT]\nstdout_file: {stdout_file} (lines: {stdout_lines})\n",
+            stdout_file=stdout_name,
+            stdout_lines=stdout_lines,
+        )
+        if stderr_lines > 0:
+            result += tr(
+                "stderr_file: {stderr_file} (lines: {stderr_lines})\n",
+                stderr_file=stderr_name,
+                stderr_lines=stderr_lines,
+            )
+        result += tr(
+            "returncode: {return_code}\nUse the view_file tool to inspect the contents of these files when needed.",
+            return_code=return_code,
+        )
+        return result
+
+    def _run_in_session(self, command, timeout, requires_user_input, silent):
+        session = get_bash_session()
+        try:
+            return_code, stdout_file, stderr_file = session.run(
+                command,
+                timeout,
+                report_stdout=lambda text: self.report_stdout(
+                    text.rstrip("\r\n"), ReportAction.EXECUTE
+                ),
+                report_stderr=lambda text: self.report_stderr(
+                    text.rstrip("\r\n"), ReportAction.EXECUTE
+                ),
+            )
         except Exception as e:
             self.report_error(tr(" ❌ Error: {error}", error=e), ReportAction.EXECUTE)
             return tr("Error running command: {error}", error=e)
+        if return_code is None:
+            self.report_error(
+                tr(" ❌ Timed out after {timeout} seconds.", timeout=timeout),
+                ReportAction.EXECUTE,
+            )
+            return tr(
+                "Command timed out after {timeout} seconds. The bash session was restarted.",
+                timeout=timeout,
+            )
+        if not silent:
+            self.report_success(
+                tr(" ✅ return code {return_code}", return_code=return_code),
+                ReportAction.EXECUTE,
+            )
+        result = self._format_result(
+            return_code,
+            (stdout_file.name, stdout_file.read(), stdout_file.lines),
+            (stderr_file.name, stderr_file.read(), stderr_file.lines),
+            requires_user_input,
+        )
+        for output in (stdout_file, stderr_file):
+            if output.truncated:
+                result += tr(
+                    "\n[{name} truncated at {limit} characters.]",
+                    name=output.name,
+                    limit=output.max_bytes,
+                )
+        return result
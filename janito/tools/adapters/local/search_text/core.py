@@ -6,8 +6,9 @@ from janito.i18n import tr
 import os
 from janito.tools.path_utils import expand_path
 from .pattern_utils import prepare_pattern, format_result, summarize_total
-from .match_lines import read_file_lines
-from .traverse_directory import traverse_directory
+from .scan_engine import SearchQuery, scan_file, scan_file_queries
+from .traverse_directory import traverse_directory, traverse_directory_queries
+from .trigram_index import get_trigram_index, required_trigrams
 from janito.tools.loop_protection_decorator import protect_against_loops
 
 
@@ -20,12 +21,13 @@ class SearchTextTool(ToolBase):
     Search for a text query in all files within one or more directories or file paths and return matching lines or counts. Respects .gitignore.
     Args:
         paths (str): String of one or more paths (space-separated) to search in. Each path can be a directory or a file.
-        query (str): Text or regular expression to search for in files. Must not be empty. When use_regex=True, this is treated as a regex pattern; otherwise as plain text.
+        query (str, optional): Text or regular expression to search for in files. Required unless queries is given; it may then be omitted. When use_regex=True, this is treated as a regex pattern; otherwise as plain text.
         use_regex (bool): If True, treat query as a regular expression. If False, treat as plain text (default).
         case_sensitive (bool): If False, perform a case-insensitive search. Default is True (case sensitive).
         max_depth (int, optional): Maximum directory depth to search. If 0 (default), search is recursive with no depth limit. If >0, limits recursion to that depth. Setting max_depth=1 disables recursion (only top-level directory). Ignored for file paths.
         max_results (int, optional): Maximum number of results to return. Defaults to 100. 0 means no limit.
         count_only (bool): If True, return only the count of matches per file and total, not the matching lines. Default is False.
+        queries (list[str], optional): Several texts or patterns to search for in a single pass over the files, as an alternative to (or in addition to) query. Results are grouped by query; max_results and count_only apply to each query separately.
     Returns:
         str: If count_only is False, matching lines from files as a newline-separated string, each formatted as 'filepath:lineno: line'.
              If count_only is True, returns per-file and total match counts.
@@ -46,36 +48,19 @@ class SearchTextTool(ToolBase):
         total_results,
         count_only,
     ):
-        if count_only:
-            match_count, dir_limit_reached, _ = read_file_lines(
-                search_path,
-                query,
-                regex,
-                use_regex,
-                case_sensitive,
-                True,
-                max_results,
-                total_results,
-            )
-            per_file_counts = [(search_path, match_count)] if match_count > 0 else []
-            return [], dir_limit_reached, per_file_counts
-        else:
-            dir_output, dir_limit_reached, match_count_list = read_file_lines(
-                search_path,
-                query,
-                regex,
-                use_regex,
-                case_sensitive,
-                False,
-                max_results,
-                total_results,
-            )
-            per_file_counts = (
-                [(search_path, len(match_count_list))]
-                if match_count_list and len(match_count_list) > 0
-                else []
-            )
-            return dir_output, dir_limit_reached, per_file_counts
+        limit = max(0, max_results - total_results) if max_results > 0 else 0
+        match_count, dir_output = scan_file(
+            search_path,
+            query,
+            regex,
+            use_regex,
+            case_sensitive,
+            count_only,
+            limit,
+        )
+        dir_limit_reached = limit > 0 and match_count >= limit
+        per_file_counts = [(search_path, match_count)] if match_count > 0 else []
+        return dir_output, dir_limit_reached, per_file_counts
 
     def _handle_path(
         self,
@@ -112,6 +97,12 @@ class SearchTextTool(ToolBase):
                 count_only,
             )
         else:
+            index = get_trigram_index()
+            required = (
+                required_trigrams(query, regex, use_regex, case_sensitive)
+                if index is not None
+                else None
+            )
             if count_only:
                 per_file_counts, dir_limit_reached, _ = traverse_directory(
                     search_path,
@@ -123,6 +114,8 @@ class SearchTextTool(ToolBase):
                     max_results,
                     total_results,
                     True,
+                    index=index,
+                    required_trigrams=required,
                 )
                 dir_output = []
             else:
@@ -136,6 +129,8 @@ class SearchTextTool(ToolBase):
                     max_results,
                     total_results,
                     False,
+                    index=index,
+                    required_trigrams=required,
                 )
         count = sum(count for _, count in per_file_counts)
         file_word = pluralize("match", count)
@@ -154,23 +149,139 @@ class SearchTextTool(ToolBase):
         )
         return info_str, dir_output, dir_limit_reached, per_file_counts
 
+    def _handle_path_queries(
+        self, search_path, specs, max_depth, max_results, count_only
+    ):
+        info_str = tr(
+            "🔍 Search {search_type} {queries} in '{disp_path}'",
+            search_type=("regex" if any(s.use_regex for s in specs) else "text"),
+            queries=", ".join(f"'{spec.query}'" for spec in specs),
+            disp_path=display_path(search_path),
+        )
+        if max_depth > 0:
+            info_str += tr(" [max_depth={max_depth}]", max_depth=max_depth)
+        if count_only:
+            info_str += " [count]"
+        self.report_action(info_str, ReportAction.READ)
+        if os.path.isfile(search_path):
+            matches = scan_file_queries(
+                search_path, specs, count_only, [max_results] * len(specs)
+            )
+            results = [
+                (
+                    lines,
+                    max_results > 0 and count >= max_results,
+                    [(search_path, count)] if count > 0 else [],
+                )
+                for count, lines in matches
+            ]
+        else:
+            index = get_trigram_index()
+            required = (
+                [required_trigrams(*spec) for spec in specs]
+                if index is not None
+                else None
+            )
+            results = traverse_directory_queries(
+                search_path,
+                specs,
+                max_depth,
+                max_results,
+                count_only,
+                index=index,
+                required=required,
+            )
+        count = sum(c for _, _, counts in results for _, c in counts)
+        num_files = len({path for _, _, counts in results for path, _ in counts})
+        file_word = pluralize("match", count)
+        file_label = pluralize("file", num_files)
+        if any(limit_reached for _, limit_reached, _ in results):
+            file_word += " (max)"
+        self.report_success(
+            tr(
+                " ✅ {count} {file_word}/{num_files} {file_label}",
+                count=count,
+                file_word=file_word,
+                num_files=num_files,
+                file_label=file_label,
+            ),
+            ReportAction.READ,
+        )
+        return info_str, results
+
+    def _run_queries(self, paths_list, specs, max_depth, max_results, count_only):
+        """Search several queries in one pass over each path, grouped by query."""
+        active = list(specs)
+        all_per_file_counts = {spec.query: [] for spec in specs}
+        results = []
+        for search_path in paths_list:
+            info_str, path_results = self._handle_path_queries(
+                search_path, active, max_depth, max_results, count_only
+            )
+            sections = [info_str]
+            still_active = []
+            for spec, (output, limit_reached, per_file_counts) in zip(
+                active, path_results
+            ):
+                all_per_file_counts[spec.query].extend(per_file_counts)
+                sections.append(
+                    tr("--- Results for '{query}' ---", query=spec.query)
+                    + "\n"
+                    + format_result(
+                        spec.query,
+                        spec.use_regex,
+                        output,
+                        limit_reached,
+                        count_only,
+                        per_file_counts,
+                    )
+                )
+                # Like a single search, a query stops at the path filling its limit
+                if not limit_reached:
+                    still_active.append(spec)
+            results.append("\n".join(sections))
+            active = still_active
+            if not active:
+                break
+        if count_only:
+            results.append(
+                "\n".join(
+                    f"Grand total matches for '{query}': "
+                    f"{sum(count for _, count in counts)}"
+                    for query, counts in all_per_file_counts.items()
+                )
+            )
+        return "\n\n".join(results)
+
     @protect_against_loops(max_calls=5, time_window=10.0, key_field="paths")
     def run(
         self,
         paths: str,
-        query: str,
+        query: str = "",
         use_regex: bool = False,
         case_sensitive: bool = False,
         max_depth: int = 0,
         max_results: int = 100,
         count_only: bool = False,
+        queries: list[str] = None,
     ) -> str:
-        regex, use_regex, error_msg = prepare_pattern(
-            query, use_regex, case_sensitive, self.report_error, self.report_warning
-        )
-        if error_msg:
-            return error_msg
+        query_list = list(query) if isinstance(query, (list, tuple)) else [query]
+        query_list = [q for q in query_list if q] + list(queries or [])
+        query_list = list(dict.fromkeys(query_list)) or [""]
+        specs = []
+        for query in query_list:
+            regex, is_regex, error_msg = prepare_pattern(
+                query, use_regex, case_sensitive, self.report_error, self.report_warning
+            )
+            if error_msg:
+                return error_msg
+            specs.append(SearchQuery(query, regex, is_regex, case_sensitive))
         paths_list = [expand_path(p) for p in paths.split()]
+        if len(specs) > 1:
+            return self._run_queries(
+                paths_list, specs, max_depth, max_results, count_only
+            )
+        query, regex, use_regex, _ = specs[0]
         results = []
         all_per_file_counts = []
         for search_path in paths_list:
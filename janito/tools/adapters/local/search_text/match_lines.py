@@ -1,23 +1,131 @@
 import re
-from janito.gitignore_utils import GitignoreFilter
 import os
 
 
-def is_binary_file(path, blocksize=1024):
+BINARY_CHECK_BYTES = 1024
+_TEXT_CHARACTERS = bytes(
+    bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)))
+)
+
+
+def is_binary_chunk(chunk):
+    """Binary heuristic applied to the first BINARY_CHECK_BYTES of a file."""
+    if b"\0" in chunk:
+        return True
+    nontext = chunk.translate(None, _TEXT_CHARACTERS)
+    return len(nontext) / max(1, len(chunk)) > 0.3
+
+
+def is_binary_file(path, blocksize=BINARY_CHECK_BYTES):
     try:
         with open(path, "rb") as f:
-            chunk = f.read(blocksize)
-            if b"\0" in chunk:
-                return True
-            text_characters = bytearray(
-                {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100))
-            )
-            nontext = chunk.translate(None, text_characters)
-            if len(nontext) / max(1, len(chunk)) > 0.3:
-                return True
+            return is_binary_chunk(f.read(blocksize))
     except Exception:
         return True
-    return False
+
+
+# Files at least this large are searched through an mmap instead of being read
+MMAP_THRESHOLD = 8 * 1024 * 1024
+# Returned by literal_byte_pattern() when no line of the buffer can match
+NO_MATCH = object()
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+
+def buffer_is_ascii(buf):
+    if isinstance(buf, bytes):
+        return buf.isascii()
+    return _NON_ASCII.search(buf) is None
+
+
+def literal_byte_pattern(query, case_sensitive, buf):
+    """
+    Return what finds lines matching the plain-text *query* directly in the raw
+    buffer: the query bytes, or an ASCII case-insensitive bytes regex. Returns None
+    when bytes cannot decide (the query holds a line break, or case-insensitive
+    search over non-ASCII text, where str.lower() folding applies).
+    """
+    if "\n" in query or "\r" in query:
+        return None
+    if case_sensitive:
+        return query.encode("utf-8")
+    if not buffer_is_ascii(buf):
+        return None
+    folded = query.lower()
+    if not folded.isascii():
+        return NO_MATCH
+    return re.compile(re.escape(folded.encode("ascii")), re.IGNORECASE)
+
+
+def _find(buf, pattern, pos):
+    if isinstance(pattern, bytes):
+        return buf.find(pattern, pos)
+    match = pattern.search(buf, pos)
+    return match.start() if match else -1
+
+
+def _is_utf8(buf):
+    if buffer_is_ascii(buf):
+        return True
+    try:
+        str(buf, "utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _line_bounds(buf, pos, has_cr):
+    """Return the (start, end) offsets of the line holding *pos*, sans terminator."""
+    start = buf.rfind(b"\n", 0, pos) + 1
+    end = buf.find(b"\n", pos)
+    if end == -1:
+        end = len(buf)
+    if has_cr:
+        # Universal newlines: a lone \r also ends a line, \r\n counts once
+        start = max(start, buf.rfind(b"\r", 0, pos) + 1)
+        cr = buf.find(b"\r", pos, end)
+        if cr != -1:
+            end = cr
+    return start, end
+
+
+def _count_line_breaks(segment, has_cr):
+    breaks = segment.count(b"\n")
+    if has_cr:
+        breaks += segment.count(b"\r") - segment.count(b"\r\n")
+    return breaks
+
+
+def match_literal_lines(path, buf, pattern, count_only, limit):
+    """
+    Search *buf* for *pattern* (see literal_byte_pattern) and return
+    (match_count, output_lines) with the line numbers text-mode reading would give.
+    Only the lines around hits are located and decoded. Returns None if the buffer
+    is not valid UTF-8, so the caller can fall back to the line-by-line reader.
+    """
+    if pattern is NO_MATCH:
+        return 0, []
+    pos = _find(buf, pattern, 0)
+    if pos == -1:
+        return 0, []
+    if not _is_utf8(buf):
+        return None
+    has_cr = buf.find(b"\r") != -1
+    count = 0
+    output = []
+    lineno = 1
+    counted = 0
+    while pos != -1:
+        start, end = _line_bounds(buf, pos, has_cr)
+        lineno += _count_line_breaks(buf[counted:start], has_cr)
+        counted = start
+        count += 1
+        if not count_only:
+            line = str(buf[start:end], "utf-8").rstrip()
+            output.append(f"{path}:{lineno}: {line}")
+        if limit > 0 and count >= limit:
+            break
+        pos = _find(buf, pattern, end)
+    return count, output
 
 
 def match_line(line, query, regex, use_regex, case_sensitive):
@@ -1,5 +1,6 @@
 import re
 from janito.i18n import tr
+from janito.report_events import ReportAction
 from janito.tools.tool_utils import pluralize
 
 
@@ -0,0 +1,307 @@
+"""
+Parallel file scanning for search_text.
+
+The directory walk stays on the calling thread and fixes the file order; a shared
+thread pool reads and matches files up to a window ahead of it. Each worker reads
+its file once as bytes (an mmap for large files) and runs the binary check on that
+buffer. Plain-text queries are then matched on the bytes themselves (see
+match_lines.match_literal_lines), so files without hits are never decoded.
+
+Per-file results are merged strictly in walk order and ``max_results`` is applied
+during the merge exactly as the sequential scan applied it, so the output does not
+depend on thread timing. Once the limit is reached no more files are submitted and
+queued ones are cancelled.
+
+Several queries can share one pass (scan_files_multi): each file is read, checked
+for binary content and, when needed, decoded and split into lines once, and every
+query is matched against that same buffer with its own limit and totals.
+
+The pool size comes from the ``search_text_workers`` config key.
+"""
+
+import mmap
+import os
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .match_lines import (
+    BINARY_CHECK_BYTES,
+    MMAP_THRESHOLD,
+    is_binary_chunk,
+    literal_byte_pattern,
+    match_line,
+    match_literal_lines,
+    read_file_lines,
+)
+from .trigram_index import entry_may_match
+
+WINDOW_PER_WORKER = 4
+
+# One prepared search_text query (see pattern_utils.prepare_pattern)
+SearchQuery = namedtuple("SearchQuery", "query regex use_regex case_sensitive")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_scan_workers():
+    """Return the configured number of scan threads (at least 1)."""
+    from janito.config import config
+
+    default = min(32, (os.cpu_count() or 1) + 4)
+    try:
+        value = config.get("search_text_workers")
+        return max(1, int(value)) if value not in (None, "") else default
+    except (TypeError, ValueError):
+        return default
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_scan_workers(), thread_name_prefix="janito-search"
+            )
+        return _executor
+
+
+def split_text_lines(text):
+    """Split decoded *text* like text-mode iteration (universal newlines)."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = text.split("\n")
+    last = lines.pop()
+    lines = [line + "\n" for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _read_buffer(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+        return f.read()
+
+
+def _match_text_lines(
+    path, text, lines, query, regex, use_regex, case_sensitive, count_only, limit
+):
+    count = 0
+    output = []
+    if not use_regex and not case_sensitive:
+        # Fold the whole text once instead of calling lower() on every line
+        folded_query = query.lower()
+        folded = split_text_lines(text.lower())
+        if len(folded) == len(lines):
+            matches = (folded_query in line for line in folded)
+        else:
+            matches = (folded_query in line.lower() for line in lines)
+    else:
+        matches = (
+            match_line(line, query, regex, use_regex, case_sensitive) for line in lines
+        )
+    for lineno, (line, matched) in enumerate(zip(lines, matches), 1):
+        if matched:
+            count += 1
+            if not count_only:
+                output.append(f"{path}:{lineno}: {line.rstrip()}")
+            if limit > 0 and count >= limit:
+                break
+    return count, output
+
+
+def _match_literal(path, buf, spec, count_only, limit):
+    """Match a plain-text query on the raw bytes; None when the text must be decoded."""
+    if spec.use_regex:
+        return None
+    pattern = literal_byte_pattern(spec.query, spec.case_sensitive, buf)
+    if pattern is None:
+        return None
+    return match_literal_lines(path, buf, pattern, count_only, limit)
+
+
+def _scan_text(path, buf, queries, count_only, limits, needs_text, results):
+    try:
+        text = str(buf, "utf-8")
+    except UnicodeDecodeError:
+        # Keep the sequential behaviour: lines before the undecodable chunk count
+        for i in needs_text:
+            count, _, output = read_file_lines(
+                path, *queries[i], count_only, limits[i], 0
+            )
+            results[i] = (count, output)
+        return
+    lines = split_text_lines(text)
+    for i in needs_text:
+        results[i] = _match_text_lines(
+            path, text, lines, *queries[i], count_only, limits[i]
+        )
+
+
+def _scan_buffer(path, buf, queries, count_only, limits):
+    """Return one (count, lines) per query; a query whose limit is None is skipped."""
+    results = [(0, [])] * len(queries)
+    if is_binary_chunk(buf[:BINARY_CHECK_BYTES]):
+        return results
+    needs_text = []
+    for i, (spec, limit) in enumerate(zip(queries, limits)):
+        if limit is None:
+            continue
+        result = _match_literal(path, buf, spec, count_only, limit)
+        if result is None:
+            needs_text.append(i)
+        else:
+            results[i] = result
+    if needs_text:
+        _scan_text(path, buf, queries, count_only, limits, needs_text, results)
+    return results
+
+
+def scan_file_queries(path, queries, count_only, limits, index=None, required=None):
+    """
+    Return one (match_count, output_lines) per query for one file, reading it once.
+    *limits* holds the per-query match limit (None skips the query); *required*
+    holds the per-query trigrams checked against the optional *index*.
+    """
+    limits = list(limits)
+    if index is not None:
+        entry = index.fresh_entry(path)
+        if entry is not None:
+            for i, trigrams in enumerate(required):
+                if not entry_may_match(entry, trigrams):
+                    limits[i] = None
+    if all(limit is None for limit in limits):
+        return [(0, [])] * len(queries)
+    try:
+        buf = _read_buffer(path)
+    except OSError:
+        return [(0, [])] * len(queries)
+    try:
+        return _scan_buffer(path, buf, queries, count_only, limits)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def scan_file(
+    path,
+    query,
+    regex,
+    use_regex,
+    case_sensitive,
+    count_only,
+    limit,
+    index=None,
+    required_trigrams=None,
+):
+    """
+    Return (match_count, output_lines) for one file, stopping at *limit* matches.
+    Plain-text queries are matched on the raw bytes (an mmap for large files), so
+    files without hits are never decoded; regexes run over the decoded lines.
+    """
+    spec = SearchQuery(query, regex, use_regex, case_sensitive)
+    return scan_file_queries(
+        path, [spec], count_only, [limit], index, [required_trigrams]
+    )[0]
+
+
+def scan_files(
+    paths,
+    query,
+    regex,
+    use_regex,
+    case_sensitive,
+    count_only,
+    max_results,
+    total_results=0,
+    index=None,
+    required_trigrams=None,
+):
+    """
+    Scan *paths* (an iterable in walk order) in parallel.
+    Returns (output_lines, limit_reached, per_file_counts) like the sequential scan.
+    """
+    spec = SearchQuery(query, regex, use_regex, case_sensitive)
+    return scan_files_multi(
+        paths,
+        [spec],
+        count_only,
+        max_results,
+        [total_results],
+        index=index,
+        required=[required_trigrams],
+    )[0]
+
+
+def _merge_file_results(path, results, max_results, merged):
+    """Add one file's per-query results to *merged*, honouring each query's budget."""
+    outputs, per_file_counts, totals, limit_reached = merged
+    for i, (count, lines) in enumerate(results):
+        if limit_reached[i]:
+            continue
+        if max_results > 0:
+            count = min(count, max_results - totals[i])
+            lines = lines[:count]
+        if count > 0:
+            per_file_counts[i].append((path, count))
+            outputs[i].extend(lines)
+        totals[i] += count
+        if max_results > 0 and totals[i] >= max_results:
+            limit_reached[i] = True
+
+
+def scan_files_multi(
+    paths, queries, count_only, max_results, totals=None, index=None, required=None
+):
+    """
+    Scan *paths* in parallel for several queries at once, reading each file once.
+    Returns one (output_lines, limit_reached, per_file_counts) per query; each query
+    has its own ``max_results`` budget and stops matching once it is spent.
+    """
+    executor = _get_executor()
+    window = get_scan_workers() * WINDOW_PER_WORKER
+    paths = iter(paths)
+    pending = deque()
+    outputs = [[] for _ in queries]
+    per_file_counts = [[] for _ in queries]
+    totals = list(totals) if totals is not None else [0] * len(queries)
+    limit_reached = [False] * len(queries)
+    if required is None:
+        required = [None] * len(queries)
+    merged = (outputs, per_file_counts, totals, limit_reached)
+
+    def fill():
+        limits = [None if done else max_results for done in limit_reached]
+        while len(pending) < window:
+            path = next(paths, None)
+            if path is None:
+                return
+            future = executor.submit(
+                scan_file_queries,
+                path,
+                queries,
+                count_only,
+                limits,
+                index,
+                required,
+            )
+            pending.append((path, future))
+
+    try:
+        fill()
+        while pending:
+            path, future = pending.popleft()
+            _merge_file_results(path, future.result(), max_results, merged)
+            if all(limit_reached):
+                break
+            fill()
+    finally:
+        for _, future in pending:
+            future.cancel()
+    return list(zip(outputs, limit_reached, per_file_counts))
@@ -1,78 +1,19 @@
 import os
+from janito.dir_snapshot import get_dir_snapshot
 from janito.gitignore_utils import GitignoreFilter
-from .match_lines import match_line, should_limit, read_file_lines
+from .scan_engine import scan_files, scan_files_multi
 
 
 def walk_directory(search_path, max_depth):
+    snapshot = get_dir_snapshot()
     if max_depth == 1:
-        walk_result = next(os.walk(search_path), None)
+        walk_result = next(snapshot.walk(search_path), None)
         if walk_result is None:
             return [(search_path, [], [])]
         else:
             return [walk_result]
     else:
-        return os.walk(search_path)
-
-
-def filter_dirs(dirs, root, gitignore_filter):
-    # Always exclude directories named .git, regardless of gitignore
-    return [
-        d
-        for d in dirs
-        if d != ".git" and not gitignore_filter.is_ignored(os.path.join(root, d))
-    ]
-
-
-def process_file_count_only(
-    path,
-    per_file_counts,
-    query,
-    regex,
-    use_regex,
-    case_sensitive,
-    max_results,
-    total_results,
-):
-    match_count, file_limit_reached, _ = read_file_lines(
-        path,
-        query,
-        regex,
-        use_regex,
-        case_sensitive,
-        True,
-        max_results,
-        total_results + sum(count for _, count in per_file_counts),
-    )
-    if match_count > 0:
-        per_file_counts.append((path, match_count))
-    return file_limit_reached
-
-
-def process_file_collect(
-    path,
-    dir_output,
-    per_file_counts,
-    query,
-    regex,
-    use_regex,
-    case_sensitive,
-    max_results,
-    total_results,
-):
-    actual_match_count, file_limit_reached, file_lines_output = read_file_lines(
-        path,
-        query,
-        regex,
-        use_regex,
-        case_sensitive,
-        False,
-        max_results,
-        total_results + len(dir_output),
-    )
-    dir_output.extend(file_lines_output)
-    if actual_match_count > 0:
-        per_file_counts.append((path, actual_match_count))
-    return file_limit_reached
+        return snapshot.walk(search_path)
 
 
 def should_limit_depth(root, search_path, max_depth, dirs):
@@ -84,6 +25,18 @@ def should_limit_depth(root, search_path, max_depth, dirs):
                 del dirs[:]
 
 
+def iter_search_files(search_path, max_depth):
+    """Yield the non-ignored files under *search_path* in walk order."""
+    walker = walk_directory(search_path, max_depth)
+    gitignore_filter = GitignoreFilter(search_path)
+    for root, dirs, files in walker:
+        # Prunes ignored directories (and .git) in place
+        dirs, files = gitignore_filter.filter_ignored(root, dirs, files)
+        for file in files:
+            yield os.path.join(root, file)
+        should_limit_depth(root, search_path, max_depth, dirs)
+
+
 def traverse_directory(
     search_path,
     query,
@@ -94,52 +47,48 @@ def traverse_directory(
     max_results,
     total_results,
     count_only,
+    index=None,
+    required_trigrams=None,
 ):
-    dir_output = []
-    dir_limit_reached = False
-    per_file_counts = []
-    walker = walk_directory(search_path, max_depth)
-    gitignore_filter = GitignoreFilter(search_path)
-
-    for root, dirs, files in walker:
-        dirs[:] = filter_dirs(dirs, root, gitignore_filter)
-        for file in files:
-            path = os.path.join(root, file)
-            if gitignore_filter.is_ignored(path):
-                continue
-            if count_only:
-                file_limit_reached = process_file_count_only(
-                    path,
-                    per_file_counts,
-                    query,
-                    regex,
-                    use_regex,
-                    case_sensitive,
-                    max_results,
-                    total_results,
-                )
-                if file_limit_reached:
-                    dir_limit_reached = True
-                    break
-            else:
-                file_limit_reached = process_file_collect(
-                    path,
-                    dir_output,
-                    per_file_counts,
-                    query,
-                    regex,
-                    use_regex,
-                    case_sensitive,
-                    max_results,
-                    total_results,
-                )
-                if file_limit_reached:
-                    dir_limit_reached = True
-                    break
-        if dir_limit_reached:
-            break
-        should_limit_depth(root, search_path, max_depth, dirs)
+    """
+    Search the files under *search_path* on the parallel scan engine. With a trigram
+    *index*, files it proves cannot contain *required_trigrams* are never read.
+    """
+    dir_output, dir_limit_reached, per_file_counts = scan_files(
+        iter_search_files(search_path, max_depth),
+        query,
+        regex,
+        use_regex,
+        case_sensitive,
+        count_only,
+        max_results,
+        total_results,
+        index=index,
+        required_trigrams=required_trigrams,
+    )
+    if index is not None:
+        index.ensure_updated()  # re-index files found new or changed
     if count_only:
         return per_file_counts, dir_limit_reached, []
     else:
         return dir_output, dir_limit_reached, per_file_counts
+
+
+def traverse_directory_queries(
+    search_path, queries, max_depth, max_results, count_only, index=None, required=None
+):
+    """
+    Search the files under *search_path* for several queries in a single walk.
+    Returns one (output_lines, limit_reached, per_file_counts) per query.
+    """
+    results = scan_files_multi(
+        iter_search_files(search_path, max_depth),
+        queries,
+        count_only,
+        max_results,
+        index=index,
+        required=required,
+    )
+    if index is not None:
+        index.ensure_updated()
+    return results
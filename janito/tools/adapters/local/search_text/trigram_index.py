@@ -0,0 +1,325 @@
+"""
+Optional on-disk trigram index used by search_text to skip files that cannot match.
+
+Enable it with the ``search_text_index`` config key. The index lives in
+``<workdir>/.janito/search_index/`` and is built by a background thread on the first
+search. For each file it stores the mtime/size it was built from and a compact
+signature: a bit set of the hashed byte trigrams of the file's lowercased text
+(with newlines normalised the way text-mode reads see them).
+
+The index only ever narrows the scan. The directory walk, gitignore rules,
+ordering and line matching are unchanged; a file is skipped only when its entry is
+fresh (same mtime and size) and at least one trigram every match would need is
+missing from the signature. Files that are new, changed, undecodable or too large
+are scanned as before and queued for re-indexing, so results are identical to an
+unindexed search.
+"""
+
+import os
+import re
+import threading
+
+from janito.dir_snapshot import get_dir_snapshot
+from janito.gitignore_utils import GitignoreFilter
+from .match_lines import BINARY_CHECK_BYTES, is_binary_chunk
+
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite: the index is simply unavailable
+    sqlite3 = None
+
+try:
+    import re._parser as sre_parse
+except ImportError:
+    import sre_parse
+
+INDEX_DIR = os.path.join(".janito", "search_index")
+INDEX_FILE = "trigrams.sqlite3"
+INDEX_FORMAT = 1
+MAX_INDEXED_BYTES = 16 * 1024 * 1024
+MIN_SIGNATURE_BITS = 256
+MAX_SIGNATURE_BITS = 1 << 16
+WRITE_BATCH = 500
+
+# Entry kinds
+TEXT, BINARY, OPAQUE = 0, 1, 2
+
+
+def _trigram_hash(trigram):
+    # Fibonacci hashing; the top 16 bits cover the largest signature
+    return ((trigram * 0x9E3779B1) & 0xFFFFFFFF) >> 16
+
+
+def _trigrams(data):
+    return {
+        a << 16 | b << 8 | c for a, b, c in set(zip(data, data[1:], data[2:]))
+    }
+
+
+def build_signature(trigrams):
+    """Return (bits, signature bytes) for a set of trigram integers."""
+    bits = MIN_SIGNATURE_BITS
+    while bits < 2 * len(trigrams) and bits < MAX_SIGNATURE_BITS:
+        bits <<= 1
+    mask = bits - 1
+    signature = bytearray(bits >> 3)
+    for trigram in trigrams:
+        h = _trigram_hash(trigram) & mask
+        signature[h >> 3] |= 1 << (h & 7)
+    return bits, bytes(signature)
+
+
+def signature_may_contain(bits, signature, required):
+    mask = bits - 1
+    for trigram in required:
+        h = _trigram_hash(trigram) & mask
+        if not signature[h >> 3] & (1 << (h & 7)):
+            return False
+    return True
+
+
+def entry_may_match(entry, required):
+    """False only if a fresh index *entry* proves a match is impossible."""
+    kind, bits, signature = entry[2:]
+    if kind == BINARY:
+        return False
+    if kind == OPAQUE or not required:
+        return True
+    return signature_may_contain(bits, signature, required)
+
+
+def analyze_file(path):
+    """Return an index entry (mtime_ns, size, kind, bits, signature) for *path*."""
+    st = os.stat(path)
+    entry = (st.st_mtime_ns, st.st_size)
+    if st.st_size > MAX_INDEXED_BYTES:
+        return entry + (OPAQUE, 0, b"")
+    with open(path, "rb") as f:
+        data = f.read()
+    if is_binary_chunk(data[:BINARY_CHECK_BYTES]):
+        return entry + (BINARY, 0, b"")
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        # The scan stops at the first undecodable chunk; never skip such files
+        return entry + (OPAQUE, 0, b"")
+    text = text.replace("\r\n", "\n").replace("\r", "\n").lower()
+    return entry + (TEXT,) + build_signature(_trigrams(text.encode("utf-8")))
+
+
+def _literal_trigrams(literal):
+    # str.lower() is per character except for the final-sigma rule
+    if "Σ" in literal:
+        return set()
+    data = literal.lower().encode("utf-8")
+    return _trigrams(data) if len(data) >= 3 else set()
+
+
+def _regex_literal_runs(pattern):
+    """Literal strings every match of *pattern* must contain (top level only)."""
+    runs, current = [], []
+    for op, av in sre_parse.parse(pattern):
+        if op is sre_parse.LITERAL:
+            current.append(chr(av))
+            continue
+        if current:
+            runs.append("".join(current))
+            current = []
+    if current:
+        runs.append("".join(current))
+    return runs
+
+
+def required_trigrams(query, regex, use_regex, case_sensitive):
+    """
+    Return trigrams that any line matched by the search must contain, as they
+    appear in the indexed (lowercased) text; an empty set means "no narrowing".
+    """
+    if not use_regex:
+        if case_sensitive:
+            return _literal_trigrams(query)
+        # The scan compares query.lower() with line.lower(): exact for the index
+        return _trigrams(query.lower().encode("utf-8"))
+    if regex is None or regex.flags & re.IGNORECASE:
+        return set()
+    try:
+        runs = _regex_literal_runs(regex.pattern)
+    except Exception:
+        return set()
+    required = set()
+    for run in runs:
+        required |= _literal_trigrams(run)
+    return required
+
+
+def index_enabled():
+    from janito.config import config
+
+    value = config.get("search_text_index")
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+class TrigramIndex:
+    """Trigram signatures for the files under *root*, persisted in SQLite."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.index_dir = os.path.join(self.root, INDEX_DIR)
+        self.db_path = os.path.join(self.index_dir, INDEX_FILE)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._stale = set()
+        self._thread = None
+
+    # --- lookups (search threads) ---
+
+    def relpath(self, path):
+        try:
+            rel = os.path.relpath(os.path.abspath(path), self.root)
+        except ValueError:  # different drive on Windows
+            return None
+        return None if rel.startswith(os.pardir) else rel
+
+    def fresh_entry(self, path):
+        """Return the entry for *path* if it is indexed and unchanged, else None."""
+        rel = self.relpath(path)
+        entry = self._entries.get(rel) if rel is not None else None
+        if entry is None:
+            if rel is not None:
+                self._mark_stale(rel)
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != entry[:2]:
+            self._mark_stale(rel)
+            return None
+        return entry
+
+    def may_match(self, path, required):
+        """False only if *path* is indexed, unchanged and lacks a required trigram."""
+        entry = self.fresh_entry(path)
+        return entry is None or entry_may_match(entry, required)
+
+    def _mark_stale(self, rel):
+        with self._lock:
+            self._stale.add(rel)
+
+    # --- maintenance (background thread) ---
+
+    def ensure_updated(self):
+        """Start a background build/refresh unless one is already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            full = self._thread is None
+            stale, self._stale = self._stale, set()
+            if not full and not stale:
+                return
+            self._thread = threading.Thread(
+                target=self._update,
+                args=(full, stale),
+                name="janito-trigram-index",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _connect(self):
+        # Only the SQLite file is created: it is binary, so searches never list it
+        os.makedirs(self.index_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_FORMAT:
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute(f"PRAGMA user_version = {INDEX_FORMAT}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, "
+            "mtime_ns INTEGER, size INTEGER, kind INTEGER, bits INTEGER, "
+            "signature BLOB)"
+        )
+        return conn
+
+    def _update(self, full, stale):
+        try:
+            conn = self._connect()
+        except (OSError, sqlite3.Error):
+            return
+        try:
+            if full:
+                for path, *entry in conn.execute("SELECT * FROM files"):
+                    self._entries.setdefault(path, tuple(entry))
+                self._refresh(conn, self._walk(), prune=True)
+            else:
+                self._refresh(conn, sorted(stale))
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+    def _walk(self):
+        gitignore = GitignoreFilter(self.root)
+        skip_dir = os.path.join(self.root, ".janito")
+        for root, dirs, files in get_dir_snapshot().walk(self.root):
+            dirs[:] = [d for d in dirs if os.path.join(root, d) != skip_dir]
+            dirs, files = gitignore.filter_ignored(root, dirs, files)
+            for name in files:
+                yield os.path.relpath(os.path.join(root, name), self.root)
+
+    def _refresh(self, conn, relpaths, prune=False):
+        seen = set()
+        pending = []
+        for rel in relpaths:
+            seen.add(rel)
+            path = os.path.join(self.root, rel)
+            current = self._entries.get(rel)
+            try:
+                st = os.stat(path)
+                if current and current[:2] == (st.st_mtime_ns, st.st_size):
+                    continue
+                entry = analyze_file(path)
+            except OSError:
+                self._entries.pop(rel, None)
+                conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                continue
+            self._entries[rel] = entry
+            pending.append((rel,) + entry)
+            if len(pending) >= WRITE_BATCH:
+                self._write(conn, pending)
+                pending = []
+        self._write(conn, pending)
+        if prune:
+            gone = [rel for rel in list(self._entries) if rel not in seen]
+            for rel in gone:
+                self._entries.pop(rel, None)
+            conn.executemany("DELETE FROM files WHERE path = ?", [(r,) for r in gone])
+            conn.commit()
+
+    @staticmethod
+    def _write(conn, rows):
+        if rows:
+            conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            conn.commit()
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_trigram_index(root=None):
+    """Return the shared index for *root* (default: workdir); None when disabled."""
+    if sqlite3 is None or not index_enabled():
+        return None
+    root = os.path.abspath(root or os.getcwd())
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = TrigramIndex(root)
+    index.ensure_updated()
+    return index
@@ -7,62 +7,17 @@ from janito.tools.adapters.local.adapter import register_local_tool
 from janito.tools.tool_utils import display_path
 from janito.tools.adapters.local.adapter import register_local_tool as register_tool
 
-from .python_validator import validate_python
-from .json_validator import validate_json
-from .yaml_validator import validate_yaml
-from .ps1_validator import validate_ps1
-from .xml_validator import validate_xml
-from .html_validator import validate_html
-from .markdown_validator import validate_markdown
-from .js_validator import validate_js
-from .css_validator import validate_css
-from .jinja2_validator import validate_jinja2
+from .service import get_validation_service
 from janito.tools.loop_protection_decorator import protect_against_loops
 
 
-def _get_validator(ext):
-    """Return the appropriate validator function for the file extension."""
-    mapping = {
-        ".py": validate_python,
-        ".pyw": validate_python,
-        ".json": validate_json,
-        ".yml": validate_yaml,
-        ".yaml": validate_yaml,
-        ".ps1": validate_ps1,
-        ".xml": validate_xml,
-        ".html": validate_html,
-        ".htm": validate_html,
-        ".md": validate_markdown,
-        ".js": validate_js,
-        ".css": validate_css,
-        ".j2": validate_jinja2,
-        ".jinja2": validate_jinja2,
-    }
-    return mapping.get(ext)
-
-
-def _handle_validation_error(e, report_warning):
-    msg = tr("⚠️ Warning: Syntax error: {error}", error=e)
-    if report_warning:
-        report_warning(msg)
-    return msg
-
-
 def validate_file_syntax(
     path: str, report_info=None, report_warning=None, report_success=None
 ) -> str:
-    ext = os.path.splitext(path)[1].lower()
-    validator = _get_validator(ext)
-    try:
-        if validator:
-            return validator(path)
-        else:
-            msg = tr("⚠️ Warning: Unsupported file extension: {ext}", ext=ext)
-            if report_warning:
-                report_warning(msg)
-            return msg
-    except Exception as e:
-        return _handle_validation_error(e, report_warning)
+    msg, is_error = get_validation_service().validate(path)
+    if is_error and report_warning:
+        report_warning(msg)
+    return msg
 
 
 class ValidateFileSyntaxTool(ToolBase):
@@ -78,12 +33,18 @@ class ValidateFileSyntaxTool(ToolBase):
       - HTML (.html, .htm) [lxml]
       - Markdown (.md)
       - JavaScript (.js)
+      - CSS (.css)
       - Jinja2 templates (.j2, .jinja2)
 
+    Results are cached by file content, so validating unchanged files again is
+    cheap. To check the files touched by a multi-file change, pass them all in
+    ``paths`` once instead of validating after each edit.
+
     Args:
-        path (str): Path to the file to validate.
+        path (str, optional): Path to the file to validate.
+        paths (list[str], optional): Paths of several files to validate in one call. They are validated concurrently.
     Returns:
-        str: Validation status message. Example:
+        str: Validation status message; with ``paths``, one '<path>: <message>' entry per file. Example:
             - "✅ Syntax OK"
             - "⚠️ Warning: Syntax error: <error message>"
             - "⚠️ Warning: Unsupported file extension: <ext>"
@@ -93,7 +54,11 @@ class ValidateFileSyntaxTool(ToolBase):
     tool_name = "validate_file_syntax"
 
     @protect_against_loops(max_calls=5, time_window=10.0, key_field="path")
-    def run(self, path: str) -> str:
+    def run(self, path: str = "", paths: list[str] = None) -> str:
+        if paths:
+            return self._validate_paths(([path] if path else []) + list(paths))
+        if not path:
+            return tr("Error: No path provided.")
         path = expand_path(path)
         disp_path = display_path(path)
         self.report_action(
@@ -112,3 +77,26 @@ class ValidateFileSyntaxTool(ToolBase):
             self.report_success(result, ReportAction.READ)
 
         return result
+
+    def _validate_paths(self, paths):
+        paths = [expand_path(p) for p in paths]
+        self.report_action(
+            tr(
+                "🔎 Validate syntax for {count} files ...",
+                count=len(paths),
+            ),
+            ReportAction.READ,
+        )
+        results = get_validation_service().validate_many(paths)
+        errors = 0
+        output = []
+        for path, (msg, is_error) in zip(paths, results):
+            if is_error or not msg.startswith("✅"):
+                errors += 1
+                self.report_warning(f"{display_path(path)}: {msg}")
+            output.append(f"{display_path(path)}: {msg}")
+        if not errors:
+            self.report_success(
+                tr("✅ {count} files OK", count=len(paths)), ReportAction.READ
+            )
+        return "\n".join(output)
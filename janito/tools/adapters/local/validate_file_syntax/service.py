@@ -0,0 +1,131 @@
+"""
+Syntax validation service shared by validate_file_syntax and the edit tools.
+
+Validator modules are imported the first time a file of their type is validated,
+so heavy dependencies (lxml, yaml, jinja2) cost nothing until they are needed.
+Results are cached by (file type, path, content hash), since messages name the
+file: validating a file again after an edit that did not change it is a hash
+lookup. A result is only cached if the file still has the hashed content after
+the validator ran.
+``validate_many`` validates a batch of paths on a worker pool, so the files
+touched by a multi-file change can be checked in one call.
+"""
+
+import hashlib
+import importlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from janito.i18n import tr
+
+MAX_CACHED_RESULTS = 1024
+
+# extension -> (validator module, function name)
+VALIDATORS = {
+    ".py": ("python_validator", "validate_python"),
+    ".pyw": ("python_validator", "validate_python"),
+    ".json": ("json_validator", "validate_json"),
+    ".yml": ("yaml_validator", "validate_yaml"),
+    ".yaml": ("yaml_validator", "validate_yaml"),
+    ".ps1": ("ps1_validator", "validate_ps1"),
+    ".xml": ("xml_validator", "validate_xml"),
+    ".html": ("html_validator", "validate_html"),
+    ".htm": ("html_validator", "validate_html"),
+    ".md": ("markdown_validator", "validate_markdown"),
+    ".js": ("js_validator", "validate_js"),
+    ".css": ("css_validator", "validate_css"),
+    ".j2": ("jinja2_validator", "validate_jinja2"),
+    ".jinja2": ("jinja2_validator", "validate_jinja2"),
+}
+
+
+class ValidationService:
+    """Lazily loaded validators plus an LRU cache of results by content hash."""
+
+    def __init__(self, max_entries=MAX_CACHED_RESULTS):
+        self.max_entries = max_entries
+        self._validators = {}
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def get_validator(self, ext):
+        """Return the validator function for *ext* (importing it once), or None."""
+        spec = VALIDATORS.get(ext)
+        if spec is None:
+            return None
+        with self._lock:
+            validator = self._validators.get(spec)
+            if validator is None:
+                module = importlib.import_module(f".{spec[0]}", __package__)
+                validator = self._validators[spec] = getattr(module, spec[1])
+        return validator
+
+    @staticmethod
+    def _digest(path):
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+    def validate(self, path):
+        """
+        Validate *path*. Returns (result message, is_error) where is_error is True
+        for syntax errors and unsupported extensions.
+        """
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in VALIDATORS:
+            return tr("⚠️ Warning: Unsupported file extension: {ext}", ext=ext), True
+        try:
+            digest = self._digest(path)
+        except OSError as e:
+            return tr("⚠️ Warning: Syntax error: {error}", error=e), True
+        key = (VALIDATORS[ext], os.path.abspath(path), digest)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+        try:
+            result = self.get_validator(ext)(path), False
+        except ImportError as e:
+            # A missing validator dependency says nothing about the content
+            return tr("⚠️ Warning: Syntax error: {error}", error=e), True
+        except Exception as e:
+            result = tr("⚠️ Warning: Syntax error: {error}", error=e), True
+        try:
+            if self._digest(path) != digest:
+                return result  # Changed while validating: the result may not match
+        except OSError:
+            return result
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result
+
+    def validate_many(self, paths):
+        """Validate *paths* on the worker pool; results are in the order of *paths*."""
+        if len(paths) <= 1:
+            return [self.validate(path) for path in paths]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(8, (os.cpu_count() or 1) + 2),
+                    thread_name_prefix="janito-validate",
+                )
+            executor = self._executor
+        return list(executor.map(self.validate, paths))
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+_service = ValidationService()
+
+
+def get_validation_service():
+    """Return the process-wide ValidationService."""
+    return _service
@@ -4,6 +4,7 @@ from janito.tools.adapters.local.adapter import register_local_tool
 from janito.tools.tool_utils import pluralize
 from janito.i18n import tr
 from janito.tools.loop_protection_decorator import protect_against_loops
+from janito.tools.adapters.local.line_index import INDEX_THRESHOLD, read_line_range
 
 
 @register_local_tool
@@ -44,9 +45,8 @@ class ViewFileTool(ToolBase):
         try:
             if os.path.isdir(path):
                 return self._list_directory(path, disp_path)
-            lines = self._read_file_lines(path)
-            selected, selected_len, total_lines = self._select_lines(
-                lines, from_line, to_line
+            selected, selected_len, total_lines = self._read_selected_lines(
+                path, from_line, to_line
             )
             self._report_success(selected_len, from_line, to_line, total_lines)
             header = self._format_header(
@@ -61,16 +61,16 @@ class ViewFileTool(ToolBase):
             return tr("Error reading file: {error}", error=e)
 
     def _list_directory(self, path, disp_path):
-        import os
+        from janito.dir_snapshot import get_dir_snapshot
 
         try:
-            entries = os.listdir(path)
-            entries.sort()
+            dirs, files = get_dir_snapshot().list_dir(path)
+            dir_names = set(dirs)
+            entries = sorted(dirs + files)
             # Suffix subdirectories with '/'
             formatted_entries = []
             for entry in entries:
-                full_path = os.path.join(path, entry)
-                if os.path.isdir(full_path):
+                if entry in dir_names:
                     formatted_entries.append(entry + "/")
                 else:
                     formatted_entries.append(entry)
@@ -84,6 +84,26 @@ class ViewFileTool(ToolBase):
             self.report_error(tr(" ❌ Error listing directory: {error}", error=e))
             return tr("Error listing directory: {error}", error=e)
 
+    def _read_selected_lines(self, path, from_line, to_line):
+        """
+        Return (selected, selected_len, total_lines). Ranges of large files are read
+        through the cached line index instead of loading the whole file.
+        """
+        import os
+
+        ranged = (
+            bool(from_line or to_line)
+            and (from_line or 0) >= 0
+            and (to_line or 0) >= 0
+        )
+        if ranged and os.path.getsize(path) >= INDEX_THRESHOLD:
+            selected, total_lines = read_line_range(
+                path, from_line - 1 if from_line else 0, to_line or None
+            )
+            return selected, len(selected), total_lines
+        lines = self._read_file_lines(path)
+        return self._select_lines(lines, from_line, to_line)
+
     def _read_file_lines(self, path):
         """Read all lines from the file."""
         with open(path, "r", encoding="utf-8", errors="replace") as f:
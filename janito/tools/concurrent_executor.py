@@ -0,0 +1,94 @@
+"""
+Concurrent execution of the tool calls contained in one assistant turn.
+
+Models frequently request several read-only tools at once (``view_file``,
+``search_text``, ``fetch_url``...). Running them one after the other makes the turn
+as slow as the sum of the calls; ``ConcurrentToolExecutor`` runs consecutive
+read-only calls on a bounded thread pool instead, while any call that needs write
+or execute permission, or prompts the user (``interactive`` tools such as
+``ask_user``), acts as a barrier and runs on its own, in order. Results are
+always returned in call order.
+
+The pool size comes from the ``tool_concurrency`` config key (default 4); a value
+of 1 restores fully sequential execution.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_TOOL_CONCURRENCY = 4
+
+
+def get_tool_concurrency():
+    """Return the configured maximum number of tools run in parallel (at least 1)."""
+    from janito.config import config
+
+    try:
+        value = config.get("tool_concurrency")
+        return max(1, int(value)) if value not in (None, "") else DEFAULT_TOOL_CONCURRENCY
+    except (TypeError, ValueError):
+        return DEFAULT_TOOL_CONCURRENCY
+
+
+class ConcurrentToolExecutor:
+    """
+    Runs FunctionCallMessageParts through a tools adapter, parallelising read-only calls.
+    Exceptions raised by a tool are returned as strings, matching the agent's sequential behaviour.
+    """
+
+    def __init__(self, tools_adapter, max_workers=None):
+        self.tools_adapter = tools_adapter
+        self.max_workers = max_workers or get_tool_concurrency()
+
+    def is_read_only(self, part):
+        """
+        True if the call targets a known, non-interactive tool that needs neither
+        write nor execute permission.
+        """
+        function = getattr(part, "function", None)
+        name = getattr(function, "name", None) or getattr(part, "name", None)
+        if not name:
+            return False
+        tool = self.tools_adapter.get_tool(name)
+        permissions = getattr(tool, "permissions", None)
+        if permissions is None or getattr(tool, "interactive", False):
+            return False
+        return not permissions.write and not permissions.execute
+
+    def _execute_one(self, part):
+        try:
+            return self.tools_adapter.execute_function_call_message_part(part)
+        except Exception as e:
+            # Return the error as the tool result instead of propagating it
+            return str(e)
+
+    def execute(self, parts):
+        """Execute *parts* and return their results in the same order."""
+        parts = list(parts)
+        results = [None] * len(parts)
+        batch = []  # indexes of consecutive read-only calls
+
+        def flush(pool):
+            if len(batch) == 1:
+                results[batch[0]] = self._execute_one(parts[batch[0]])
+            elif batch:
+                futures = [(i, pool.submit(self._execute_one, parts[i])) for i in batch]
+                for index, future in futures:
+                    results[index] = future.result()
+            batch.clear()
+
+        read_only = [self.is_read_only(part) for part in parts]
+        if self.max_workers <= 1 or sum(read_only) < 2:
+            return [self._execute_one(part) for part in parts]
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="janito-tool"
+        ) as pool:
+            for index, part in enumerate(parts):
+                if read_only[index]:
+                    batch.append(index)
+                    continue
+                # Write/execute and interactive calls run alone, after earlier calls
+                flush(pool)
+                results[index] = self._execute_one(part)
+            flush(pool)
+        return results
@@ -22,6 +22,7 @@ class ToolBase:
     """
 
     permissions: "ToolPermissions" = None  # Required: must be set by subclasses
+    interactive: bool = False  # True for tools that prompt the user on the terminal
 
     def __init__(self, name=None, event_bus=None):
         if self.permissions is None or not isinstance(
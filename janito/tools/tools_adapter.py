@@ -2,6 +2,10 @@ from janito.tools.tool_base import ToolBase
 from janito.tools.tool_events import ToolCallStarted, ToolCallFinished, ToolCallError
 from janito.exceptions import ToolCallException
 from janito.tools.tool_base import ToolPermissions
+import itertools
+
+# Process-wide counter so registry versions never repeat across adapters
+_registry_versions = itertools.count(1)
 
 
 class ToolsAdapterBase:
@@ -16,6 +20,13 @@ class ToolsAdapterBase:
         self._tools = tools or []
         self._event_bus = event_bus  # event bus can be set on all adapters
         self.verbose_tools = False
+        self.registry_version = next(_registry_versions)
+        # Per-adapter permission mask; None means "use the global AllowedPermissionsState"
+        self.allowed_permissions = None
+
+    def _bump_registry_version(self):
+        """Mark the tool registry as changed so cached tool schemas are rebuilt."""
+        self.registry_version = next(_registry_versions)
 
     def set_verbose_tools(self, value: bool):
         self.verbose_tools = value
@@ -28,11 +39,17 @@ class ToolsAdapterBase:
     def event_bus(self, bus):
         self._event_bus = bus
 
-    def is_tool_allowed(self, tool):
-        """Check if a tool is allowed based on current global AllowedPermissionsState."""
+    def get_allowed_permissions(self):
+        """Return this adapter's permission mask, falling back to the global AllowedPermissionsState."""
+        if self.allowed_permissions is not None:
+            return self.allowed_permissions
         from janito.tools.permissions import get_global_allowed_permissions
 
-        allowed_permissions = get_global_allowed_permissions()
+        return get_global_allowed_permissions()
+
+    def is_tool_allowed(self, tool):
+        """Check if a tool is allowed based on the adapter's (or the global) allowed permissions."""
+        allowed_permissions = self.get_allowed_permissions()
         perms = tool.permissions  # permissions are mandatory and type-checked
         # If all permissions are False, block all tools
         if not (
@@ -66,6 +83,7 @@ class ToolsAdapterBase:
 
     def add_tool(self, tool):
         self._tools.append(tool)
+        self._bump_registry_version()
 
     def _validate_arguments_against_schema(self, arguments: dict, schema: dict):
         properties = schema.get("properties", {})
@@ -1,6 +1,7 @@
 import inspect
 import typing
 import re
+import threading
 
 
 class ToolSchemaBase:
@@ -102,3 +103,70 @@ class ToolSchemaBase:
                 f"Tool '{tool_name}' is missing docstring documentation for parameter(s): {', '.join(undocumented)}.\nParameter documentation must be provided in the Tool class docstring, not the method docstring."
             )
         return func, tool_name, sig, summary, param_descs, return_desc, description
+
+
+class ToolSchemaCache:
+    """
+    Caches generated tool schemas so drivers do not re-validate and re-parse every
+    tool on each API call.
+
+    - Per-class schemas are cached by tool class.
+    - The payload handed to the provider is cached by the tools adapter's
+      ``registry_version`` (bumped on register/unregister) plus the current allowed
+      permissions and disabled tools, and the same list is returned across turns.
+      Callers must treat it as read-only.
+    """
+
+    MAX_PAYLOADS = 32
+    _MISSING = object()
+
+    def __init__(self, schema_for_class):
+        self._schema_for_class = schema_for_class
+        self._class_schemas = {}
+        self._payloads = {}
+        self._lock = threading.Lock()
+
+    def schemas_for_classes(self, tool_classes):
+        schemas = []
+        for tool_class in tool_classes:
+            with self._lock:
+                cached = self._class_schemas.get(tool_class, self._MISSING)
+            if cached is self._MISSING:
+                cached = self._schema_for_class(tool_class)
+                with self._lock:
+                    self._class_schemas[tool_class] = cached
+            if cached:
+                schemas.append(cached)
+        return schemas
+
+    def schemas_for_adapter(self, tools_adapter):
+        key = self._state_key(tools_adapter)
+        with self._lock:
+            payload = self._payloads.get(key)
+        if payload is None:
+            payload = self.schemas_for_classes(tools_adapter.get_tool_classes())
+            with self._lock:
+                if len(self._payloads) >= self.MAX_PAYLOADS:
+                    self._payloads.clear()
+                self._payloads[key] = payload
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._class_schemas.clear()
+            self._payloads.clear()
+
+    @staticmethod
+    def _state_key(tools_adapter):
+        from janito.tools.permissions import get_global_allowed_permissions
+        from janito.tools.disabled_tools import get_disabled_tools
+
+        get_permissions = getattr(
+            tools_adapter, "get_allowed_permissions", get_global_allowed_permissions
+        )
+        return (
+            id(tools_adapter),
+            getattr(tools_adapter, "registry_version", None),
+            tuple(get_permissions()),
+            frozenset(get_disabled_tools()),
+        )
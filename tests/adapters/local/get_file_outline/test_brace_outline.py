@@ -0,0 +1,197 @@
+import pytest
+from janito.tools.adapters.local.get_file_outline.brace_outline import (
+    parse_c_outline,
+    parse_go_outline,
+    parse_java_source_outline,
+    parse_js_outline,
+    parse_rust_outline,
+)
+from janito.tools.adapters.local.get_file_outline.core import GetFileOutlineTool
+from janito.tools.adapters.local.get_file_outline.registry import (
+    get_outline_engine,
+    register_outline_engine,
+)
+from janito.tools.adapters.local.get_file_outline.symbol_index import SymbolIndex
+
+
+pytestmark = pytest.mark.usefixtures("no_loop_protection")
+
+
+def summary(parse, source):
+    outline = parse(source.splitlines(True))
+    return [(o["type"], o["name"], o["start"], o["end"], o["parent"]) for o in outline]
+
+
+def test_js_outline_ignores_braces_in_strings_and_comments():
+    source = (
+        "// class Fake {\n"
+        "export class Foo extends Bar {\n"
+        "  static create(a = {}) {\n"
+        "    const s = `}${a}`;\n"
+        "  }\n"
+        "  handle = (e) => {\n"
+        "  }\n"
+        "}\n"
+        "export async function load(url) {\n"
+        "  function inner() { return '}' }\n"
+        "}\n"
+        "interface Shape { area(): number }\n"
+    )
+    assert summary(parse_js_outline, source) == [
+        ("class", "Foo", 2, 8, ""),
+        ("method", "create", 3, 5, "Foo"),
+        ("method", "handle", 6, 7, "Foo"),
+        ("function", "load", 9, 11, ""),
+        ("interface", "Shape", 12, 12, ""),
+    ]
+
+
+def test_js_outline_skips_regex_literals():
+    source = (
+        "class Foo {\n"
+        "  check(s) {\n"
+        "    return /[}]/.test(s) && s.split(/\\/{/g).length / 2 > 1;\n"
+        "  }\n"
+        "  static get z() {\n"
+        "    return 1;\n"
+        "  }\n"
+        "}\n"
+        "const half = (n) => {\n"
+        "  return n / 2 / 1;\n"
+        "}\n"
+    )
+    assert summary(parse_js_outline, source) == [
+        ("class", "Foo", 1, 8, ""),
+        ("method", "check", 2, 4, "Foo"),
+        ("method", "z", 5, 7, "Foo"),
+        ("function", "half", 9, 11, ""),
+    ]
+
+
+def test_go_outline_parents_methods_to_receiver():
+    source = (
+        "package main\n"
+        "type Point struct {\n"
+        "\tX int\n"
+        "}\n"
+        "func (p *Point) Move(dx int) {\n"
+        "\tif dx > 0 {\n"
+        "\t}\n"
+        "}\n"
+        "func main() {\n"
+        "\ts := `{`\n"
+        "}\n"
+    )
+    assert summary(parse_go_outline, source) == [
+        ("struct", "Point", 2, 4, ""),
+        ("method", "Move", 5, 8, "Point"),
+        ("function", "main", 9, 11, ""),
+    ]
+
+
+def test_rust_outline_impl_blocks_and_lifetimes():
+    source = (
+        "#[derive(Debug)]\n"
+        "pub struct Point<'a> { x: &'a str }\n"
+        "impl<'a> fmt::Display for Point<'a> {\n"
+        "    fn fmt(&self, f: &mut fmt::Formatter) -> fmt::Result {\n"
+        "        let c = '{';\n"
+        '        write!(f, r#"{"x"}"#)\n'
+        "    }\n"
+        "}\n"
+        "mod tests {\n"
+        "    fn helper() {}\n"
+        "}\n"
+    )
+    assert summary(parse_rust_outline, source) == [
+        ("struct", "Point", 2, 2, ""),
+        ("impl", "Point", 3, 8, ""),
+        ("method", "fmt", 4, 7, "Point"),
+        ("module", "tests", 9, 11, ""),
+        ("function", "helper", 10, 10, ""),
+    ]
+
+
+def test_c_family_outline():
+    source = (
+        "#define BRACE {\n"
+        "static const struct ops table = { 1 };\n"
+        "int main(int argc, char **argv) {\n"
+        "    return 0;\n"
+        "}\n"
+        "namespace app {\n"
+        "template <class T> class Box {\n"
+        "    T get() const { return value; }\n"
+        "};\n"
+        "}\n"
+        "int Box::size() { return 0; }\n"
+    )
+    assert summary(parse_c_outline, source) == [
+        ("function", "main", 3, 5, ""),
+        ("namespace", "app", 6, 10, ""),
+        ("class", "Box", 7, 9, "app"),
+        ("method", "get", 8, 8, "Box"),
+        ("method", "size", 11, 11, "Box"),
+    ]
+
+
+def test_java_outline_skips_annotations_and_anonymous_classes():
+    source = (
+        "@Entity\n"
+        "public class Foo<T> {\n"
+        "    @SuppressWarnings(\"unchecked\")\n"
+        "    public String toString() { return \"}\"; }\n"
+        "    private Runnable r = new Runnable() { public void run() {} };\n"
+        "}\n"
+    )
+    assert summary(parse_java_source_outline, source) == [
+        ("class", "Foo", 2, 6, ""),
+        ("method", "toString", 4, 4, "Foo"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("a.ts", "typescript"),
+        ("a.JSX", "javascript"),
+        ("a.go", "go"),
+        ("a.rs", "rust"),
+        ("a.hpp", "cpp"),
+        ("a.java", "java"),
+        ("a.txt", None),
+    ],
+)
+def test_registry_lookup(name, expected):
+    engine = get_outline_engine(name)
+    assert (engine.name if engine else None) == expected
+
+
+def test_registered_engine_is_used_by_tools(tmp_path, monkeypatch):
+    from janito.tools.adapters.local.get_file_outline import registry
+
+    monkeypatch.setattr(registry, "_engines", dict(registry._engines))
+
+    def parse_ini(lines):
+        return [
+            dict(type="class", name=line.strip("[]\n"), start=i, end=i, parent="")
+            for i, line in enumerate(lines, 1)
+            if line.startswith("[")
+        ]
+
+    register_outline_engine("ini", (".ini",), parse_ini)
+    path = tmp_path / "setup.ini"
+    path.write_text("[metadata]\nname = x\n[options]\n")
+    result = GetFileOutlineTool().run(str(path))
+    assert "Outline: 2 items (ini)" in result
+    index = SymbolIndex(str(tmp_path))
+    index.refresh()
+    assert [s.start for s in index.find("options")] == [3]
+
+
+def test_get_file_outline_go(tmp_path):
+    path = tmp_path / "main.go"
+    path.write_text("package main\n\nfunc main() {\n}\n")
+    result = GetFileOutlineTool().run(str(path))
+    assert "Outline: 1 items (go)" in result
+    assert "| function | main" in result
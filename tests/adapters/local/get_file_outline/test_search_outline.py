@@ -0,0 +1,101 @@
+import os
+from collections import OrderedDict
+
+import pytest
+from janito.tools.adapters.local.get_file_outline.python_outline import (
+    parse_python_outline,
+)
+from janito.tools.adapters.local.get_file_outline.search_outline import (
+    SearchOutlineTool,
+)
+from janito.tools.adapters.local.get_file_outline import symbol_index
+from janito.tools.adapters.local.get_file_outline.symbol_index import SymbolIndex
+
+
+pytestmark = pytest.mark.usefixtures("no_loop_protection")
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "models.py").write_text(
+        "LIMIT = 3\n"
+        "\n"
+        "class Model:\n"
+        '    """A model."""\n'
+        "\n"
+        "    @property\n"
+        "    def name(self):\n"
+        "        return 'm'\n"
+        "\n"
+        "    def save(self):\n"
+        "        def helper():\n"
+        "            pass\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    Model().save()\n"
+    )
+    (tmp_path / "pkg" / "service.py").write_text("def save_all(models):\n    pass\n")
+    return tmp_path
+
+
+def test_ast_outline(workspace):
+    with open(workspace / "pkg" / "models.py") as f:
+        outline = parse_python_outline(f.readlines())
+    summary = [
+        (o["type"], o["name"], o["start"], o["end"], o["parent"]) for o in outline
+    ]
+    assert summary == [
+        ("const", "LIMIT", 1, 1, ""),
+        ("class", "Model", 3, 12, ""),
+        ("method", "name", 7, 8, "Model"),
+        ("method", "save", 10, 12, "Model"),
+        ("function", "helper", 11, 12, "save"),
+        ("main", "__main__", 14, 14, ""),
+    ]
+    assert outline[1]["docstring"] == "A model."
+    assert outline[2]["decorators"] == ["@property"]
+    # Files that do not parse still get the line-based outline
+    assert parse_python_outline(["def broken(:\n", "    pass\n"])[0]["name"] == "broken"
+
+
+def test_index_updates_incrementally(workspace):
+    index = SymbolIndex(str(workspace))
+    assert index.refresh() == 2
+    assert [s.name for s in index.find("save")] == ["save", "save_all"]
+    assert [s.parent for s in index.find("Model.save")] == ["Model"]
+    assert index.refresh() == 0
+
+    (workspace / "pkg" / "service.py").write_text("class Saver:\n    pass\n")
+    (workspace / "pkg" / "models.py").unlink()
+    assert index.refresh() == 1
+    assert [s.name for s in index.find("save")] == ["Saver"]
+    assert index.find("Model") == []
+
+
+def test_search_outline_tool(workspace):
+    tool = SearchOutlineTool()
+    result = tool.run(str(workspace), "method:save")
+    path = os.path.join(str(workspace), "pkg", "models.py")
+    assert result == f"{path}:10-12: method Model.save"
+    assert tool.run(path, "name", exact=True) == f"{path}:7-8: method Model.name"
+    assert "No symbols found" in tool.run(str(workspace), "missing")
+
+
+def test_symbol_indexes_are_capped(tmp_path, monkeypatch):
+    monkeypatch.setattr(symbol_index, "_indexes", OrderedDict())
+    monkeypatch.setattr(symbol_index, "MAX_SYMBOL_INDEXES", 2)
+    first = symbol_index.get_symbol_index(str(tmp_path / "a"))
+    symbol_index.get_symbol_index(str(tmp_path / "b"))
+    assert symbol_index.get_symbol_index(str(tmp_path / "a")) is first
+    symbol_index.get_symbol_index(str(tmp_path / "c"))
+    assert list(symbol_index._indexes) == [str(tmp_path / "a"), str(tmp_path / "c")]
+
+
+def test_ast_outline_signatures_after_form_feed():
+    lines = ["def a():\n", "    pass\n", "\x0c\n", "def b(x):\n", "    return x\n"]
+    outline = parse_python_outline(lines)
+    assert [(item["name"], item["signature"]) for item in outline] == [
+        ("a", "def a():"),
+        ("b", "def b(x):"),
+    ]
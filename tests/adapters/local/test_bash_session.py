@@ -0,0 +1,74 @@
+import shutil
+import time
+
+import pytest
+from janito.tools.adapters.local import bash_session, run_bash_command
+from janito.tools.adapters.local.bash_session import BashSession, OutputRing
+from janito.tools.adapters.local.run_bash_command import RunBashCommandTool
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+
+
+@pytest.fixture
+def session():
+    s = BashSession()
+    yield s
+    s.close()
+
+
+def run(session, command, timeout=10):
+    return_code, stdout, stderr = session.run(command, timeout)
+    return return_code, stdout.read(), stderr.read()
+
+
+def test_state_persists_between_commands(session, tmp_path):
+    setup = f"cd {tmp_path}; export JANITO_X=1; f() {{ echo f$1; }}"
+    assert run(session, setup)[0] == 0
+    assert run(session, "pwd; echo $JANITO_X; f 2") == (0, f"{tmp_path}\n1\nf2\n", "")
+
+
+def test_errors_and_exit_do_not_break_the_session(session):
+    assert run(session, "echo out; echo err >&2; false") == (1, "out\n", "err\n")
+    assert run(session, "echo 'unclosed")[0] == 2
+    assert run(session, "printf partial") == (0, "partial", "")
+    assert run(session, "exit 3")[0] == 3
+    assert run(session, "echo again") == (0, "again\n", "")
+
+
+def test_timeout_restarts_the_session(session):
+    assert run(session, "sleep 5", timeout=0.5)[0] is None
+    assert run(session, "echo alive") == (0, "alive\n", "")
+
+
+def test_output_files_rotate_and_are_capped(tmp_path):
+    ring = OutputRing(size=2, max_bytes=10)
+    try:
+        names = []
+        for _ in range(3):
+            stdout, stderr = ring.open_pair()
+            stdout.write("line\n" * 5)
+            stdout.close()
+            stderr.close()
+            names.append(stdout.name)
+        assert names[0] == names[2] != names[1]
+        assert stdout.read() == "line\nline\n"
+        assert stdout.truncated and stdout.lines == 5
+    finally:
+        ring.cleanup()
+
+
+def test_tool_uses_session_when_enabled(monkeypatch, session):
+    monkeypatch.setattr(run_bash_command, "bash_session_enabled", lambda: True)
+    monkeypatch.setattr(run_bash_command, "get_bash_session", lambda: session)
+    tool = RunBashCommandTool()
+    tool.run("cd / && export JANITO_Y=ok", silent=True)
+    result = tool.run("echo $JANITO_Y; pwd", silent=True)
+    assert "Return code: 0\n--- STDOUT ---\nok\n/\n" in result
+    assert session.ring is not None
+    assert bash_session.get_bash_session() is bash_session.get_bash_session()
+
+
+def test_background_output_does_not_leak_into_next_command(session):
+    assert run(session, "(sleep 0.2; echo LATE; echo LATE >&2) &")[0] == 0
+    time.sleep(0.5)
+    assert run(session, "echo after") == (0, "after\n", "")
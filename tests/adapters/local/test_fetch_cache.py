@@ -0,0 +1,145 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+import pytest
+from janito.tools.adapters.local.fetch_cache import FetchCache, freshness_lifetime
+from janito.tools.adapters.local.fetch_url import FetchUrlTool
+
+NOW = 1_700_000_000
+HTTP_NOW = "Tue, 14 Nov 2023 22:13:20 GMT"
+
+
+pytestmark = pytest.mark.usefixtures("no_loop_protection")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FetchCache(tmp_path, max_bytes=10_000_000)
+
+
+def test_freshness_lifetime():
+    assert freshness_lifetime({"Cache-Control": "no-store, max-age=60"}) is None
+    assert freshness_lifetime({"Cache-Control": "no-cache"}) == 0
+    assert freshness_lifetime({"Cache-Control": "public, max-age=60"}) == 60
+    assert freshness_lifetime({"Cache-Control": 's-maxage="30", max-age=60'}) == 30
+    headers = {"Date": HTTP_NOW, "Expires": "Tue, 14 Nov 2023 22:23:20 GMT"}
+    assert freshness_lifetime(headers) == 600
+    assert freshness_lifetime({"Expires": "0"}) == 0
+    headers = {"Last-Modified": "Tue, 14 Nov 2023 21:13:20 GMT"}
+    assert freshness_lifetime(headers, now=NOW) == 360
+    assert freshness_lifetime({}) == 0
+
+
+def test_store_lookup_and_refresh(cache):
+    assert not cache.store("k", "u", "no validators", {})
+    assert not cache.store("k", "u", "private", {"Cache-Control": "no-store"})
+    assert cache.store("k", "u", "<p>page</p>", {"ETag": '"v1"'})
+    entry = cache.lookup("k")
+    assert entry.etag == '"v1"' and entry.expires <= time.time()
+    assert cache.read_body("k", entry) == "<p>page</p>"
+    cache.refresh("k", entry, {"Cache-Control": "max-age=3600"})
+    refreshed = cache.lookup("k")
+    assert refreshed.etag == '"v1"' and refreshed.expires > entry.expires
+
+
+def test_missing_object_is_a_miss(cache, tmp_path):
+    cache.store("k", "u", "body", {"Cache-Control": "max-age=60"})
+    for path in (tmp_path / "objects").rglob("*.gz"):
+        path.unlink()
+    assert cache.read_body("k", cache.lookup("k")) is None
+    assert cache.lookup("k") is None
+
+
+def test_extracted_text_is_reused(cache):
+    calls = []
+
+    def extract(body):
+        calls.append(body)
+        return body.upper()
+
+    assert cache.get_text("uncached", extract) == "UNCACHED"
+    cache.store("a", "u1", "same", {"Cache-Control": "max-age=60"})
+    cache.store("b", "u2", "same", {"Cache-Control": "max-age=60"})
+    assert cache.get_text("same", extract) == "SAME"
+    assert cache.get_text("same", extract) == "SAME"
+    assert calls == ["uncached", "same"]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = FetchCache(tmp_path, max_bytes=0)
+    for key in ("a", "b", "c"):
+        cache.store(key, key, f"body of {key}", {"Cache-Control": "max-age=60"})
+    cache.read_body("a", cache.lookup("a"))
+    cache.max_bytes = cache._execute("SELECT SUM(size) FROM responses")[0][0] - 1
+    cache.evict()
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") and cache.lookup("c")
+    assert len(list((tmp_path / "objects").rglob("*.gz"))) == 2
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+def test_tool_revalidates_stale_pages(monkeypatch, tmp_path):
+    monkeypatch.setattr(FetchUrlTool, "_save_cookies", lambda self: None)
+    tool = FetchUrlTool()
+    tool.http_cache = FetchCache(tmp_path, max_bytes=10_000_000)
+    requests_seen = []
+    replies = [
+        FakeResponse(200, "<p>hello</p>", {"ETag": '"v1"'}),
+        FakeResponse(304, headers={"Cache-Control": "max-age=60"}),
+    ]
+
+    def fake_get(url, headers=None, **kwargs):
+        requests_seen.append(headers.get("If-None-Match"))
+        return replies.pop(0)
+
+    monkeypatch.setattr(tool.session, "get", fake_get)
+    assert tool._fetch_url_content("https://example.com/") == "<p>hello</p>"
+    tool.session_cache.clear()
+    assert tool._fetch_url_content("https://example.com/") == "<p>hello</p>"
+    tool.session_cache.clear()
+    assert tool._fetch_url_content("https://example.com/") == "<p>hello</p>"
+    assert requests_seen == [None, '"v1"']
+
+
+def test_cold_config_import_loads_user_plugins(tmp_path):
+    plugins_dir = tmp_path / ".janito" / "plugins"
+    plugins_dir.mkdir(parents=True)
+    (plugins_dir / "hello.py").write_text(
+        textwrap.dedent(
+            """
+            from janito.plugins.base import Plugin, PluginMetadata
+
+            class HelloPlugin(Plugin):
+                def get_metadata(self):
+                    return PluginMetadata("hello", "1.0", "Hello", "Test")
+
+                def initialize(self):
+                    print("hello plugin loaded")
+            """
+        )
+    )
+    (tmp_path / ".janito" / "plugins.json").write_text(
+        json.dumps({"plugins": {"paths": [str(plugins_dir)], "load": {"hello": True}}})
+    )
+    env = {**os.environ, "HOME": str(tmp_path), "USERPROFILE": str(tmp_path)}
+    result = subprocess.run(
+        [sys.executable, "-c", "import janito.config"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=tmp_path,
+    )
+    assert "Warning" not in result.stdout + result.stderr
+    assert "hello plugin loaded" in result.stdout
@@ -0,0 +1,62 @@
+import os
+import pytest
+from janito.tools.adapters.local import python_code_run, python_file_run, python_pool
+from janito.tools.adapters.local.python_code_run import PythonCodeRunTool
+from janito.tools.adapters.local.python_file_run import PythonFileRunTool
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = python_pool.InterpreterPool()
+    monkeypatch.setattr(python_pool, "get_interpreter_pool", lambda: pool)
+    monkeypatch.setattr(python_pool, "_config_modules", lambda: ("decimal",))
+    for module in (python_code_run, python_file_run):
+        monkeypatch.setattr(module, "python_pool_enabled", lambda: True)
+    yield pool
+    pool.close()
+
+
+def test_code_runs_in_warm_child(pool, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("JANITO_POOL_TEST", "yes")
+    code = (
+        "import os, sys\n"
+        "print(os.getcwd(), os.environ['JANITO_POOL_TEST'], 'decimal' in sys.modules)\n"
+        "print('oops', file=sys.stderr)\n"
+        "sys.exit(4)\n"
+    )
+    result = PythonCodeRunTool().run(code, silent=True)
+    assert result.startswith("Return code: 4\n")
+    assert f"{tmp_path} yes True\n" in result
+    assert "STDERR ---\noops" in result
+    assert len(pool._idle) == 1
+
+
+def test_children_do_not_share_state(pool):
+    tool = PythonCodeRunTool()
+    tool.run("import json; json.marker = 1", silent=True)
+    result = tool.run("import json; print(hasattr(json, 'marker'))", silent=True)
+    assert "STDOUT ---\nFalse\n" in result
+
+
+def test_file_run_traceback_and_timeout(pool, tmp_path):
+    script = tmp_path / "fail.py"
+    script.write_text("import sys\nprint(sys.argv[0])\nraise ValueError('bad')\n")
+    result = PythonFileRunTool().run(str(script), silent=True)
+    assert result.startswith("Return code: 1\n")
+    assert f"STDOUT ---\n{script}\n" in result
+    assert 'File "python_forkserver' not in result
+    assert "ValueError: bad" in result
+    result = PythonCodeRunTool().run("import time; time.sleep(5)", 1, silent=True)
+    assert result == "Code timed out after 1 seconds."
+
+
+def test_falls_back_to_fresh_interpreter(pool, monkeypatch):
+    def broken(*args, **kwargs):
+        raise python_pool.WarmPoolError("no server")
+
+    monkeypatch.setattr(python_code_run, "run_warm", broken)
+    result = PythonCodeRunTool().run("import sys; print(sys.argv)", silent=True)
+    assert "STDOUT ---\n['']\n" in result
@@ -1,5 +1,9 @@
 import os
+import threading
+import time
+
 import pytest
+from janito.tools.adapters.local import read_files
 from janito.tools.adapters.local.read_files import ReadFilesTool
 
 
@@ -24,3 +28,80 @@ def test_read_files_tool(tmp_path, read_files_tool):
     assert str(file1.name) in result
     assert str(file2.name) in result
     assert str(missing_file.name) in result
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch, no_loop_protection):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _budgets(monkeypatch, per_file, total):
+    monkeypatch.setattr(read_files, "get_read_budgets", lambda: (per_file, total))
+
+
+def test_files_are_returned_in_order(workdir, monkeypatch):
+    _budgets(monkeypatch, 0, 0)
+    names = [f"f{n:02d}.txt" for n in range(40)]
+    for name in names:
+        (workdir / name).write_bytes(f"{name}\r\nbody\n".encode())
+    (workdir / "blob.bin").write_bytes(b"\0\1\2" * 100)
+
+    output = ReadFilesTool().run(names + ["blob.bin", "missing.txt"])
+
+    sections = output.split("--- File: ")[1:]
+    assert [s.split(" ---")[0].split(" (")[0] for s in sections] == names + [
+        "blob.bin",
+        "missing.txt",
+    ]
+    assert sections[0] == "f00.txt ---\nf00.txt\nbody\n\n\n"
+    assert "(binary, 300 bytes, skipped)" in sections[-2]
+    assert "(not found)" in sections[-1]
+
+
+def test_per_file_and_total_budgets(workdir, monkeypatch):
+    _budgets(monkeypatch, 10, 25)
+    (workdir / "a.txt").write_text("é" * 20, encoding="utf-8")
+    (workdir / "b.txt").write_text("0123456789abc")
+    (workdir / "c.txt").write_text("partly read")
+    (workdir / "d.txt").write_text("never read")
+
+    output = ReadFilesTool().run(["a.txt", "b.txt", "c.txt", "d.txt"])
+
+    assert "--- File: a.txt ---\nééééé\n" in output
+    assert "showing 10 of 40 bytes" in output
+    assert "--- File: b.txt ---\n0123456789\n" in output
+    assert "--- File: c.txt ---\npartl\n" in output
+    assert "d.txt" not in output
+    assert "reached: 1 more file not read" in output
+
+
+def test_read_ahead_stays_within_total_budget(workdir, monkeypatch):
+    _budgets(monkeypatch, 10, 45)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    original = read_files.read_file_head
+
+    def tracking_read(path, max_bytes):
+        with lock:
+            in_flight.append(max_bytes)
+            peak.append(sum(in_flight))
+        time.sleep(0.01)
+        try:
+            return original(path, max_bytes)
+        finally:
+            with lock:
+                in_flight.remove(max_bytes)
+
+    monkeypatch.setattr(read_files, "read_file_head", tracking_read)
+    names = [f"f{n}.txt" for n in range(8)]
+    for name in names:
+        (workdir / name).write_text("0123456789")
+
+    output = ReadFilesTool().run(names)
+
+    assert max(peak) <= 45
+    assert output.count("0123456789\n") == 4
+    assert "--- File: f4.txt ---\n01234\n" in output
+    assert "reached: 3 more files not read" in output
@@ -0,0 +1,104 @@
+import os
+import pytest
+from janito.tools.adapters.local import replace_text_in_file
+from janito.tools.adapters.local.replace_text_in_file import ReplaceTextInFileTool
+
+
+@pytest.fixture
+def tool():
+    return ReplaceTextInFileTool()
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        replace_text_in_file,
+        "validate_file_syntax",
+        lambda path: calls.append(path) or "✅ Syntax valid",
+    )
+    return calls
+
+
+def test_match_lines(tool):
+    content = "a x\nb\nx x\n\nxx\nend x"
+    assert tool._find_match_lines(content, "x") == [1, 3, 3, 5, 5, 6]
+    assert tool._find_match_lines(content, "x\nb") == [1]
+    assert tool._find_match_lines(content, "missing") == []
+
+
+def test_single_replacement(tmp_path, tool, validations):
+    path = tmp_path / "mod.py"
+    path.write_text("a = 1\nb = 2\n")
+    result = tool.run(str(path), "b = 2", "b = 3\nc = 4")
+    assert path.read_text() == "a = 1\nb = 3\nc = 4\n"
+    assert "Match found at line 2" in result
+    assert validations == [str(path)]
+
+
+def test_batch_edits_write_and_validate_once(tmp_path, tool, validations):
+    path = tmp_path / "mod.py"
+    path.write_text("a = 1\nb = 2\nc = 1\n")
+    path.chmod(0o640)
+    edits = [
+        {"search_text": "a = 1", "replacement_text": "a = 10"},
+        {"search_text": "= 1", "replacement_text": "= 5", "replace_all": True},
+        {"search_text": "b = 2\n", "replacement_text": ""},
+    ]
+    result = tool.run(str(path), edits=edits)
+    assert path.read_text() == "a = 50\nc = 5\n"
+    assert "3 edits applied" in result
+    assert "Edit 2: replaced 2 occurrence(s) at line(s) 1, 3." in result
+    assert validations == [str(path)]
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["mod.py"]
+
+
+def test_failing_edit_leaves_file_untouched(tmp_path, tool, validations):
+    path = tmp_path / "mod.py"
+    path.write_text("x = 1\nx = 1\n")
+    edits = [
+        {"search_text": "x = 1\nx", "replacement_text": "y = 1\nx"},
+        {"search_text": "x = 1", "replacement_text": "z = 1"},
+        {"search_text": "missing", "replacement_text": ""},
+    ]
+    result = tool.run(str(path), edits=edits)
+    assert "edit 3 is not found" in result
+    assert path.read_text() == "x = 1\nx = 1\n"
+    assert validations == []
+
+
+@pytest.mark.parametrize("replacement", [{}, {"replacement_text": None}])
+def test_edit_without_replacement_text_is_rejected(
+    tmp_path, tool, validations, replacement
+):
+    path = tmp_path / "mod.py"
+    path.write_text("x = 1\n")
+    edits = [
+        {"search_text": "1", "replacement_text": "2"},
+        {"search_text": "x", **replacement},
+    ]
+    result = tool.run(str(path), edits=edits)
+    assert "Edit 2 has no replacement_text" in result
+    assert path.read_text() == "x = 1\n"
+    assert validations == []
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_edit_through_symlink_and_hard_link_keeps_links(tmp_path, tool, validations):
+    target = tmp_path / "real.py"
+    target.write_text("a = 1\n")
+    link = tmp_path / "link.py"
+    try:
+        os.symlink(target, link)
+    except OSError:
+        pytest.skip("symlinks not permitted")
+    tool.run(str(link), "a = 1", "a = 2")
+    assert link.is_symlink()
+    assert target.read_text() == "a = 2\n"
+
+    hard = tmp_path / "hard.py"
+    os.link(target, hard)
+    tool.run(str(hard), "a = 2", "a = 3")
+    assert target.read_text() == "a = 3\n"
+    assert os.path.samefile(target, hard)
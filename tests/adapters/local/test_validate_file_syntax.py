@@ -0,0 +1,86 @@
+import pytest
+from janito.tools.adapters.local.validate_file_syntax import service
+from janito.tools.adapters.local.validate_file_syntax.core import (
+    ValidateFileSyntaxTool,
+)
+from janito.tools.adapters.local.validate_file_syntax.service import (
+    ValidationService,
+)
+
+
+pytestmark = pytest.mark.usefixtures("no_loop_protection")
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """A fresh service whose JSON validator counts its calls."""
+    calls = []
+    svc = ValidationService()
+    svc.get_validator(".json")
+    validate_json = svc._validators[service.VALIDATORS[".json"]]
+    svc._validators[service.VALIDATORS[".json"]] = (
+        lambda path: calls.append(path) or validate_json(path)
+    )
+    monkeypatch.setattr(service, "_service", svc)
+    return calls
+
+
+def test_results_cached_by_path_and_content(tmp_path, counted):
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    a.write_text('{"x": 1}')
+    b.write_text('{"x": 1}')
+    svc = service.get_validation_service()
+    assert svc.validate(str(a)) == ("✅ OK", False)
+    assert svc.validate(str(a)) == ("✅ OK", False)
+    assert svc.validate(str(b)) == ("✅ OK", False)
+    assert counted == [str(a), str(b)]
+    a.write_text('{"x": ')
+    msg, is_error = svc.validate(str(a))
+    assert is_error and "Syntax error" in msg
+    assert len(counted) == 3
+
+
+def test_messages_name_the_validated_file(tmp_path):
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    a.write_text("def broken(:\n")
+    b.write_text("def broken(:\n")
+    svc = ValidationService()
+    assert "a.py" in svc.validate(str(a))[0]
+    msg = svc.validate(str(b))[0]
+    assert "b.py" in msg and "a.py" not in msg
+
+
+def test_result_not_cached_when_file_changes_during_validation(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text('{"x": 1}')
+    svc = ValidationService()
+
+    def validate_and_edit(p):
+        path.write_text('{"x": ')
+        return "✅ OK"
+
+    svc._validators[service.VALIDATORS[".json"]] = validate_and_edit
+    assert svc.validate(str(path)) == ("✅ OK", False)
+    assert svc._results == {}
+
+
+def test_validators_are_imported_lazily():
+    svc = ValidationService()
+    assert svc._validators == {}
+    svc.get_validator(".py")
+    assert list(svc._validators) == [service.VALIDATORS[".py"]]
+    assert svc.get_validator(".unknown") is None
+
+
+def test_tool_validates_many_paths(tmp_path, counted):
+    good, bad = tmp_path / "good.py", tmp_path / "bad.json"
+    good.write_text("x = 1\n")
+    bad.write_text("{")
+    other = tmp_path / "notes.txt"
+    other.write_text("text")
+    result = ValidateFileSyntaxTool().run(paths=[str(good), str(bad), str(other)])
+    lines = result.splitlines()
+    assert len(lines) == 3
+    assert lines[0].endswith("good.py: ✅ OK")
+    assert "bad.json: ⚠️ Warning: Syntax error" in lines[1]
+    assert "Unsupported file extension: .txt" in lines[2]
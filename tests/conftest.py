@@ -0,0 +1,9 @@
+import pytest
+
+from janito.tools import loop_protection_decorator
+
+
+@pytest.fixture
+def no_loop_protection(monkeypatch):
+    """Give each test a fresh loop-protection call tracker."""
+    monkeypatch.setattr(loop_protection_decorator, "_decorator_call_tracker", {})
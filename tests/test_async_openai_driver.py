@@ -0,0 +1,186 @@
+"""Tests for the asyncio OpenAI driver."""
+
+import asyncio
+from types import SimpleNamespace
+
+from janito.conversation_history import LLMConversationHistory
+from janito.driver_events import (
+    ContentDelta,
+    RequestFinished,
+    RequestStarted,
+    RequestStatus,
+    ResponseReceived,
+    StreamRestarted,
+)
+from janito.drivers.openai.async_driver import AsyncOpenAIModelDriver
+from janito.llm.async_agent import AsyncLLMAgent
+from janito.llm.driver_config import LLMDriverConfig
+from janito.llm.driver_input import DriverInput
+from janito.llm.message_parts import TextMessagePart
+
+
+class _FakeCompletions:
+    async def create(self, **kwargs):
+        await asyncio.sleep(0.01)
+        text = kwargs["messages"][-1]["content"].upper()
+        message = SimpleNamespace(role="assistant", content=text, tool_calls=None)
+        return SimpleNamespace(
+            created=1,
+            usage=None,
+            choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        )
+
+
+def _driver():
+    driver = AsyncOpenAIModelDriver()
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=_FakeCompletions()))
+    driver._instantiate_async_openai_client = lambda config: fake_client
+    return driver
+
+
+def _input(prompt, request_id):
+    history = LLMConversationHistory()
+    history.add_message("user", prompt)
+    return DriverInput(
+        config=LLMDriverConfig(model="gpt-test", api_key="k"),
+        conversation_history=history,
+        request_id=request_id,
+    )
+
+
+def test_concurrent_requests_emit_their_own_events():
+    driver = _driver()
+    events = {"a": [], "b": []}
+
+    async def run():
+        return await asyncio.gather(
+            driver.process_driver_input(_input("first", "a"), emit=events["a"].append),
+            driver.process_driver_input(_input("second", "b"), emit=events["b"].append),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert isinstance(first, ResponseReceived) and first.request_id == "a"
+    assert isinstance(first.parts[0], TextMessagePart)
+    assert first.parts[0].content == "FIRST"
+    assert second.parts[0].content == "SECOND"
+    for request_id, received in events.items():
+        assert {e.request_id for e in received} == {request_id}
+        assert [type(e) for e in received] == [
+            RequestStarted,
+            RequestFinished,
+            ResponseReceived,
+        ]
+    assert driver.output_queue.empty()
+
+
+def test_cancelled_request_returns_request_finished():
+    driver = _driver()
+    driver_input = _input("hello", "c")
+    driver_input.cancel_event = SimpleNamespace(is_set=lambda: True)
+
+    result = asyncio.run(driver.process_driver_input(driver_input, emit=lambda e: None))
+
+    assert isinstance(result, RequestFinished)
+    assert result.status == RequestStatus.CANCELLED
+
+
+def test_async_agent_chat_returns_the_final_response():
+    provider = SimpleNamespace(
+        name="openai",
+        driver_config=LLMDriverConfig(model="gpt-test", api_key="k"),
+    )
+    agent = AsyncLLMAgent(provider, None, driver=_driver())
+
+    result = asyncio.run(agent.chat(prompt="hi"))
+
+    assert isinstance(result, ResponseReceived)
+    assert result.parts[0].content == "HI"
+
+
+class _ToolCallingCompletions:
+    async def create(self, **kwargs):
+        last = kwargs["messages"][-1]
+        if last["role"] == "tool":
+            message = SimpleNamespace(role="assistant", content=last["content"])
+        else:
+            call = SimpleNamespace(
+                id="call-1",
+                function=SimpleNamespace(name="shout", arguments='{"text": "hi"}'),
+            )
+            message = SimpleNamespace(role="assistant", content=None, tool_calls=[call])
+        return SimpleNamespace(
+            created=1,
+            usage=None,
+            choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        )
+
+
+class _ShoutAdapter:
+    def get_tool(self, name):
+        return None
+
+    def execute_function_call_message_part(self, part):
+        return part.function.arguments.upper()
+
+
+def test_async_agent_runs_tool_calls_and_continues():
+    driver = AsyncOpenAIModelDriver()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=_ToolCallingCompletions()))
+    driver._instantiate_async_openai_client = lambda config: client
+    provider = SimpleNamespace(
+        name="openai",
+        driver_config=LLMDriverConfig(model="gpt-test", api_key="k"),
+    )
+    agent = AsyncLLMAgent(provider, _ShoutAdapter(), driver=driver)
+
+    result = asyncio.run(agent.chat(prompt="go"))
+
+    assert result.parts[0].content == '{"TEXT": "HI"}'
+    roles = [m["role"] for m in agent.conversation_history.get_history()]
+    assert roles == ["user", "tool_calls", "tool_results"]
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+def _stream_chunk(content, finish_reason=None):
+    delta = SimpleNamespace(content=content, tool_calls=None)
+    choice = SimpleNamespace(finish_reason=finish_reason, delta=delta)
+    return SimpleNamespace(
+        id="chatcmpl-1", model="gpt-test", created=1, usage=None, choices=[choice]
+    )
+
+
+def test_retried_stream_is_marked_restarted(monkeypatch):
+    async def failing_stream():
+        yield _stream_chunk("Par")
+        raise _RateLimited("Error code: 429")
+
+    async def full_stream():
+        yield _stream_chunk("Full", finish_reason="stop")
+
+    streams = [failing_stream(), full_stream()]
+
+    async def create(**kwargs):
+        return streams.pop(0)
+
+    driver = AsyncOpenAIModelDriver()
+    completions = SimpleNamespace(create=create)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    driver._instantiate_async_openai_client = lambda config: client
+    monkeypatch.setattr(driver, "_extract_retry_delay_seconds", lambda e: 0)
+    driver_input = _input("hello", "r")
+    driver_input.config = LLMDriverConfig(model="gpt-test", api_key="k", stream=True)
+    events = []
+
+    asyncio.run(driver.process_driver_input(driver_input, emit=events.append))
+
+    streamed = [e for e in events if isinstance(e, (ContentDelta, StreamRestarted))]
+    assert [type(e).__name__ for e in streamed] == [
+        "ContentDelta",
+        "StreamRestarted",
+        "ContentDelta",
+    ]
+    assert streamed[1].attempt == 2 and streamed[2].content == "Full"
@@ -0,0 +1,112 @@
+"""Tests for the --batch prompt runner."""
+
+import io
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import janito.server
+from janito.cli.batch_mode.handler import (
+    BatchRunner,
+    RateLimitGate,
+    handle_batch,
+    parse_batch_line,
+)
+from janito.driver_events import RateLimitRetry
+from janito.event_bus.bus import EventBus
+
+
+class _FakeSession:
+    def __init__(self):
+        self.history = []
+        self.threads = set()
+
+    def reset(self):
+        self.history = []
+
+    def send(self, prompt):
+        self.threads.add(threading.get_ident())
+        self.history.append(prompt)
+        if prompt == "boom":
+            raise RuntimeError("driver failed")
+        time.sleep(0.01)
+        return {
+            "status": "success",
+            "text": f"{prompt}:{len(self.history)}",
+            "elapsed": 0.01,
+            "session_id": "s",
+        }
+
+    def cancel(self):
+        pass
+
+
+def test_parse_batch_line_accepts_objects_and_strings():
+    assert parse_batch_line(1, '{"id": "a", "prompt": "hi"}')["prompt"] == "hi"
+    assert parse_batch_line(2, '"plain"') == {"line": 2, "id": None, "prompt": "plain"}
+    assert "error" in parse_batch_line(3, "not json")
+    assert "error" in parse_batch_line(4, '{"id": "x"}')
+
+
+def test_batch_runner_isolates_conversations():
+    runner = BatchRunner(_FakeSession, concurrency=3, gate=RateLimitGate(EventBus()))
+    items = [parse_batch_line(n, json.dumps(f"p{n}")) for n in range(1, 9)]
+    items.append(parse_batch_line(9, '"boom"'))
+    items.append(parse_batch_line(10, "{"))
+    output = io.StringIO()
+
+    counts = runner.run(items, output)
+
+    records = {r["line"]: r for r in map(json.loads, output.getvalue().splitlines())}
+    assert counts == {"success": 8, "error": 2}
+    assert len(runner.sessions) <= 3
+    # Every prompt saw a fresh history
+    assert all(records[n]["text"] == f"p{n}:1" for n in range(1, 9))
+    assert "driver failed" in records[9]["error"]
+    assert "session_id" not in records[1]
+
+
+def _rate_limited(delay):
+    return RateLimitRetry(attempt=1, retry_delay=delay, error="429", details={})
+
+
+def test_rate_limit_gate_pauses_new_prompts():
+    bus = EventBus()
+    gate = RateLimitGate(bus)
+    with gate:
+        bus.publish(_rate_limited(0.2))
+        started = time.monotonic()
+        gate.wait()
+        assert time.monotonic() - started >= 0.15
+    bus.publish(_rate_limited(5))
+    started = time.monotonic()
+    gate.wait()
+    assert time.monotonic() - started < 0.1
+
+
+def test_handle_batch_passes_unrestricted_to_sessions(tmp_path, monkeypatch):
+    managers = []
+
+    class _FakeManager:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            managers.append(self)
+
+        def add_provider(self, *args):
+            pass
+
+        def create_session(self, system_prompt=None):
+            return _FakeSession()
+
+        def shutdown(self):
+            pass
+
+    monkeypatch.setattr(janito.server, "SessionManager", _FakeManager)
+    batch = tmp_path / "prompts.jsonl"
+    batch.write_text('"hi"\n')
+    args = SimpleNamespace(batch=str(batch), unrestricted=True, concurrency=1)
+    handle_batch(args, "openai", None, None, None)
+
+    assert managers[0].kwargs["unrestricted"] is True
+    assert json.loads((tmp_path / "prompts.out.jsonl").read_text())["text"] == "hi:1"
@@ -0,0 +1,87 @@
+"""Tests for the process-wide provider client pool."""
+
+import asyncio
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+from janito.drivers.openai import driver as openai_driver
+from janito.llm.client_pool import ClientPool
+from janito.llm.driver_config import LLMDriverConfig
+
+
+class _FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_client_is_reused_per_endpoint_and_key():
+    pool = ClientPool()
+    created = []
+
+    def factory():
+        created.append(_FakeClient())
+        return created[-1]
+
+    a = pool.get_client("openai", factory, base_url="https://a", api_key="k1")
+    b = pool.get_client("openai", factory, base_url="https://a", api_key="k1")
+    c = pool.get_client("openai", factory, base_url="https://a", api_key="k2")
+    d = pool.get_client("azure_openai", factory, base_url="https://a", api_key="k1")
+
+    assert a is b
+    assert c is not a and d is not a
+    assert len(created) == 3
+    assert len(pool) == 3
+
+
+def test_shutdown_closes_and_forgets_clients():
+    pool = ClientPool()
+    client = pool.get_client("openai", _FakeClient, base_url="u", api_key="k")
+    pool.shutdown()
+    assert client.closed
+    assert len(pool) == 0
+    assert pool.get_client("openai", _FakeClient, base_url="u", api_key="k") is not client
+
+
+def test_api_key_is_not_stored_in_plain_text():
+    key = ClientPool.make_key("openai", "u", "secret-key")
+    assert "secret-key" not in repr(key)
+
+
+def test_async_clients_are_pooled_per_live_loop():
+    pool = ClientPool()
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    a = pool.get_loop_client("openai_async", _FakeClient, first_loop)
+    assert pool.get_loop_client("openai_async", _FakeClient, first_loop) is a
+    first_loop.close()
+    b = pool.get_loop_client("openai_async", _FakeClient, second_loop)
+    second_loop.close()
+
+    assert b is not a
+    assert a.closed and not b.closed
+    assert first_loop not in pool._loop_clients
+
+
+def test_driver_discards_client_after_connection_error(monkeypatch):
+    pool = ClientPool()
+    monkeypatch.setattr(openai_driver, "client_pool", pool)
+
+    def create(**kwargs):
+        raise openai.APIConnectionError(request=None)
+
+    client = _FakeClient()
+    client.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    pool.get_client("openai", lambda: client, base_url="https://u", api_key="k")
+    driver = openai_driver.OpenAIModelDriver()
+    monkeypatch.setattr(driver, "convert_history_to_api_messages", lambda h: [])
+    config = LLMDriverConfig(model="gpt-test", api_key="k", base_url="https://u")
+
+    with pytest.raises(openai.APIConnectionError):
+        driver._call_api(SimpleNamespace(config=config, conversation_history=None))
+
+    assert client.closed
+    assert len(pool) == 0
@@ -0,0 +1,88 @@
+"""Tests for running independent tool calls of one assistant turn concurrently."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from janito.tools.concurrent_executor import ConcurrentToolExecutor
+from janito.tools.tool_base import ToolPermissions
+
+
+class _FakeAdapter:
+    def __init__(self):
+        self.tools = {
+            "read": SimpleNamespace(permissions=ToolPermissions(read=True)),
+            "write": SimpleNamespace(permissions=ToolPermissions(write=True)),
+            "ask": SimpleNamespace(
+                permissions=ToolPermissions(read=True), interactive=True
+            ),
+        }
+        self.log = []
+        self._lock = threading.Lock()
+
+    def get_tool(self, name):
+        return self.tools.get(name)
+
+    def execute_function_call_message_part(self, part):
+        name, arg = part.function.name, part.function.arguments
+        with self._lock:
+            self.log.append(("start", name, arg))
+        if name == "boom":
+            raise RuntimeError("tool failed")
+        time.sleep(0.1 if name == "read" else 0.01)
+        with self._lock:
+            self.log.append(("end", name, arg))
+        return f"{name}:{arg}"
+
+
+def _call(name, arg):
+    return SimpleNamespace(function=SimpleNamespace(name=name, arguments=arg))
+
+
+def test_read_only_calls_run_in_parallel_and_keep_order():
+    adapter = _FakeAdapter()
+    calls = [_call("read", i) for i in range(4)]
+    started = time.monotonic()
+    results = ConcurrentToolExecutor(adapter, max_workers=4).execute(calls)
+    assert time.monotonic() - started < 0.35
+    assert results == ["read:0", "read:1", "read:2", "read:3"]
+
+
+def test_write_calls_are_barriers():
+    adapter = _FakeAdapter()
+    calls = [_call("read", 0), _call("read", 1), _call("write", 2), _call("read", 3)]
+    results = ConcurrentToolExecutor(adapter, max_workers=4).execute(calls)
+    assert results == ["read:0", "read:1", "write:2", "read:3"]
+    write_start = adapter.log.index(("start", "write", 2))
+    assert ("end", "read", 0) in adapter.log[:write_start]
+    assert ("end", "read", 1) in adapter.log[:write_start]
+    assert adapter.log.index(("start", "read", 3)) > adapter.log.index(
+        ("end", "write", 2)
+    )
+
+
+def test_interactive_calls_are_barriers():
+    adapter = _FakeAdapter()
+    calls = [_call("read", 0), _call("ask", 1), _call("read", 2)]
+    executor = ConcurrentToolExecutor(adapter, max_workers=4)
+    assert not executor.is_read_only(calls[1])
+    assert executor.execute(calls) == ["read:0", "ask:1", "read:2"]
+    ask_start = adapter.log.index(("start", "ask", 1))
+    assert ("end", "read", 0) in adapter.log[:ask_start]
+    assert adapter.log.index(("start", "read", 2)) > adapter.log.index(
+        ("end", "ask", 1)
+    )
+
+
+def test_ask_user_is_interactive():
+    from janito.tools.adapters.local.ask_user import AskUserTool
+
+    assert AskUserTool.interactive and AskUserTool.permissions.read
+
+
+def test_errors_are_returned_as_results():
+    adapter = _FakeAdapter()
+    results = ConcurrentToolExecutor(adapter, max_workers=2).execute(
+        [_call("boom", 0), _call("read", 1)]
+    )
+    assert results == ["tool failed", "read:1"]
@@ -0,0 +1,65 @@
+"""Tests for the incremental API message cache of LLMConversationHistory."""
+
+from janito.conversation_history import LLMConversationHistory
+from janito.drivers.openai.driver import OpenAIModelDriver
+
+
+def _counting_converter(calls):
+    def convert(message):
+        calls.append(message["content"])
+        return [{"role": message["role"], "content": message["content"]}]
+
+    return convert
+
+
+def test_only_new_messages_are_converted():
+    history = LLMConversationHistory()
+    calls = []
+    convert = _counting_converter(calls)
+    history.add_message("user", "a")
+    history.add_message("assistant", "b")
+    assert len(history.get_api_messages("fmt", convert)) == 2
+
+    history.add_message("user", "c")
+    messages = history.get_api_messages("fmt", convert)
+
+    assert [m["content"] for m in messages] == ["a", "b", "c"]
+    assert calls == ["a", "b", "c"]
+    messages.append({"role": "user", "content": "not cached"})
+    assert len(history.get_api_messages("fmt", convert)) == 3
+
+
+def test_non_append_changes_rebuild_the_cache():
+    history = LLMConversationHistory()
+    calls = []
+    convert = _counting_converter(calls)
+    history.add_message("user", "a")
+    history.get_api_messages("fmt", convert)
+
+    history.insert_message(0, "system", "sys")
+    assert [m["content"] for m in history.get_api_messages("fmt", convert)] == [
+        "sys",
+        "a",
+    ]
+    history.replace_messages([{"role": "user", "content": "z"}])
+    assert [m["content"] for m in history.get_api_messages("fmt", convert)] == ["z"]
+    assert calls == ["a", "sys", "a", "z"]
+
+
+def test_openai_conversion_of_structured_tool_messages():
+    history = LLMConversationHistory()
+    history.add_message("user", "read it", metadata={"source": "cli"})
+    tool_call = {"id": "c1", "type": "function", "function": {"name": "view_file"}}
+    history.add_message("tool_calls", [tool_call])
+    history.add_message(
+        "tool_results", [{"name": "view_file", "content": "data", "tool_call_id": "c1"}]
+    )
+
+    messages = OpenAIModelDriver().convert_history_to_api_messages(history)
+
+    assert messages == [
+        {"role": "user", "content": "read it"},
+        {"role": "assistant", "content": "", "tool_calls": [tool_call]},
+        {"role": "tool", "content": "data", "name": "view_file", "tool_call_id": "c1"},
+    ]
+    assert history.get_history()[0]["metadata"] == {"source": "cli"}
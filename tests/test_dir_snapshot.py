@@ -0,0 +1,54 @@
+"""Tests for the shared directory snapshot."""
+
+import os
+
+from janito.dir_snapshot import DirectorySnapshot
+
+
+def _age(root, seconds=60):
+    # Move directory mtimes out of the racy window so snapshots trust them
+    for dirpath, _, _ in os.walk(root):
+        st = os.stat(dirpath)
+        os.utime(dirpath, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+def _tree(tmp_path):
+    for rel in ["a.txt", "src/b.py", "src/pkg/c.py", "docs/d.md"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    os.symlink(tmp_path / "src", tmp_path / "link")
+    _age(tmp_path)
+    return tmp_path
+
+
+def test_walk_matches_os_walk(tmp_path):
+    root = str(_tree(tmp_path))
+    snapshot = DirectorySnapshot()
+    assert list(snapshot.walk(root)) == list(os.walk(root))
+    assert list(snapshot.walk(root)) == list(os.walk(root))
+
+    pruned = []
+    for dirpath, dirs, _ in snapshot.walk(root):
+        pruned.append(dirpath)
+        dirs[:] = [d for d in dirs if d != "src"]
+    assert sorted(pruned) == sorted([root, os.path.join(root, "docs")])
+
+
+def test_only_changed_directories_are_listed_again(tmp_path, monkeypatch):
+    root = _tree(tmp_path)
+    snapshot = DirectorySnapshot()
+    list(snapshot.walk(str(root)))
+    scanned = []
+    scan = snapshot._scan
+    monkeypatch.setattr(
+        snapshot, "_scan", lambda path: scanned.append(path) or scan(path)
+    )
+
+    list(snapshot.walk(str(root)))
+    assert scanned == []
+
+    (root / "src" / "pkg" / "new.py").write_text("y")
+    dirs, files = snapshot.list_dir(str(root / "src" / "pkg"))
+    assert (dirs, sorted(files)) == ([], ["c.py", "new.py"])
+    assert scanned == [str(root / "src" / "pkg")]
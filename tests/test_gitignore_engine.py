@@ -0,0 +1,68 @@
+"""Tests for the hierarchical, cached gitignore engine."""
+
+import os
+
+import pytest
+
+from janito.dir_walk_utils import walk_dir_with_gitignore
+from janito.gitignore_utils import GitignoreEngine, GitignoreFilter
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("*.tmp\n")
+    (tmp_path / ".gitignore").write_text("*.log\nbuild/\n")
+    (tmp_path / "pkg" / "data").mkdir(parents=True)
+    (tmp_path / "pkg" / ".gitignore").write_text("!keep.log\n/data/\n")
+    (tmp_path / "build").mkdir()
+    for rel in [
+        "a.py",
+        "a.log",
+        "a.tmp",
+        "build/out.py",
+        "pkg/b.py",
+        "pkg/keep.log",
+        "pkg/other.log",
+        "pkg/data/c.py",
+    ]:
+        (tmp_path / rel).write_text("x\n")
+    return tmp_path
+
+
+def _walked(root):
+    found = set()
+    for dirpath, _, files in walk_dir_with_gitignore(str(root)):
+        for name in files:
+            rel = os.path.relpath(os.path.join(dirpath, name), root)
+            found.add(rel.replace(os.sep, "/"))
+    return found
+
+
+def test_nested_ignore_files_and_exclude(repo):
+    assert _walked(repo) == {
+        ".gitignore",
+        "a.py",
+        "pkg/.gitignore",
+        "pkg/b.py",
+        "pkg/keep.log",
+    }
+
+    gitignore = GitignoreFilter(str(repo / "pkg"))
+    assert gitignore.base_dir == str(repo)
+    assert gitignore.is_ignored(str(repo / "pkg" / "data" / "c.py"))
+    assert gitignore.is_ignored(str(repo / "build"))
+    assert not gitignore.is_ignored(str(repo / "pkg" / "keep.log"))
+    assert gitignore.is_ignored(str(repo / "pkg" / "other.log"))
+
+
+def test_changed_ignore_files_are_reloaded(repo):
+    engine = GitignoreEngine()
+    assert engine.matcher(str(repo)).is_ignored(str(repo / "a.log"))
+    spec = engine.load(str(repo / ".gitignore"))
+    assert engine.load(str(repo / ".gitignore")) is spec
+
+    (repo / ".gitignore").write_text("*.py\n")
+    matcher = engine.matcher(str(repo))
+    assert not matcher.is_ignored(str(repo / "a.log"))
+    assert matcher.is_ignored(str(repo / "a.py"))
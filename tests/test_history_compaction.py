@@ -0,0 +1,90 @@
+"""Tests for context-window-aware history compaction."""
+
+import json
+
+from janito.conversation_history import LLMConversationHistory
+from janito.llm import history_compaction
+from janito.llm.history_compaction import (
+    HistoryCompactor,
+    estimate_history_tokens,
+    get_input_token_limit,
+)
+from janito.llm.model import LLMModelInfo
+
+
+def _history(turns, result_chars):
+    history = LLMConversationHistory()
+    history.add_message("system", "You are janito.")
+    for n in range(turns):
+        history.add_message("user", f"question {n}")
+        history.add_message(
+            "tool_calls", json.dumps([{"id": f"c{n}", "type": "function"}])
+        )
+        result = {"name": "view_file", "content": "x" * result_chars}
+        history.add_message("tool_results", json.dumps([result]))
+        history.add_message("assistant", f"answer {n}")
+    return history
+
+
+def test_input_token_limit_from_model_info():
+    assert get_input_token_limit(LLMModelInfo(name="a", max_input=1000)) == 1000
+    assert (
+        get_input_token_limit(LLMModelInfo(name="b", context=8000, max_response=2000))
+        == 6000
+    )
+    assert get_input_token_limit(LLMModelInfo(name="c")) is None
+
+
+def test_old_tool_results_are_trimmed_first():
+    history = _history(turns=8, result_chars=4000)
+    compactor = HistoryCompactor(token_limit=9000, keep_recent_tool_results=2)
+
+    assert compactor.compact(history) > 0
+
+    messages = history.get_history()
+    results = [
+        json.loads(m["content"]) for m in messages if m["role"] == "tool_results"
+    ]
+    assert len(results) == 8  # no turn had to be dropped
+    assert "removed to fit the context window" in results[0][0]["content"]
+    assert results[-1][0]["content"] == "x" * 4000
+    assert estimate_history_tokens(messages) <= 9000 * 0.5
+
+
+def test_old_turns_are_dropped_into_a_note():
+    history = _history(turns=10, result_chars=100)
+    history.add_message("user", "latest question")
+    compactor = HistoryCompactor(token_limit=300)
+
+    compactor.compact(history)
+
+    messages = history.get_history()
+    assert messages[0]["role"] == "system"
+    assert messages[1]["metadata"] == {"compaction_note": True}
+    assert "- question 0" in messages[1]["content"]
+    assert messages[-1]["content"] == "latest question"
+    assert sum(m["role"] == "tool_calls" for m in messages) == sum(
+        m["role"] == "tool_results" for m in messages
+    )
+    assert len(messages) < 10 * 4
+
+
+def test_small_history_is_untouched():
+    history = _history(turns=2, result_chars=10)
+    before = history.get_history()
+    assert HistoryCompactor(token_limit=100000).compact(history) == 0
+    assert history.get_history() == before
+
+
+def test_note_keeps_only_the_latest_prompts(monkeypatch):
+    monkeypatch.setattr(history_compaction, "MAX_NOTE_PROMPTS", 3)
+    history = _history(turns=6, result_chars=100)
+    compactor = HistoryCompactor(token_limit=300)
+    compactor.compact(history)
+    for n in range(6, 12):
+        history.add_message("user", f"question {n}")
+        history.add_message("assistant", "x" * 400)
+        compactor.compact(history)
+
+    note = history.get_history()[1]["content"].split("\n")[1:]
+    assert note == ["- question 7", "- question 8", "- question 9"]
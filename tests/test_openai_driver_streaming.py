@@ -0,0 +1,119 @@
+"""Tests for the streaming mode of the OpenAI driver."""
+
+from types import SimpleNamespace
+
+from janito.driver_events import ContentDelta, StreamRestarted, ToolCallDelta
+from janito.drivers.openai.driver import OpenAIModelDriver
+from janito.llm.driver_config import LLMDriverConfig
+from janito.llm.message_parts import TextMessagePart, FunctionCallMessagePart
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None, usage=None):
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason is not None:
+        choices = [
+            SimpleNamespace(
+                finish_reason=finish_reason,
+                delta=SimpleNamespace(content=content, tool_calls=tool_calls),
+            )
+        ]
+    return SimpleNamespace(
+        id="chatcmpl-1", model="gpt-test", created=1, usage=usage, choices=choices
+    )
+
+
+def _tool_delta(index, arguments, tool_call_id=None, name=None):
+    return SimpleNamespace(
+        index=index,
+        id=tool_call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def _drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def test_consume_stream_emits_deltas_and_rebuilds_tool_calls():
+    driver = OpenAIModelDriver()
+    chunks = [
+        _chunk(content="Hel"),
+        _chunk(content="lo"),
+        _chunk(tool_calls=[_tool_delta(0, '{"path": ', "call_1", "view_file")]),
+        _chunk(tool_calls=[_tool_delta(1, '{"query"', "call_2", "search_text")]),
+        _chunk(tool_calls=[_tool_delta(0, '"a.py"}')]),
+        _chunk(tool_calls=[_tool_delta(1, ': "x"}')], finish_reason="tool_calls"),
+        _chunk(usage=SimpleNamespace(total_tokens=7)),
+    ]
+
+    result = driver._consume_stream(iter(chunks), LLMDriverConfig(), "req-1")
+
+    events = _drain(driver.output_queue)
+    assert [e.content for e in events if isinstance(e, ContentDelta)] == ["Hel", "lo"]
+    assert len([e for e in events if isinstance(e, ToolCallDelta)]) == 4
+    assert result.usage.total_tokens == 7
+
+    parts = driver._convert_completion_message_to_parts(
+        driver._get_message_from_result(result)
+    )
+    assert isinstance(parts[0], TextMessagePart) and parts[0].content == "Hello"
+    calls = [p for p in parts if isinstance(p, FunctionCallMessagePart)]
+    assert [c.tool_call_id for c in calls] == ["call_1", "call_2"]
+    assert calls[0].function.name == "view_file"
+    assert calls[0].function.arguments == '{"path": "a.py"}'
+    assert calls[1].function.arguments == '{"query": "x"}'
+
+
+def test_stream_flag_only_applies_when_requested():
+    driver = OpenAIModelDriver()
+    kwargs = driver._prepare_api_kwargs(LLMDriverConfig(model="gpt-test"), [])
+    assert kwargs["stream"] is False
+    assert "stream_options" not in kwargs
+
+    kwargs = driver._prepare_api_kwargs(
+        LLMDriverConfig(model="gpt-test", stream=True), []
+    )
+    assert kwargs["stream"] is True
+    assert kwargs["stream_options"] == {"include_usage": True}
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+def test_retried_stream_is_marked_restarted(monkeypatch):
+    driver = OpenAIModelDriver()
+
+    def failing_stream():
+        yield _chunk(content="Par")
+        raise _RateLimited("Error code: 429")
+
+    streams = [failing_stream(), iter([_chunk(content="Full", finish_reason="stop")])]
+    client = SimpleNamespace(
+        chat=SimpleNamespace(
+            completions=SimpleNamespace(create=lambda **kwargs: streams.pop(0))
+        )
+    )
+    monkeypatch.setattr(driver, "_instantiate_openai_client", lambda config: client)
+    monkeypatch.setattr(driver, "_extract_retry_delay_seconds", lambda e: 0)
+    monkeypatch.setattr(driver, "convert_history_to_api_messages", lambda h: [])
+    config = LLMDriverConfig(model="gpt-test", stream=True)
+    driver_input = SimpleNamespace(config=config, conversation_history=None)
+
+    result = driver._call_api(driver_input)
+
+    assert result.choices[0].message.content == "Full"
+    events = [
+        e
+        for e in _drain(driver.output_queue)
+        if isinstance(e, (ContentDelta, StreamRestarted))
+    ]
+    assert [type(e).__name__ for e in events] == [
+        "ContentDelta",
+        "StreamRestarted",
+        "ContentDelta",
+    ]
+    assert events[1].attempt == 2 and events[2].content == "Full"
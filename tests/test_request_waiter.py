@@ -0,0 +1,33 @@
+"""Tests for the event-driven wait used by LLMAgent."""
+
+import threading
+import time
+from queue import Queue
+
+from janito.driver_events import RequestFinished, RequestStatus
+from janito.llm.request_waiter import CancelEvent, RequestWaiter
+
+
+def test_cancel_wakes_up_waiter_immediately():
+    queue = Queue()
+    cancel_event = CancelEvent(queue)
+    waiter = RequestWaiter(queue, request_id="r1", cancel_event=cancel_event)
+    threading.Timer(0.05, cancel_event.set).start()
+    started = time.monotonic()
+    event = waiter.next_event()
+    assert time.monotonic() - started < 0.5
+    assert event.status == RequestStatus.CANCELLED
+    assert event.request_id == "r1"
+
+
+def test_events_from_other_requests_are_skipped():
+    queue = Queue()
+    queue.put(RequestFinished(request_id="old", status=RequestStatus.SUCCESS))
+    queue.put(RequestFinished(request_id="r2", status=RequestStatus.SUCCESS))
+    waiter = RequestWaiter(queue, request_id="r2")
+    assert waiter.next_event().request_id == "r2"
+
+
+def test_timeout_returns_none():
+    waiter = RequestWaiter(Queue(), request_id="r3", max_wait_time=0.05)
+    assert waiter.next_event() is None
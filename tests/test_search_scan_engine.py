@@ -0,0 +1,79 @@
+"""Tests for the parallel search_text scan engine."""
+
+import re
+
+import pytest
+
+from janito.tools.adapters.local.search_text.match_lines import read_file_lines
+from janito.tools.adapters.local.search_text import scan_engine
+from janito.tools.adapters.local.search_text.scan_engine import scan_files
+from janito.tools.adapters.local.search_text.traverse_directory import (
+    iter_search_files,
+)
+
+
+def _sequential(paths, query, regex, use_regex, case_sensitive, count_only, limit):
+    """The pre-engine algorithm: one file after another through read_file_lines."""
+    output, per_file_counts = [], []
+    for path in paths:
+        done = len(output) if not count_only else sum(c for _, c in per_file_counts)
+        count, reached, lines = read_file_lines(
+            path, query, regex, use_regex, case_sensitive, count_only, limit, done
+        )
+        output.extend(lines)
+        if count:
+            per_file_counts.append((path, count))
+        if reached:
+            return output, True, per_file_counts
+    return output, False, per_file_counts
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for n in range(40):
+        lines = [f"line {i} of file {n}" for i in range(n % 7)]
+        if n % 3 == 0:
+            lines.append("Needle here")
+        if n % 5 == 0:
+            lines.append("needle again, NEEDLE")
+        (tmp_path / f"f{n:02d}.txt").write_text("\n".join(lines) + "\n")
+    (tmp_path / "crlf.txt").write_bytes(b"a Needle\r\nb\rneedle c\r\n")
+    mixed = b"\r\n\rneedle needle\n\r\r\nx\rNEEDLE  \r\n\n  needle"
+    (tmp_path / "mixed.txt").write_bytes(mixed)
+    (tmp_path / "latin1.txt").write_bytes(b"needle first\ncaf\xe9 needle\n")
+    unicode_text = "ÅNGSTRÖM needle\nstraße\n"
+    (tmp_path / "unicode.txt").write_text(unicode_text, encoding="utf-8")
+    (tmp_path / "blob.bin").write_bytes(b"needle\0" * 50)
+    return tmp_path
+
+
+@pytest.mark.parametrize("limit", [0, 1, 7, 25])
+@pytest.mark.parametrize("count_only", [False, True])
+@pytest.mark.parametrize(
+    "query,use_regex,case_sensitive",
+    [
+        ("needle", False, False),
+        ("Needle", False, True),
+        ("ström", False, False),
+        (r"needle\s+\w+", True, False),
+        (r"^line \d$", True, True),
+    ],
+)
+def test_matches_sequential_scan(
+    tree, query, use_regex, case_sensitive, count_only, limit
+):
+    paths = list(iter_search_files(str(tree), 0))
+    flags = 0 if case_sensitive else re.IGNORECASE
+    regex = re.compile(query, flags) if use_regex else None
+    args = (query, regex, use_regex, case_sensitive, count_only, limit)
+
+    assert scan_files(paths, *args) == _sequential(paths, *args)
+
+
+@pytest.mark.parametrize("case_sensitive", [False, True])
+def test_mmap_buffers_match_sequential_scan(tree, monkeypatch, case_sensitive):
+    monkeypatch.setattr(scan_engine, "MMAP_THRESHOLD", 1)
+    paths = list(iter_search_files(str(tree), 0))
+    args = ("needle", None, False, case_sensitive, False, 0)
+
+    assert scan_files(paths, *args) == _sequential(paths, *args)
@@ -0,0 +1,74 @@
+"""Tests for the optional trigram index of search_text."""
+
+import os
+import re
+
+import pytest
+
+from janito.tools.adapters.local.search_text import trigram_index
+from janito.tools.adapters.local.search_text.core import SearchTextTool
+from janito.tools.adapters.local.search_text.trigram_index import (
+    TrigramIndex,
+    required_trigrams,
+)
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "alpha.py").write_text("def alpha():\n    return 'Needle'\n")
+    (tmp_path / "src" / "beta.py").write_text("def beta():\r\n    return 1\r\n")
+    (tmp_path / "notes.txt").write_text("haystack only\nneedle in lowercase\n")
+    (tmp_path / "blob.bin").write_bytes(b"\0needle\0" * 10)
+    return tmp_path
+
+
+def _built_index(root):
+    index = TrigramIndex(str(root))
+    index.ensure_updated()
+    index.wait(10)
+    return index
+
+
+def test_index_skips_only_files_that_cannot_match(tree):
+    index = _built_index(tree)
+    assert os.path.exists(index.db_path)
+    required = required_trigrams("Needle", None, False, True)
+    assert index.may_match(str(tree / "src" / "alpha.py"), required)
+    assert not index.may_match(str(tree / "src" / "beta.py"), required)
+    assert not index.may_match(str(tree / "blob.bin"), set())
+
+    (tree / "src" / "beta.py").write_text("Needle added later\n")
+    assert index.may_match(str(tree / "src" / "beta.py"), required)
+
+    # A fresh instance (e.g. a new process) reuses the stored entries
+    reloaded = _built_index(tree)
+    assert not reloaded.may_match(str(tree / "blob.bin"), set())
+    assert reloaded.may_match(str(tree / "src" / "beta.py"), required)
+
+
+def test_regex_queries_use_top_level_literals():
+    regex = re.compile(r"def \w+\(\):")
+    assert required_trigrams(regex.pattern, regex, True, True)
+    folded = re.compile("(?i)needle")
+    assert required_trigrams(folded.pattern, folded, True, False) == set()
+    assert required_trigrams("ab", None, False, True) == set()
+
+
+def test_indexed_search_output_is_unchanged(tree, monkeypatch):
+    tool = SearchTextTool()
+    queries = [
+        dict(query="needle"),
+        dict(query="Needle", case_sensitive=True),
+        dict(query=r"return \d", use_regex=True, case_sensitive=True),
+        dict(query="return", count_only=True),
+    ]
+    plain = [tool.run(paths=".", **q) for q in queries]
+
+    monkeypatch.setattr(trigram_index, "index_enabled", lambda: True)
+    monkeypatch.setattr(trigram_index, "_indexes", {})
+    trigram_index.get_trigram_index().wait(10)
+    indexed = [tool.run(paths="./", **q) for q in queries]
+
+    assert indexed == [p.replace("'.'", "'./'") for p in plain]
@@ -0,0 +1,75 @@
+"""Tests for searching several queries in one search_text pass."""
+
+import pytest
+
+from janito.tools.adapters.local.search_text.core import SearchTextTool
+
+
+# Every query is compared with its own run over the same paths
+pytestmark = pytest.mark.usefixtures("no_loop_protection")
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    for n in range(12):
+        lines = [f"value = {n}"]
+        if n % 2 == 0:
+            lines.append("def alpha(): pass")
+        if n % 3 == 0:
+            lines.append("BETA = alpha()")
+        (tmp_path / "src" / f"m{n:02d}.py").write_text("\n".join(lines) + "\n")
+    (tmp_path / "notes.txt").write_text("alpha and beta\n")
+    return tmp_path
+
+
+def _section(output, query):
+    """The lines reported under *query* in a grouped multi-query output."""
+    lines, current = [], None
+    for line in output.splitlines():
+        if line.startswith("--- Results for "):
+            current = line == f"--- Results for '{query}' ---"
+        elif line.startswith(("🔍", "Grand total")):
+            current = None
+        elif current and line:
+            lines.append(line)
+    return lines
+
+
+@pytest.mark.parametrize("max_results", [0, 3])
+@pytest.mark.parametrize("count_only", [False, True])
+def test_queries_match_separate_searches(tree, count_only, max_results):
+    tool = SearchTextTool()
+    queries = ["alpha", "beta", "missing"]
+    combined = tool.run(
+        paths="src notes.txt",
+        queries=queries,
+        count_only=count_only,
+        max_results=max_results,
+    )
+    for query in queries:
+        single = tool.run(
+            paths="src notes.txt",
+            query=query,
+            count_only=count_only,
+            max_results=max_results,
+        )
+        expected = [
+            line
+            for line in single.splitlines()
+            if line and not line.startswith(("🔍", "Grand total"))
+        ]
+        assert _section(combined, query) == expected
+        if count_only:
+            assert f"Grand total matches for '{query}'" in combined
+
+
+def test_single_query_in_list_keeps_plain_output(tree):
+    tool = SearchTextTool()
+    assert tool.run(paths="src", queries=["alpha"]) == tool.run(
+        paths="src", query="alpha"
+    )
+    assert tool.run(paths="src", query="alpha", queries=["alpha"]) == tool.run(
+        paths="src", query="alpha"
+    )
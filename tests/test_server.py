@@ -0,0 +1,168 @@
+"""Tests for the headless multi-session server (janito serve)."""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from janito.server.http_api import create_server
+from janito.server.sessions import (
+    Session,
+    SessionBusyError,
+    SessionToolsAdapter,
+    WorkdirLease,
+    intersect_permissions,
+)
+from janito.tools.adapters.local.create_file import CreateFileTool
+from janito.tools.adapters.local.view_file import ViewFileTool
+from janito.tools.tool_base import ToolPermissions
+
+
+class _FakeSession:
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.busy = False
+        self.prompts = []
+
+    def info(self):
+        return {"session_id": self.session_id}
+
+    def send(self, prompt, wait=True):
+        if self.busy:
+            raise SessionBusyError(self.session_id)
+        self.prompts.append(prompt)
+        return {"status": "success", "text": prompt[::-1], "session_id": self.session_id}
+
+
+class _FakeManager:
+    def __init__(self):
+        self.sessions = {}
+
+    def create_session(self, **kwargs):
+        session = _FakeSession(f"{len(self.sessions) + 1:04x}")
+        self.sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id):
+        return self.sessions.get(session_id)
+
+    def list_sessions(self):
+        return list(self.sessions.values())
+
+    def close_session(self, session_id):
+        return self.sessions.pop(session_id, None) is not None
+
+
+@pytest.fixture
+def server():
+    server = create_server(_FakeManager(), host="127.0.0.1", port=0, token="s3cret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def api(server):
+    def request(method, path, body=None, headers=None):
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        payload = json.dumps(body) if body is not None else None
+        headers = {"Authorization": "Bearer s3cret", **(headers or {})}
+        conn.request(method, path, body=payload, headers=headers)
+        response = conn.getresponse()
+        data = json.loads(response.read())
+        conn.close()
+        return response.status, data
+
+    return request
+
+
+def test_session_lifecycle_over_http(api):
+    status, created = api("POST", "/sessions", {"workdir": "."})
+    assert status == 201
+    session_id = created["session_id"]
+
+    status, reply = api("POST", f"/sessions/{session_id}/messages", {"prompt": "abc"})
+    assert status == 200 and reply["text"] == "cba"
+
+    assert api("POST", f"/sessions/{session_id}/messages", {})[0] == 400
+    assert api("GET", "/health")[1] == {"status": "ok", "sessions": 1}
+    assert api("DELETE", f"/sessions/{session_id}")[0] == 200
+    assert api("GET", f"/sessions/{session_id}")[0] == 404
+    assert api("DELETE", "/sessions")[0] == 405
+    assert api("GET", "/nowhere")[0] == 404
+
+
+def test_requests_need_token_and_local_host(api, server):
+    assert api("GET", "/health", headers={"Authorization": ""})[0] == 401
+    assert api("GET", "/health", headers={"Authorization": "Bearer nope"})[0] == 401
+    port = server.server_address[1]
+    assert api("GET", "/health", headers={"Host": f"localhost:{port}"})[0] == 200
+    assert api("GET", "/health", headers={"Host": f"evil.test:{port}"})[0] == 403
+    origin = {"Origin": "https://evil.test"}
+    assert api("POST", "/sessions", {}, headers=origin)[0] == 403
+    origin = {"Origin": f"http://127.0.0.1:{port}"}
+    assert api("POST", "/sessions", {}, headers=origin)[0] == 201
+
+
+def test_busy_session_is_rejected(api, server):
+    session_id = api("POST", "/sessions", {})[1]["session_id"]
+    server.session_manager.get(session_id).busy = True
+    status, reply = api("POST", f"/sessions/{session_id}/messages", {"prompt": "x"})
+    assert status == 409 and "busy" in reply["error"]
+
+
+def test_session_send_claims_the_session_atomically():
+    started, release = threading.Event(), threading.Event()
+
+    class _BlockingAgent:
+        def chat(self, prompt):
+            started.set()
+            release.wait(5)
+
+    session = Session("0001", _BlockingAgent(), "p", "m", ".", None)
+    thread = threading.Thread(target=session.send, args=("first",))
+    thread.start()
+    assert started.wait(5)
+    with pytest.raises(SessionBusyError):
+        session.send("second", wait=False)
+    release.set()
+    thread.join(5)
+    assert not session.busy
+
+
+def test_session_adapter_uses_its_own_permissions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    adapter = SessionToolsAdapter(
+        tools=[ViewFileTool, CreateFileTool],
+        workdir=str(tmp_path),
+        allowed_permissions=intersect_permissions(
+            ToolPermissions(read=True, write=True), ToolPermissions(read=True)
+        ),
+    )
+    assert adapter.list_tools() == ["view_file"]
+
+
+def test_workdir_lease_switches_only_when_free(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    lease = WorkdirLease()
+    entered = threading.Event()
+
+    with lease.hold(str(first)):
+        with lease.hold(str(first)):
+            pass  # same directory: shared
+
+        def other():
+            with lease.hold(str(second)):
+                entered.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        assert not entered.wait(0.1)
+    thread.join(1)
+    assert entered.is_set()
@@ -0,0 +1,51 @@
+"""Tests for the cached tool schema payloads used by the OpenAI-compatible drivers."""
+
+import pytest
+
+from janito.providers.openai import schema_generator
+from janito.tools.adapters.local.adapter import LocalToolsAdapter
+from janito.tools.adapters.local.view_file import ViewFileTool
+from janito.tools.adapters.local.create_file import CreateFileTool
+from janito.tools.permissions import (
+    get_global_allowed_permissions,
+    set_global_allowed_permissions,
+)
+from janito.tools.tool_base import ToolPermissions
+
+
+@pytest.fixture
+def adapter(tmp_path, monkeypatch):
+    # LocalToolsAdapter chdirs into its workdir; monkeypatch restores the cwd
+    monkeypatch.chdir(tmp_path)
+    previous = get_global_allowed_permissions()
+    set_global_allowed_permissions(ToolPermissions(read=True, write=True))
+    yield LocalToolsAdapter(tools=[ViewFileTool, CreateFileTool], workdir=str(tmp_path))
+    set_global_allowed_permissions(previous)
+
+
+def _names(payload):
+    return sorted(schema["function"]["name"] for schema in payload)
+
+
+def test_payload_is_reused_across_calls(adapter):
+    first = schema_generator.get_tool_schemas(adapter)
+    second = schema_generator.get_tool_schemas(adapter)
+    assert first is second
+    assert _names(first) == ["create_file", "view_file"]
+
+
+def test_payload_follows_permissions(adapter):
+    assert _names(schema_generator.get_tool_schemas(adapter)) == [
+        "create_file",
+        "view_file",
+    ]
+    set_global_allowed_permissions(ToolPermissions(read=True))
+    assert _names(schema_generator.get_tool_schemas(adapter)) == ["view_file"]
+
+
+def test_payload_invalidated_on_unregister(adapter):
+    before = schema_generator.get_tool_schemas(adapter)
+    adapter.unregister_tool("create_file")
+    after = schema_generator.get_tool_schemas(adapter)
+    assert after is not before
+    assert _names(after) == ["view_file"]
@@ -0,0 +1,59 @@
+"""Tests for ranged view_file reads through the line-offset index."""
+
+import pytest
+
+from janito.tools.adapters.local import line_index, view_file
+from janito.tools.adapters.local.line_index import LineIndex, read_line_range
+from janito.tools.adapters.local.view_file import ViewFileTool
+
+
+@pytest.fixture
+def big_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(line_index, "CHUNK_SIZE", 64)
+    newlines = [b"\n", b"\r\n", b"\r"]
+    data = b"".join(
+        b"line %d caf\xc3\xa9 \xff%s" % (i, newlines[i % 7 % 3]) for i in range(1000)
+    )
+    path = tmp_path / "big.log"
+    path.write_bytes(data + b"last without newline")
+    return path
+
+
+def _text_lines(path):
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.readlines()
+
+
+@pytest.mark.parametrize("stride", [1, 5, 256])
+def test_ranges_match_text_mode_reads(big_file, stride):
+    lines = _text_lines(big_file)
+    with open(big_file, "rb") as f:
+        index = LineIndex.build(f, stride)
+    assert index.total_lines == len(lines) == 1001
+    for start, stop in [(0, 3), (4, 9), (255, 513), (998, None), (990, 2000), (5, 5)]:
+        assert index.read_lines(str(big_file), start, stop) == lines[start:stop]
+    assert index.read_lines(str(big_file), 1500) == []
+
+
+def test_view_file_uses_index_for_ranges(big_file, monkeypatch):
+    monkeypatch.chdir(big_file.parent)
+    tool = ViewFileTool()
+    plain = tool.run(str(big_file), from_line=100, to_line=120)
+    monkeypatch.setattr(view_file, "INDEX_THRESHOLD", 0)
+    monkeypatch.setattr(
+        ViewFileTool, "_read_file_lines", lambda self, path: pytest.fail("full read")
+    )
+    assert tool.run(str(big_file), from_line=100, to_line=120) == plain
+    assert read_line_range(str(big_file), 1000)[1] == 1001
+
+
+@pytest.mark.parametrize("offset", [62, 63])
+def test_cr_cr_lf_straddling_a_chunk_boundary(tmp_path, monkeypatch, offset):
+    monkeypatch.setattr(line_index, "CHUNK_SIZE", 64)
+    path = tmp_path / "mixed.txt"
+    path.write_bytes(b"x" * offset + b"\r\r\n" + b"after\n" * 3)
+    lines = _text_lines(path)
+    with open(path, "rb") as f:
+        index = LineIndex.build(f, 1)
+    assert index.total_lines == len(lines) == 5
+    assert index.read_lines(str(path), 2) == lines[2:]